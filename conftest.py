@@ -1,21 +1,206 @@
+import logging
+import os
 import pytest
+from src.api.contract import default_contract
+from src.api.http2 import close_shared_http2_clients
+from src.api.id_allocator import IdAllocator
+from src.api.instrumentation import RequestCollector
 from src.api.petstore_api import PetStoreAPI
-import random
-import time
+from src.api.petstore_stub import PetStoreH2Stub, PetStoreStub
+from src.api.rate_limiter import RateLimiter
+from src.api.resources import ResourceTracker
+from src.api.retry import CircuitBreaker, RetryPolicy
+from src.api.session import close_shared_sessions
+from src.api.transport import CassetteWriter, RecordingTransport, ReplayTransport
+
+
+request_collector_key = pytest.StashKey[RequestCollector]()
+
+# PETSTORE_CASSETTE=path включает кассету, PETSTORE_CASSETTE_MODE=record|replay (по умолчанию replay)
+CASSETTE = os.environ.get("PETSTORE_CASSETTE")
+CASSETTE_MODE = os.environ.get("PETSTORE_CASSETTE_MODE", "replay")
+REPLAYING = bool(CASSETTE) and CASSETTE_MODE == "replay"
+# PETSTORE_HTTP2=1 - клиенты из фикстур работают через HTTP2Transport (нужен httpx[http2])
+HTTP2 = os.environ.get("PETSTORE_HTTP2") == "1"
+
+
+def pytest_addoption(parser):
+    parser.addoption("--petstore-timings", action="store_true",
+                     help="собирать время запросов PetStoreAPI и вывести сводку по эндпоинтам")
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "live: тест зависит от живого сервера, при воспроизведении кассеты пропускается")
+    if config.getoption("--petstore-timings"):
+        config.stash[request_collector_key] = RequestCollector()
+
+
+def pytest_collection_modifyitems(config, items):
+    if not REPLAYING:
+        return
+    skip_live = pytest.mark.skip(reason="requires a live server, replaying cassette")
+    for item in items:
+        if "live" in item.keywords:
+            item.add_marker(skip_live)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    collector = config.stash.get(request_collector_key, None)
+    if collector is not None and collector.endpoints:
+        terminalreporter.write_sep("=", "PetStore API timings")
+        terminalreporter.write_line(collector.report())
+
+
+@pytest.fixture(scope="session")
+def petstore_base_url():
+    """
+    Адрес API для всей сессии.
+    По умолчанию поднимается локальная заглушка PetStore на свободном порту,
+    PETSTORE_BASE_URL=https://petstore.swagger.io/v2 запускает тесты против реального сервиса.
+    """
+    if REPLAYING:
+        yield "http://cassette.invalid/v2"
+        return
+    base_url = os.environ.get("PETSTORE_BASE_URL")
+    if base_url:
+        yield base_url
+        return
+    # PETSTORE_HTTP2=1 поднимает HTTP/2 вариант заглушки
+    with (PetStoreH2Stub() if HTTP2 else PetStoreStub()) as stub:
+        yield stub.base_url
+
+
+@pytest.fixture(scope="session")
+def rate_limiter():
+    """
+    Общий на сессию лимитер запросов.
+    PETSTORE_RPS/PETSTORE_BURST задают скорость, без них тесты ждут только когда сервер отвечает 429.
+    """
+    rate = os.environ.get("PETSTORE_RPS")
+    return RateLimiter(rate=float(rate) if rate else None,
+                       burst=int(os.environ.get("PETSTORE_BURST", "5")))
+
+
+@pytest.fixture(scope="session")
+def retry_policy():
+    """
+    Политика повторов идемпотентных запросов при сетевых ошибках и 5xx.
+    PETSTORE_RETRIES - число попыток (1 отключает повторы), PETSTORE_DEADLINE - общий лимит в секундах.
+    """
+    return RetryPolicy(max_attempts=int(os.environ.get("PETSTORE_RETRIES", "3")),
+                       deadline=float(os.environ.get("PETSTORE_DEADLINE", "15")))
+
+
+@pytest.fixture(scope="session")
+def circuit_breaker():
+    """
+    Общий предохранитель для реального сервиса: если backend лежит,
+    тесты падают сразу с CircuitOpenError, а не ждут таймаутов. С заглушкой не нужен.
+    """
+    if REPLAYING or not os.environ.get("PETSTORE_BASE_URL"):
+        return None
+    return CircuitBreaker(failure_threshold=int(os.environ.get("PETSTORE_BREAKER_THRESHOLD", "5")))
+
+
+@pytest.fixture(scope="session")
+def request_collector(pytestconfig):
+    """Сборщик метрик запросов, если включен --petstore-timings, иначе None"""
+    return pytestconfig.stash.get(request_collector_key, None)
+
+
+@pytest.fixture(scope="session")
+def cassette():
+    """Кассета сессии: CassetteWriter при записи, ReplayTransport при воспроизведении, иначе None"""
+    if not CASSETTE:
+        yield None
+    elif CASSETTE_MODE == "record":
+        writer = CassetteWriter(CASSETTE)
+        yield writer
+        writer.close()
+    elif CASSETTE_MODE == "replay":
+        transport = ReplayTransport(CASSETTE)
+        yield transport
+        transport.close()
+    else:
+        raise pytest.UsageError(f"PETSTORE_CASSETTE_MODE must be record or replay, got {CASSETTE_MODE!r}")
+
+
+@pytest.fixture(scope="session")
+def resource_tracker():
+    """Учет питомцев, заказов и пользователей, созданных клиентами из make_api_client"""
+    return ResourceTracker()
+
+
+@pytest.fixture(scope="session")
+def make_api_client(petstore_base_url, rate_limiter, retry_policy, circuit_breaker,
+                    request_collector, cassette, resource_tracker):
+    """
+    Фабрика клиентов с общими настройками сессии (лимитер, повторы, кассета, сборщик метрик).
+    Клиенты используют общий пул соединений, поэтому тесты не открывают соединение заново.
+    В конце сессии созданные на внешнем сервере сущности удаляются параллельно
+    (PETSTORE_CLEANUP_CONCURRENCY запросов одновременно); заглушка исчезает вместе с сессией.
+    """
+    def factory(**kwargs):
+        # PETSTORE_LOG=compact|debug включает логирование запросов
+        kwargs.setdefault("log_mode", os.environ.get("PETSTORE_LOG", "off"))
+        kwargs.setdefault("rate_limiter", rate_limiter)
+        kwargs.setdefault("retry_policy", retry_policy)
+        kwargs.setdefault("circuit_breaker", circuit_breaker)
+        kwargs.setdefault("share_session", True)
+        kwargs.setdefault("resource_tracker", resource_tracker)
+        kwargs.setdefault("http2", HTTP2)
+        # PETSTORE_VALIDATE=1 проверяет ответы по swagger-спецификации, =all - еще и тела запросов
+        validate = os.environ.get("PETSTORE_VALIDATE")
+        if validate in ("1", "all"):
+            kwargs.setdefault("contract", default_contract(validate_requests=validate == "all"))
+        client = PetStoreAPI(petstore_base_url, **kwargs)
+        if isinstance(cassette, CassetteWriter):
+            client.transport = RecordingTransport(client.transport, cassette)
+        elif cassette is not None:
+            client.transport = cassette
+        if request_collector is not None:
+            request_collector.install(client)
+        return client
+    yield factory
+    if os.environ.get("PETSTORE_BASE_URL") and not REPLAYING:
+        failures = resource_tracker.cleanup(factory(), int(os.environ.get("PETSTORE_CLEANUP_CONCURRENCY", "8")))
+        if failures:
+            logging.getLogger("petstore_api").warning("cleanup left %d entities: %s", len(failures), failures[:10])
+    close_shared_sessions()
+    close_shared_http2_clients()
+
+
+@pytest.fixture(scope="session")
+def session_api_client(make_api_client, cassette):
+    """
+    Один клиент на сессию (на воркер при pytest-xdist) с заранее открытыми соединениями.
+    PETSTORE_WARM_CONNECTIONS - сколько соединений открыть при старте.
+    """
+    client = make_api_client()
+    if cassette is None:
+        client.warm_up(int(os.environ.get("PETSTORE_WARM_CONNECTIONS", "2")))
+    return client
 
 
 @pytest.fixture
-def api_client():
-    """Фикстура возвращает клиент для работы с API"""
-    return PetStoreAPI()
+def api_client(session_api_client):
+    """Фикстура возвращает клиент для работы с API; заголовки и хуки сбрасываются после каждого теста"""
+    snapshot = session_api_client.snapshot()
+    yield session_api_client
+    session_api_client.restore(snapshot)
+
+
+@pytest.fixture(scope="session")
+def id_allocator():
+    """Генератор id, не пересекающихся между воркерами pytest-xdist"""
+    # С кассетой id должны совпадать между запусками, иначе ключи запросов не найдутся
+    return IdAllocator(run_slot=0) if CASSETTE else IdAllocator()
 
 
 @pytest.fixture
-def random_pet_data():
+def random_pet_data(id_allocator):
     """Фикстура генерирует случайные данные для питомца"""
-    # Используем микросекунды для большей уникальности
-    timestamp = int(time.time() * 1000000) % 10000000
-    pet_id = 10000000 + timestamp
+    pet_id = id_allocator.next_id()
     return {
         "id": pet_id,
         "category": {"id": 1, "name": "dogs"},
@@ -27,12 +212,11 @@ def random_pet_data():
 
 
 @pytest.fixture
-def random_order_data():
+def random_order_data(id_allocator):
     """Фикстура генерирует случайные данные для заказа"""
-    timestamp = int(time.time() * 1000000) % 10000000
     return {
-        "id": 20000000 + timestamp,
-        "petId": 30000000 + timestamp,
+        "id": id_allocator.next_id(),
+        "petId": id_allocator.next_id(),
         "quantity": 1,
         "shipDate": "2023-12-01T10:00:00.000Z",
         "status": "placed",
@@ -41,10 +225,9 @@ def random_order_data():
 
 
 @pytest.fixture
-def random_user_data():
+def random_user_data(id_allocator):
     """Фикстура генерирует случайные данные для пользователя"""
-    timestamp = int(time.time() * 1000000) % 10000000
-    user_id = 40000000 + timestamp
+    user_id = id_allocator.next_id()
     return {
         "id": user_id,
         "username": f"testuser{user_id}",
@@ -56,9 +239,3 @@ def random_user_data():
         "userStatus": 1
     }
 
-
-@pytest.fixture(autouse=True)
-def slow_down_tests():
-    """Замедляет тесты чтобы избежать rate limiting"""
-    yield
-    time.sleep(1)  # Увеличим паузу до 1 секунды
\ No newline at end of file
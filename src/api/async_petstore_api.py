@@ -0,0 +1,132 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+import requests
+
+from src.api.petstore_api import PetStoreAPI
+from src.api.session import mount_pool
+
+
+class AsyncPetStoreAPI:
+    """
+    Асинхронный клиент для работы с PetStore API.
+    Повторяет методы PetStoreAPI в виде корутин.
+
+    Блокирующие вызовы requests выполняются в собственном пуле потоков,
+    а соединения переиспользуются через пул urllib3 (HTTP/1.1 keep-alive),
+    размер которого ограничен limit_per_host.
+    """
+
+    def __init__(self, base_url: str = "https://petstore.swagger.io/v2",
+                 limit_per_host: int = 100, client: Optional[PetStoreAPI] = None):
+        if limit_per_host < 1:
+            raise ValueError("limit_per_host must be >= 1")
+        self.limit_per_host = limit_per_host
+        # pool_block=True: лишние запросы ждут свободное соединение,
+        # а не открывают новые сокеты сверх лимита
+        if client is None:
+            client = PetStoreAPI(base_url, pool_connections=1, pool_maxsize=limit_per_host, pool_block=True)
+        else:
+            mount_pool(client.session, pool_connections=1, pool_maxsize=limit_per_host, pool_block=True)
+        self.client = client
+        self.base_url = self.client.base_url
+        self._executor = ThreadPoolExecutor(max_workers=limit_per_host,
+                                            thread_name_prefix="petstore-async")
+
+    async def __aenter__(self) -> "AsyncPetStoreAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Закрывает пул потоков и HTTP-сессию"""
+        self._executor.shutdown(wait=True)
+        self.client.close()
+
+    async def _call(self, func: Callable[..., requests.Response], *args, **kwargs) -> requests.Response:
+        """Выполняет блокирующий метод синхронного клиента в пуле потоков"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def gather(self, aws: Iterable[Awaitable], limit: Optional[int] = None,
+                     return_exceptions: bool = False) -> List[Any]:
+        """
+        Аналог asyncio.gather с ограничением числа одновременно выполняемых корутин.
+        По умолчанию лимит равен limit_per_host.
+        """
+        semaphore = asyncio.Semaphore(limit or self.limit_per_host)
+
+        async def bounded(aw: Awaitable) -> Any:
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(*(bounded(aw) for aw in aws), return_exceptions=return_exceptions)
+
+    # === PET ENDPOINTS ===
+
+    async def create_pet(self, pet_data: Dict[str, Any]) -> requests.Response:
+        """POST /pet - Добавление нового питомца"""
+        return await self._call(self.client.create_pet, pet_data)
+
+    async def get_pet_by_id(self, pet_id: int) -> requests.Response:
+        """GET /pet/{petId} - Получение питомца по ID"""
+        return await self._call(self.client.get_pet_by_id, pet_id)
+
+    async def update_pet(self, pet_data: Dict[str, Any]) -> requests.Response:
+        """PUT /pet - Обновление существующего питомца"""
+        return await self._call(self.client.update_pet, pet_data)
+
+    async def delete_pet(self, pet_id: int, api_key: str = "special-key") -> requests.Response:
+        """DELETE /pet/{petId} - Удаление питомца"""
+        return await self._call(self.client.delete_pet, pet_id, api_key=api_key)
+
+    async def find_pets_by_status(self, status: str) -> requests.Response:
+        """GET /pet/findByStatus - Поиск питомцев по статусу"""
+        return await self._call(self.client.find_pets_by_status, status)
+
+    # === STORE ENDPOINTS ===
+
+    async def get_inventory(self) -> requests.Response:
+        """GET /store/inventory - Получение инвентаря"""
+        return await self._call(self.client.get_inventory)
+
+    async def create_order(self, order_data: Dict[str, Any]) -> requests.Response:
+        """POST /store/order - Размещение заказа"""
+        return await self._call(self.client.create_order, order_data)
+
+    async def get_order_by_id(self, order_id: int) -> requests.Response:
+        """GET /store/order/{orderId} - Получение заказа по ID"""
+        return await self._call(self.client.get_order_by_id, order_id)
+
+    async def delete_order(self, order_id: int) -> requests.Response:
+        """DELETE /store/order/{orderId} - Удаление заказа"""
+        return await self._call(self.client.delete_order, order_id)
+
+    # === USER ENDPOINTS ===
+
+    async def create_user(self, user_data: Dict[str, Any]) -> requests.Response:
+        """POST /user - Создание пользователя"""
+        return await self._call(self.client.create_user, user_data)
+
+    async def get_user_by_username(self, username: str) -> requests.Response:
+        """GET /user/{username} - Получение пользователя по имени"""
+        return await self._call(self.client.get_user_by_username, username)
+
+    async def update_user(self, username: str, user_data: Dict[str, Any]) -> requests.Response:
+        """PUT /user/{username} - Обновление пользователя"""
+        return await self._call(self.client.update_user, username, user_data)
+
+    async def delete_user(self, username: str) -> requests.Response:
+        """DELETE /user/{username} - Удаление пользователя"""
+        return await self._call(self.client.delete_user, username)
+
+    async def create_users_with_list(self, users_list: list) -> requests.Response:
+        """POST /user/createWithList - Создание пользователей из списка"""
+        return await self._call(self.client.create_users_with_list, users_list)
+
+    async def create_users_with_array(self, users_list: list) -> requests.Response:
+        """POST /user/createWithArray - Создание пользователей из массива"""
+        return await self._call(self.client.create_users_with_array, users_list)
@@ -0,0 +1,95 @@
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set
+
+import requests
+
+
+class ChunkResult:
+    """
+    Итог отправки одного пакета.
+    users заполняется только для неудачных пакетов, чтобы их можно было отправить повторно.
+    """
+
+    __slots__ = ("index", "size", "status_code", "attempts", "error", "users")
+
+    def __init__(self, index: int, size: int):
+        self.index = index
+        self.size = size
+        self.status_code: Optional[int] = None
+        self.attempts = 0
+        self.error: Optional[BaseException] = None
+        self.users: Optional[List[Dict[str, Any]]] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status_code is not None and self.status_code < 400
+
+    def __repr__(self) -> str:
+        return (f"<ChunkResult #{self.index} size={self.size} status={self.status_code} "
+                f"attempts={self.attempts} ok={self.ok}>")
+
+
+def iter_chunks(items: Iterable[Dict[str, Any]], chunk_size: int,
+                max_chunk_bytes: Optional[int] = None) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Лениво режет поток объектов на пакеты не длиннее chunk_size элементов
+    и не больше max_chunk_bytes байт JSON (один объект больше лимита уходит отдельным пакетом).
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    chunk: List[Dict[str, Any]] = []
+    chunk_bytes = 2  # скобки массива
+    for item in items:
+        item_bytes = len(json.dumps(item).encode()) + 2 if max_chunk_bytes else 0  # плюс ", "
+        if chunk and (len(chunk) >= chunk_size or
+                      (max_chunk_bytes and chunk_bytes + item_bytes > max_chunk_bytes)):
+            yield chunk
+            chunk, chunk_bytes = [], 2
+        chunk.append(item)
+        chunk_bytes += item_bytes
+    if chunk:
+        yield chunk
+
+
+def dispatch_chunks(send: Callable[[List[Dict[str, Any]]], requests.Response],
+                    chunks: Iterable[List[Dict[str, Any]]], concurrency: int = 4,
+                    retries: int = 2, backoff: float = 0.1) -> List[ChunkResult]:
+    """
+    Отправляет пакеты параллельно. В работе одновременно не больше 2 * concurrency пакетов,
+    поэтому источник читается по мере отправки. Пакет повторяется до retries раз
+    при сетевой ошибке или ответе 5xx с экспоненциальной паузой.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+
+    def run(index: int, chunk: List[Dict[str, Any]]) -> ChunkResult:
+        result = ChunkResult(index, len(chunk))
+        for attempt in range(retries + 1):
+            if attempt:
+                time.sleep(backoff * 2 ** (attempt - 1))
+            result.attempts += 1
+            try:
+                response = send(chunk)
+            except requests.exceptions.RequestException as e:
+                result.error, result.status_code = e, None
+                continue
+            result.error, result.status_code = None, response.status_code
+            if response.status_code < 500:
+                break
+        if not result.ok:
+            result.users = chunk
+        return result
+
+    results: List[ChunkResult] = []
+    pending: Set[Future] = set()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bulk") as executor:
+        for index, chunk in enumerate(chunks):
+            if len(pending) >= 2 * concurrency:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                results.extend(future.result() for future in done)
+            pending.add(executor.submit(run, index, chunk))
+        results.extend(future.result() for future in pending)
+    results.sort(key=lambda result: result.index)
+    return results
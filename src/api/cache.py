@@ -0,0 +1,128 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Set, Tuple
+
+import requests
+
+
+class CacheEntry:
+    __slots__ = ("response", "etag", "expires")
+
+    def __init__(self, response: requests.Response, etag: Optional[str], expires: float):
+        self.response = response
+        self.etag = etag
+        self.expires = expires
+
+
+def invalidation_targets(method: str, endpoint: str, body: Any) -> Tuple[Set[str], Set[str]]:
+    """
+    Ключи кэша, которые устаревают после записи: (точные пути, префиксы путей).
+    Питомцы затрагивают /pet/{id}, все findByStatus и инвентарь, заказы -
+    /store/order/{id} и инвентарь, пользователи - /user/{username}.
+    """
+    path = endpoint.split("?", 1)[0]
+    keys: Set[str] = set()
+    prefixes: Set[str] = set()
+    if path == "/pet" or path.startswith("/pet/"):
+        if path != "/pet":
+            keys.add(path)
+        elif isinstance(body, dict) and body.get("id") is not None:
+            keys.add(f"/pet/{body['id']}")
+        prefixes.add("/pet/findByStatus")
+        keys.add("/store/inventory")
+    elif path == "/store/order" or path.startswith("/store/order/"):
+        if path != "/store/order":
+            keys.add(path)
+        elif isinstance(body, dict) and body.get("id") is not None:
+            keys.add(f"/store/order/{body['id']}")
+        keys.add("/store/inventory")
+    elif path == "/user" or path.startswith("/user/"):
+        users = body if isinstance(body, list) else [body]
+        keys.update(f"/user/{user['username']}" for user in users
+                    if isinstance(user, dict) and user.get("username") is not None)
+        if path not in ("/user", "/user/createWithList", "/user/createWithArray"):
+            keys.add(path)
+    return keys, prefixes
+
+
+class ResponseCache:
+    """
+    LRU-кэш ответов GET с временем жизни записи.
+
+    Ключ - путь запроса вместе с query (например /pet/findByStatus?status=sold).
+    Свежая запись отдается без обращения к серверу; у устаревшей записи с ETag
+    клиент делает условный запрос If-None-Match и при 304 продлевает ее.
+    Закэшированный Response общий для всех вызывающих: его json() нельзя менять.
+    """
+
+    def __init__(self, max_entries: int = 256, ttl: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.invalidations = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: str) -> Tuple[Optional[CacheEntry], bool]:
+        """Возвращает (запись, свежая ли она). Промах и устаревшая запись считаются как miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            if entry.expires > self._clock():
+                self.hits += 1
+                return entry, True
+            self.misses += 1
+            if entry.etag is None:
+                del self._entries[key]
+                return None, False
+            return entry, False
+
+    def store(self, key: str, response: requests.Response) -> None:
+        with self._lock:
+            self._entries[key] = CacheEntry(response, response.headers.get("ETag"),
+                                            self._clock() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def revalidated(self, key: str, entry: CacheEntry) -> None:
+        """Сервер ответил 304: продлеваем запись"""
+        with self._lock:
+            self.revalidations += 1
+            entry.expires = self._clock() + self.ttl
+            if key not in self._entries:
+                self._entries[key] = entry
+
+    def invalidate(self, keys: Set[str] = frozenset(), prefixes: Set[str] = frozenset()) -> int:
+        """Удаляет записи по точным ключам и префиксам, возвращает число удаленных"""
+        with self._lock:
+            doomed = [key for key in self._entries
+                      if key in keys or any(key.startswith(prefix) for prefix in prefixes)]
+            for key in doomed:
+                del self._entries[key]
+            self.invalidations += len(doomed)
+            return len(doomed)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "misses": self.misses, "revalidations": self.revalidations,
+                "invalidations": self.invalidations, "evictions": self.evictions,
+                "size": len(self._entries)}
@@ -0,0 +1,246 @@
+import functools
+import json
+import os
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import requests
+
+from src.api.models import SchemaError
+
+
+SPEC_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "petstore_swagger.json")
+
+# Валидатор получает значение и путь к нему. Путь - вложенные пары (родитель, ключ),
+# строка собирается только при ошибке, чтобы не форматировать ее для каждого поля
+Validator = Callable[[Any, Any], None]
+
+_INT_RANGES = {
+    "int32": (-2 ** 31, 2 ** 31 - 1),
+    "int64": (-2 ** 63, 2 ** 63 - 1),
+}
+
+
+class ContractError(SchemaError):
+    """Запрос или ответ не соответствует спецификации PetStore"""
+
+
+def _render(path: Any) -> str:
+    parts = []
+    while isinstance(path, tuple):
+        path, key = path
+        parts.append(f"[{key}]" if isinstance(key, int) else f".{key}")
+    return path + "".join(reversed(parts))
+
+
+def _fail(path: Any, message: str) -> None:
+    raise ContractError(_render(path), message)
+
+
+def _type_name(value: Any) -> str:
+    return "null" if value is None else type(value).__name__
+
+
+class _Compiler:
+    """Превращает JSON Schema из swagger в дерево замыканий; $ref компилируются один раз"""
+
+    def __init__(self, definitions: Dict[str, Any]):
+        self.definitions = definitions
+        self._refs: Dict[str, Validator] = {}
+
+    def compile(self, schema: Dict[str, Any]) -> Validator:
+        if "$ref" in schema:
+            return self._ref(schema["$ref"])
+        kind = schema.get("type") or ("object" if "properties" in schema else None)
+        if kind == "object":
+            return self._object(schema)
+        if kind == "array":
+            return self._array(schema)
+        if kind == "integer":
+            return self._integer(schema)
+        if kind == "number":
+            return self._number()
+        if kind == "string":
+            return self._string(schema)
+        if kind == "boolean":
+            return self._boolean()
+        return lambda value, path: None
+
+    def _ref(self, ref: str) -> Validator:
+        name = ref.rsplit("/", 1)[-1]
+        validator = self._refs.get(name)
+        if validator is None:
+            # Заглушка на время компиляции, если определение ссылается само на себя
+            resolved = []
+            self._refs[name] = lambda value, path: resolved[0](value, path)
+            resolved.append(self.compile(self.definitions[name]))
+            validator = self._refs[name] = resolved[0]
+        return validator
+
+    def _object(self, schema: Dict[str, Any]) -> Validator:
+        properties = {key: self.compile(sub) for key, sub in schema.get("properties", {}).items()}
+        required = tuple(schema.get("required", ()))
+        extra = schema.get("additionalProperties")
+        additional = self.compile(extra) if isinstance(extra, dict) else None
+
+        def check(value: Any, path: Any) -> None:
+            if type(value) is not dict:
+                _fail(path, f"expected object, got {_type_name(value)}")
+            for key in required:
+                if value.get(key) is None:
+                    _fail((path, key), "required field is missing")
+            for key, item in value.items():
+                if item is None:
+                    continue  # как и в моделях, null равнозначен отсутствию поля
+                validate = properties.get(key, additional)
+                if validate is not None:
+                    validate(item, (path, key))
+        return check
+
+    def _array(self, schema: Dict[str, Any]) -> Validator:
+        validate = self.compile(schema.get("items", {}))
+
+        def check(value: Any, path: Any) -> None:
+            if type(value) is not list:
+                _fail(path, f"expected array, got {_type_name(value)}")
+            for i, item in enumerate(value):
+                validate(item, (path, i))
+        return check
+
+    @staticmethod
+    def _integer(schema: Dict[str, Any]) -> Validator:
+        low, high = _INT_RANGES.get(schema.get("format"), (None, None))
+
+        def check(value: Any, path: Any) -> None:
+            if type(value) is not int:
+                _fail(path, f"expected integer, got {_type_name(value)}")
+            if low is not None and not low <= value <= high:
+                _fail(path, f"{value} is out of {schema['format']} range")
+        return check
+
+    @staticmethod
+    def _number() -> Validator:
+        def check(value: Any, path: Any) -> None:
+            if type(value) not in (int, float):
+                _fail(path, f"expected number, got {_type_name(value)}")
+        return check
+
+    @staticmethod
+    def _string(schema: Dict[str, Any]) -> Validator:
+        allowed = frozenset(schema["enum"]) if "enum" in schema else None
+
+        def check(value: Any, path: Any) -> None:
+            if type(value) is not str:
+                _fail(path, f"expected string, got {_type_name(value)}")
+            if allowed is not None and value not in allowed:
+                _fail(path, f"expected one of {sorted(allowed)}, got {value!r}")
+        return check
+
+    @staticmethod
+    def _boolean() -> Validator:
+        def check(value: Any, path: Any) -> None:
+            if type(value) is not bool:
+                _fail(path, f"expected boolean, got {_type_name(value)}")
+        return check
+
+
+class Operation:
+    """Скомпилированные проверки одной операции спецификации"""
+
+    __slots__ = ("method", "template", "operation_id", "request", "responses")
+
+    def __init__(self, method: str, template: str, operation_id: Optional[str],
+                 request: Optional[Validator], responses: Dict[str, Optional[Validator]]):
+        self.method = method
+        self.template = template
+        self.operation_id = operation_id
+        self.request = request
+        self.responses = responses
+
+    def __repr__(self) -> str:
+        return f"<Operation {self.method} {self.template} ({self.operation_id})>"
+
+
+class ContractValidator:
+    """
+    Проверка запросов и ответов по swagger-спецификации PetStore.
+
+    Все схемы компилируются в замыкания при создании, поэтому проверка ответа -
+    это только обход данных. Операция ищется по методу и шаблону пути клиента
+    (например GET /pet/{petId}). Без strict операции и статусы, которых нет
+    в спецификации, не проверяются; со strict они считаются нарушением.
+    validate_requests=False оставляет только проверку ответов (для тестов,
+    которые намеренно отправляют неполные тела).
+    """
+
+    def __init__(self, spec: Dict[str, Any], strict: bool = False, validate_requests: bool = True):
+        self.strict = strict
+        self.validate_requests = validate_requests
+        compiler = self._compiler = _Compiler(spec.get("definitions", {}))
+        self.operations: Dict[Tuple[str, str], Operation] = {}
+        for template, methods in spec.get("paths", {}).items():
+            for method, operation in methods.items():
+                body = next((p for p in operation.get("parameters", ()) if p.get("in") == "body"), None)
+                responses = {status: compiler.compile(response["schema"]) if "schema" in response else None
+                             for status, response in operation.get("responses", {}).items()}
+                self.operations[(method.upper(), template)] = Operation(
+                    method.upper(), template, operation.get("operationId"),
+                    compiler.compile(body["schema"]) if body else None, responses)
+
+    @classmethod
+    def from_file(cls, path: str = SPEC_PATH, strict: bool = False,
+                  validate_requests: bool = True) -> "ContractValidator":
+        return cls(load_spec(path), strict=strict, validate_requests=validate_requests)
+
+    def validate_definition(self, name: str, data: Any) -> None:
+        """Проверяет data по определению из definitions (Pet, Order, User, ApiResponse)"""
+        self._compiler._ref(name)(data, name)
+
+    def operation(self, method: str, template: str) -> Optional[Operation]:
+        operation = self.operations.get((method.upper(), template))
+        if operation is None and self.strict:
+            raise ContractError(f"{method.upper()} {template}", "operation is not in the spec")
+        return operation
+
+    def validate_request(self, method: str, template: str, body: Any) -> None:
+        if not self.validate_requests:
+            return
+        operation = self.operation(method, template)
+        if operation is not None and operation.request is not None and body is not None:
+            operation.request(body, f"{operation.method} {template} request")
+
+    def validate_response(self, method: str, template: str, response: requests.Response) -> None:
+        operation = self.operation(method, template)
+        if operation is None:
+            return
+        status = str(response.status_code)
+        if status in operation.responses:
+            validate = operation.responses[status]
+        elif "default" in operation.responses:
+            validate = operation.responses["default"]
+        elif self.strict:
+            raise ContractError(f"{operation.method} {template}", f"undocumented status {status}")
+        else:
+            return
+        if validate is None:
+            return
+        path = f"{operation.method} {template} {status} response"
+        if not response.content:
+            raise ContractError(path, "expected a JSON body, got an empty response")
+        try:
+            data = response.json()
+        except ValueError as e:
+            raise ContractError(path, f"invalid JSON: {e}") from None
+        validate(data, path)
+
+
+@functools.lru_cache(maxsize=None)
+def load_spec(path: str = SPEC_PATH) -> Dict[str, Any]:
+    """Swagger-документ из файла; разбирается один раз, результат нельзя изменять"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=None)
+def default_contract(strict: bool = False, validate_requests: bool = True) -> ContractValidator:
+    """Валидатор по встроенной спецификации (src/api/petstore_swagger.json), собирается один раз"""
+    return ContractValidator.from_file(SPEC_PATH, strict=strict, validate_requests=validate_requests)
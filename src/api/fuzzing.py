@@ -0,0 +1,390 @@
+import random
+import string
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+import requests
+
+from src.api.contract import SPEC_PATH, default_contract, load_spec
+from src.api.id_allocator import IdAllocator
+from src.api.models import Order, Pet, SchemaError, User
+
+
+MODELS = {"Pet": Pet, "Order": Order, "User": User}
+
+_ALPHABETS = (
+    string.ascii_letters,
+    string.ascii_letters + string.digits + " -_.",
+    "абвгдеёжзийклмнопрстуфхцчшщъыьэюя",
+    "🐶🐱🐭🐹🐰🦊",
+    string.punctuation,
+)
+_INT_BOUNDS = {"int32": (-2 ** 31, 2 ** 31 - 1), "int64": (-2 ** 63, 2 ** 63 - 1)}
+_WRONG_TYPE_VALUES = ("text", 12345, 1.5, True, [], {"nested": 1}, None)
+
+
+class PayloadGenerator:
+    """
+    Генератор тел Pet, Order и User по определениям swagger-спецификации
+    (той же, по которой проверяются ответы, src/api/petstore_swagger.json).
+
+    valid() строит корректный объект: обязательные поля всегда, необязательные
+    с вероятностью optional_rate; id и username берутся из IdAllocator, чтобы
+    параллельные прогоны не пересекались. near_valid() портит одно место
+    корректного объекта и возвращает название мутации.
+    """
+
+    def __init__(self, allocator: Optional[IdAllocator] = None, spec_path: str = SPEC_PATH,
+                 optional_rate: float = 0.7):
+        self.definitions = load_spec(spec_path)["definitions"]
+        self.allocator = allocator or IdAllocator()
+        self.optional_rate = optional_rate
+        self.mutations: Dict[str, Callable[[Dict[str, Any], Dict[str, Any], random.Random], bool]] = {
+            "drop_required": self._drop_required,
+            "wrong_type": self._wrong_type,
+            "bad_enum": self._bad_enum,
+            "int_overflow": self._int_overflow,
+            "huge_string": self._huge_string,
+            "odd_unicode": self._odd_unicode,
+            "null_field": self._null_field,
+            "unknown_field": self._unknown_field,
+        }
+
+    def _schema(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        if "$ref" in schema:
+            return self.definitions[schema["$ref"].rsplit("/", 1)[-1]]
+        return schema
+
+    def valid(self, name: str, rng: random.Random) -> Dict[str, Any]:
+        return self._value(self.definitions[name], rng, name)
+
+    def _value(self, schema: Dict[str, Any], rng: random.Random, key: str) -> Any:
+        schema = self._schema(schema)
+        kind = schema.get("type", "object")
+        if kind == "object":
+            # id и username нужны, чтобы прочитать объект обратно
+            required = set(schema.get("required", ())) | {"id", "username"}
+            return {prop: self._value(sub, rng, prop)
+                    for prop, sub in schema.get("properties", {}).items()
+                    if prop in required or rng.random() < self.optional_rate}
+        if kind == "array":
+            return [self._value(schema.get("items", {}), rng, key) for _ in range(rng.randint(0, 4))]
+        if kind == "integer":
+            return self._integer(schema, rng, key)
+        if kind == "boolean":
+            return rng.random() < 0.5
+        if kind == "number":
+            return rng.uniform(-1e6, 1e6)
+        return self._string(schema, rng, key)
+
+    def _integer(self, schema: Dict[str, Any], rng: random.Random, key: str) -> int:
+        if key == "id":
+            return self.allocator.next_id()
+        low, high = _INT_BOUNDS.get(schema.get("format"), _INT_BOUNDS["int32"])
+        return rng.choice((0, 1, rng.randint(0, 1000), rng.randint(max(low, 0), high)))
+
+    def _string(self, schema: Dict[str, Any], rng: random.Random, key: str) -> str:
+        if "enum" in schema:
+            return rng.choice(schema["enum"])
+        if key == "username":
+            return self.allocator.username("fuzz")
+        if schema.get("format") == "date-time":
+            return (f"{rng.randint(1970, 2100):04d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+                    f"T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}.000Z")
+        alphabet = rng.choice(_ALPHABETS)
+        return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+
+    def near_valid(self, name: str, rng: random.Random) -> Tuple[Dict[str, Any], str]:
+        """Корректный объект с одной порчей; мутации, неприменимые к объекту, пропускаются"""
+        payload = self.valid(name, rng)
+        schema = self.definitions[name]
+        names = list(self.mutations)
+        rng.shuffle(names)
+        for mutation in names:
+            if self.mutations[mutation](payload, schema, rng):
+                return payload, mutation
+        return payload, "none"
+
+    # Мутации меняют payload на месте и возвращают False, если неприменимы
+
+    @staticmethod
+    def _fields_of(payload: Dict[str, Any], schema: Dict[str, Any], *types: str) -> List[str]:
+        properties = schema.get("properties", {})
+        return [key for key in payload
+                if properties.get(key, {}).get("type") in types and payload[key] is not None]
+
+    def _drop_required(self, payload, schema, rng) -> bool:
+        required = [key for key in schema.get("required", ()) if key in payload]
+        if not required:
+            return False
+        del payload[rng.choice(required)]
+        return True
+
+    def _wrong_type(self, payload, schema, rng) -> bool:
+        if not payload:
+            return False
+        key = rng.choice(sorted(payload))
+        choices = [value for value in _WRONG_TYPE_VALUES
+                   if value is not None and type(value) is not type(payload[key])]
+        payload[key] = rng.choice(choices)
+        return True
+
+    def _bad_enum(self, payload, schema, rng) -> bool:
+        keys = [key for key, sub in schema.get("properties", {}).items() if "enum" in sub]
+        if not keys:
+            return False
+        payload[rng.choice(keys)] = "invalid-" + "".join(rng.choice(string.ascii_lowercase) for _ in range(6))
+        return True
+
+    def _int_overflow(self, payload, schema, rng) -> bool:
+        keys = self._fields_of(payload, schema, "integer")
+        if not keys:
+            return False
+        payload[rng.choice(keys)] = rng.choice((2 ** 63, -(2 ** 63) - 1, 2 ** 100))
+        return True
+
+    def _huge_string(self, payload, schema, rng) -> bool:
+        keys = [key for key in self._fields_of(payload, schema, "string") if key != "username"]
+        if not keys:
+            return False
+        payload[rng.choice(keys)] = "x" * rng.randint(10_000, 100_000)
+        return True
+
+    def _odd_unicode(self, payload, schema, rng) -> bool:
+        keys = [key for key in self._fields_of(payload, schema, "string") if key != "username"]
+        if not keys:
+            return False
+        payload[rng.choice(keys)] = rng.choice(("\u0000", "\u202eabc", "\U0001F436" * 50, "' OR 1=1 --"))
+        return True
+
+    def _null_field(self, payload, schema, rng) -> bool:
+        if not payload:
+            return False
+        payload[rng.choice(sorted(payload))] = None
+        return True
+
+    def _unknown_field(self, payload, schema, rng) -> bool:
+        payload["x-fuzz-" + "".join(rng.choice(string.ascii_lowercase) for _ in range(4))] = \
+            rng.choice(_WRONG_TYPE_VALUES)
+        return True
+
+
+class Example:
+    """Один сгенерированный случай"""
+
+    __slots__ = ("index", "model", "mutation", "payload")
+
+    def __init__(self, index: int, model: str, mutation: Optional[str], payload: Dict[str, Any]):
+        self.index = index
+        self.model = model
+        self.mutation = mutation  # None для корректного объекта
+        self.payload = payload
+
+    @property
+    def valid(self) -> bool:
+        return self.mutation is None
+
+    def __repr__(self) -> str:
+        return f"<Example #{self.index} {self.model} {self.mutation or 'valid'}>"
+
+
+class Failure:
+    """Нарушенное свойство: исходный случай, ошибка и минимальный воспроизводящий payload"""
+
+    __slots__ = ("example", "error", "shrunk")
+
+    def __init__(self, example: Example, error: str):
+        self.example = example
+        self.error = error
+        self.shrunk: Optional[Any] = None
+
+    def __repr__(self) -> str:
+        return f"<Failure {self.example!r}: {self.error}; minimal: {self.shrunk!r}>"
+
+
+class FuzzReport:
+    def __init__(self, model: str, total: int, failures: List[Failure], duration: float):
+        self.model = model
+        self.total = total
+        self.failures = failures
+        self.duration = duration
+
+    @property
+    def rate(self) -> float:
+        """Случаев в секунду"""
+        return self.total / self.duration if self.duration else 0.0
+
+    def summary(self) -> str:
+        lines = [f"{self.model}: {self.total} cases in {self.duration:.2f} s "
+                 f"({self.rate * 60:.0f}/min), {len(self.failures)} failures"]
+        lines.extend(f"  {failure!r}" for failure in self.failures)
+        return "\n".join(lines)
+
+
+# Свойство получает клиент и случай, возвращает описание нарушения или None
+Property = Callable[[Any, Example], Optional[str]]
+
+_CREATE = {
+    "Pet": lambda client, payload: client.create_pet(payload),
+    "Order": lambda client, payload: client.create_order(payload),
+    "User": lambda client, payload: client.create_user(payload),
+}
+# Чтение созданного объекта: (вызов, поле-идентификатор)
+_READ = {
+    "Pet": (lambda client, key: client.get_pet_by_id(key), "id"),
+    "Order": (lambda client, key: client.get_order_by_id(key), "id"),
+    "User": (lambda client, key: client.get_user_by_username(key), "username"),
+}
+
+
+def default_property(client, example: Example) -> Optional[str]:
+    """
+    Корректный объект: создание - 200, ответ соответствует схеме, объект читается обратно.
+    Испорченный объект: сервер отвечает, а не рвет соединение; 5xx допустим только
+    с телом ApiResponse (так реальный сервис отвечает на неверные типы полей).
+    """
+    try:
+        response = _CREATE[example.model](client, example.payload)
+    except requests.exceptions.RequestException as e:
+        return f"{type(e).__name__}: {e}"
+
+    if not example.valid:
+        if response.status_code >= 500:
+            try:
+                default_contract().validate_definition("ApiResponse", response.json())
+            except (ValueError, SchemaError):
+                return f"{response.status_code} without an ApiResponse body"
+        return None
+
+    if response.status_code != 200:
+        return f"create returned {response.status_code}"
+    try:
+        created = response.json()
+        if example.model == "User":
+            default_contract().validate_definition("ApiResponse", created)
+        else:
+            MODELS[example.model].from_dict(created)
+    except (ValueError, SchemaError) as e:
+        return f"create response does not match the schema: {e}"
+
+    read, field = _READ[example.model]
+    key = example.payload.get(field)
+    if key is None and example.model != "User":
+        key = created.get("id")  # id назначил сервер
+    if key is None:
+        return None
+    try:
+        status = read(client, key).status_code
+    except requests.exceptions.RequestException as e:
+        return f"read {type(e).__name__}: {e}"
+    return f"read back returned {status}" if status != 200 else None
+
+
+def _candidates(value: Any) -> Iterator[Any]:
+    """Упрощения значения, от самых грубых к мелким"""
+    if isinstance(value, dict):
+        for key in value:
+            yield {k: v for k, v in value.items() if k != key}
+        for key, item in value.items():
+            for smaller in _candidates(item):
+                yield dict(value, **{key: smaller})
+    elif isinstance(value, list):
+        if len(value) > 1:
+            yield value[:len(value) // 2]
+        for i in range(len(value)):
+            yield value[:i] + value[i + 1:]
+        for i, item in enumerate(value):
+            for smaller in _candidates(item):
+                yield value[:i] + [smaller] + value[i + 1:]
+    elif isinstance(value, str):
+        if value:
+            yield ""
+        if len(value) > 1:
+            yield value[:len(value) // 2]
+            yield value[:1]
+    elif isinstance(value, bool):
+        if value:
+            yield False
+    elif isinstance(value, int):
+        for smaller in (0, 1, value // 2):
+            if abs(smaller) < abs(value):
+                yield smaller
+    elif isinstance(value, float):
+        if value != 0.0:
+            yield 0.0
+
+
+def shrink(value: Any, fails: Callable[[Any], bool], max_calls: int = 500) -> Any:
+    """
+    Жадно упрощает value, пока fails(value) остается истинным: удаляет ключи и элементы,
+    укорачивает строки и уменьшает числа. Не больше max_calls вызовов fails.
+    """
+    calls = 0
+    improved = True
+    while improved and calls < max_calls:
+        improved = False
+        for candidate in _candidates(value):
+            calls += 1
+            if fails(candidate):
+                value, improved = candidate, True
+                break
+            if calls >= max_calls:
+                break
+    return value
+
+
+class Fuzzer:
+    """
+    Прогон сгенерированных тел через клиент пачками в concurrency потоков.
+    Генерация ленивая, одновременно в работе не больше 2 * concurrency случаев.
+    Первые max_shrink неудач сжимаются до минимального воспроизводящего payload.
+    """
+
+    def __init__(self, client, generator: Optional[PayloadGenerator] = None, seed: int = 0,
+                 concurrency: int = 16, prop: Property = default_property):
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self.client = client
+        self.generator = generator or PayloadGenerator()
+        self.seed = seed
+        self.concurrency = concurrency
+        self.prop = prop
+
+    def examples(self, model: str, count: int, invalid_ratio: float = 0.3) -> Iterator[Example]:
+        if model not in MODELS:
+            raise ValueError(f"Unknown model {model!r}, expected one of {sorted(MODELS)}")
+        for index in range(count):
+            rng = random.Random(f"{self.seed}:{model}:{index}")
+            if rng.random() < invalid_ratio:
+                payload, mutation = self.generator.near_valid(model, rng)
+                yield Example(index, model, mutation, payload)
+            else:
+                yield Example(index, model, None, self.generator.valid(model, rng))
+
+    def run(self, model: str, count: int, invalid_ratio: float = 0.3, max_shrink: int = 5) -> FuzzReport:
+        started = time.perf_counter()
+        failures: List[Failure] = []
+
+        def check(example: Example) -> Optional[Failure]:
+            error = self.prop(self.client, example)
+            return Failure(example, error) if error else None
+
+        def collect(done: Set[Future]) -> None:
+            failures.extend(f for f in (future.result() for future in done) if f is not None)
+
+        pending: Set[Future] = set()
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="fuzz") as executor:
+            for example in self.examples(model, count, invalid_ratio):
+                if len(pending) >= 2 * self.concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                pending.add(executor.submit(check, example))
+            collect(pending)
+        failures.sort(key=lambda failure: failure.example.index)
+
+        for failure in failures[:max_shrink]:
+            example = failure.example
+            failure.shrunk = shrink(example.payload, lambda payload: self.prop(
+                self.client, Example(example.index, model, example.mutation, payload)) is not None)
+        return FuzzReport(model, count, failures, time.perf_counter() - started)
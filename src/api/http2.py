@@ -0,0 +1,213 @@
+import asyncio
+import io
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Awaitable, Dict, Optional, TypeVar
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from src.api.transport import Transport
+
+try:
+    import httpx
+except ImportError:  # необязательная зависимость: pip install "httpx[http2]"
+    httpx = None
+
+
+# Заголовки соединения HTTP/1.1 в HTTP/2 запрещены (RFC 9113, 8.2.2)
+_HOP_BY_HOP = frozenset(("connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"))
+
+
+def _require_httpx() -> None:
+    if httpx is None:
+        raise ImportError('HTTP/2 transport requires httpx with HTTP/2 support: pip install "httpx[http2]"')
+
+
+def _timeout(value: Any) -> "httpx.Timeout":
+    """Таймаут requests (число или пара connect, read) в httpx.Timeout"""
+    if isinstance(value, tuple):
+        connect, read = value
+        return httpx.Timeout(connect=connect, read=read, write=read, pool=connect)
+    return httpx.Timeout(value)
+
+
+def _translate(error: Exception) -> requests.exceptions.RequestException:
+    """Ошибка httpx в исключение requests, которое понимают RetryPolicy и вызывающий код"""
+    if isinstance(error, httpx.ConnectTimeout):
+        return requests.exceptions.ConnectTimeout(str(error))
+    if isinstance(error, httpx.TimeoutException):
+        return requests.exceptions.ReadTimeout(str(error))
+    if isinstance(error, httpx.TransportError):
+        return requests.exceptions.ConnectionError(str(error))
+    return requests.exceptions.RequestException(str(error))
+
+
+T = TypeVar("T")
+
+
+class _EventLoop:
+    """
+    Цикл asyncio в фоновом потоке, в котором живут все HTTP/2 клиенты.
+    Синхронный HTTP/2 в httpcore не потокобезопасен (номер потока и его заголовки
+    могут уйти в соединение не по порядку), а в одном цикле запросы из разных
+    потоков мультиплексируются без гонок.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, name="http2-loop", daemon=True).start()
+
+    def run(self, coroutine: Awaitable[T]) -> T:
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+
+_loop: Optional[_EventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _event_loop() -> _EventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = _EventLoop()
+        return _loop
+
+
+def _run(coroutine: Awaitable[T]) -> T:
+    """Выполняет корутину httpx в общем цикле, ошибки httpx - как исключения requests"""
+    try:
+        return _event_loop().run(coroutine)
+    except httpx.HTTPError as e:
+        raise _translate(e) from e
+
+
+class _StreamReader(io.RawIOBase):
+    """response.raw для stream=True: requests.iter_content читает тело через read()"""
+
+    def __init__(self, response: "httpx.Response"):
+        self._response = response
+        self._chunks = response.aiter_bytes()
+        self._buffer = b""
+
+    def readable(self) -> bool:
+        return True
+
+    async def _next_chunk(self) -> bytes:
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+    def readinto(self, buffer) -> int:
+        while not self._buffer:
+            self._buffer = _run(self._next_chunk())
+            if not self._buffer:
+                return 0
+        size = min(len(buffer), len(self._buffer))
+        buffer[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self) -> None:
+        if not self.closed:
+            _run(self._response.aclose())
+        super().close()
+
+
+def build_http2_client(max_connections: int = 10, prior_knowledge: bool = False,
+                       verify: Any = True) -> "httpx.AsyncClient":
+    """
+    Клиент httpx с HTTP/2. Параллельные запросы к одному хосту идут потоками одного
+    соединения, новое открывается только сверх лимита потоков сервера.
+    prior_knowledge - HTTP/2 без согласования (h2c) для http:// адресов; без него
+    https-соединение согласует протокол через ALPN и может остаться на HTTP/1.1.
+    """
+    _require_httpx()
+    return httpx.AsyncClient(http2=True, http1=not prior_knowledge, verify=verify,
+                             limits=httpx.Limits(max_connections=max_connections,
+                                                 max_keepalive_connections=max_connections))
+
+
+_shared_clients: Dict[tuple, "httpx.AsyncClient"] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_http2_client(max_connections: int = 10, prior_knowledge: bool = False,
+                        verify: Any = True) -> "httpx.AsyncClient":
+    """Общий на процесс HTTP/2 клиент для набора настроек, по аналогии с shared_session"""
+    key = (max_connections, prior_knowledge, verify)
+    with _shared_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = _shared_clients[key] = build_http2_client(*key)
+        return client
+
+
+def close_shared_http2_clients() -> None:
+    """Закрывает все общие HTTP/2 клиенты"""
+    with _shared_lock:
+        for client in _shared_clients.values():
+            _run(client.aclose())
+        _shared_clients.clear()
+
+
+class HTTP2Transport(Transport):
+    """
+    Транспорт PetStoreAPI поверх HTTP/2 (httpx + h2): параллельные запросы
+    мультиплексируются в одном соединении, заголовки сжимаются HPACK.
+    Вызовы синхронные: запрос выполняется в общем фоновом цикле asyncio.
+
+    Запрос готовится обычным requests (заголовки сессии, params, json), поэтому
+    тела и URL совпадают с SessionTransport, а ответ возвращается как
+    requests.Response - хуки, кэш, кассеты и stream=True работают без изменений.
+    Ошибки httpx переводятся в исключения requests.
+    """
+
+    def __init__(self, session: requests.Session, client: Optional["httpx.AsyncClient"] = None,
+                 max_connections: int = 10, prior_knowledge: bool = False):
+        _require_httpx()
+        self.session = session
+        self._owns_client = client is None
+        self.client = client or build_http2_client(max_connections, prior_knowledge, session.verify)
+
+    def send(self, method: str, url: str, **kwargs) -> requests.Response:
+        prepared = self.session.prepare_request(requests.Request(
+            method.upper(), url, headers=kwargs.get("headers"), params=kwargs.get("params"),
+            json=kwargs.get("json"), data=kwargs.get("data")))
+        headers = [(key, value) for key, value in prepared.headers.items() if key.lower() not in _HOP_BY_HOP]
+        stream = kwargs.get("stream", False)
+
+        request = self.client.build_request(prepared.method, prepared.url, headers=headers,
+                                            content=prepared.body, timeout=_timeout(kwargs.get("timeout")))
+        started = time.perf_counter()
+        sent = _run(self.client.send(request, stream=True))
+        elapsed = time.perf_counter() - started
+
+        response = requests.Response()
+        response.status_code = sent.status_code
+        response.reason = sent.reason_phrase
+        response.headers = CaseInsensitiveDict(sent.headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = prepared.url
+        response.request = prepared
+        response.elapsed = timedelta(seconds=elapsed)
+        if stream:
+            response.raw = _StreamReader(sent)
+            return response
+        response._content = _run(self._read(sent))
+        response._content_consumed = True
+        return response
+
+    @staticmethod
+    async def _read(response: "httpx.Response") -> bytes:
+        try:
+            return await response.aread()
+        finally:
+            await response.aclose()
+
+    def close(self) -> None:
+        if self._owns_client:
+            _run(self.client.aclose())
@@ -0,0 +1,50 @@
+import itertools
+import os
+import re
+import threading
+import time
+from typing import Optional
+
+
+ID_START = 10_000_000
+BLOCK_SIZE = 1_000_000  # идентификаторов на одного воркера за запуск
+MAX_WORKERS = 256
+RUN_SLOTS = 10_000
+
+
+def current_worker() -> int:
+    """Номер воркера pytest-xdist (gw0, gw1, ...) или 0 при запуске в одном процессе"""
+    match = re.fullmatch(r"gw(\d+)", os.environ.get("PYTEST_XDIST_WORKER", ""))
+    return int(match.group(1)) if match else 0
+
+
+class IdAllocator:
+    """
+    Выдает идентификаторы и имена пользователей, не пересекающиеся между воркерами.
+
+    Каждой паре (запуск, воркер) принадлежит свой блок из BLOCK_SIZE id, поэтому
+    параллельные процессы не создают одинаковых питомцев, заказов и пользователей.
+    Номер запуска берется из времени старта, чтобы соседние запуски против
+    общего сервера тоже не пересекались.
+    """
+
+    def __init__(self, worker: Optional[int] = None, run_slot: Optional[int] = None):
+        self.worker = current_worker() if worker is None else worker
+        if not 0 <= self.worker < MAX_WORKERS:
+            raise ValueError(f"worker must be in [0, {MAX_WORKERS})")
+        self.run_slot = int(time.time()) % RUN_SLOTS if run_slot is None else run_slot % RUN_SLOTS
+        self.base = ID_START + (self.run_slot * MAX_WORKERS + self.worker) * BLOCK_SIZE
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+    def next_id(self) -> int:
+        """Следующий уникальный id из блока воркера"""
+        with self._lock:
+            n = next(self._counter)
+        if n >= BLOCK_SIZE:
+            raise RuntimeError("id block exhausted for this worker")
+        return self.base + n
+
+    def username(self, prefix: str = "testuser") -> str:
+        """Уникальное имя пользователя в пространстве имен воркера"""
+        return f"{prefix}{self.next_id()}"
@@ -0,0 +1,114 @@
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from src.api.metrics import LatencyHistogram
+
+
+# Фазы запроса, которые замеряет PetStoreAPI. DNS, connect и TLS requests
+# отдельно не раскрывает, они входят в ttfb вместе со временем сервера.
+PHASES = ("rate_limit", "ttfb", "download", "decode", "total")
+
+
+class RequestInfo:
+    """
+    Описание запроса для хуков PetStoreAPI.
+    Pre-хуки получают объект до отправки (status is None),
+    post-хуки - после ответа или ошибки (тогда заполнено error).
+    """
+
+    __slots__ = ("method", "endpoint", "url", "status", "request_bytes", "response_bytes",
+                 "timings", "attempts", "error")
+
+    def __init__(self, method: str, endpoint: str, url: str):
+        self.method = method
+        self.endpoint = endpoint  # шаблон пути, например /pet/{petId}
+        self.url = url
+        self.status: Optional[int] = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.timings: Dict[str, float] = {}
+        self.attempts = 0
+        self.error: Optional[BaseException] = None
+
+    def __repr__(self) -> str:
+        return f"<RequestInfo {self.method} {self.endpoint} status={self.status}>"
+
+
+class EndpointAggregate:
+    """Накопленная статистика одного эндпоинта"""
+
+    def __init__(self):
+        self.latency = LatencyHistogram()
+        self.phase_totals = dict.fromkeys(PHASES, 0.0)
+        self.statuses: Dict[Any, int] = {}
+        self.errors = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    @property
+    def count(self) -> int:
+        return self.latency.count
+
+    def add(self, info: RequestInfo) -> None:
+        self.latency.record(info.timings.get("total", 0.0))
+        for phase, value in info.timings.items():
+            self.phase_totals[phase] = self.phase_totals.get(phase, 0.0) + value
+        key = info.status if info.error is None else type(info.error).__name__
+        self.statuses[key] = self.statuses.get(key, 0) + 1
+        if info.error is not None or (info.status or 0) >= 500:
+            self.errors += 1
+        self.request_bytes += info.request_bytes
+        self.response_bytes += info.response_bytes
+
+
+class RequestCollector:
+    """
+    Встроенный сборщик метрик: post-хук, агрегирующий запросы по (метод, шаблон пути).
+
+        collector = RequestCollector()
+        collector.install(api_client)
+        ...
+        print(collector.report())
+    """
+
+    def __init__(self):
+        self.endpoints: Dict[Tuple[str, str], EndpointAggregate] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, info: RequestInfo) -> None:
+        key = (info.method, info.endpoint)
+        with self._lock:
+            aggregate = self.endpoints.get(key)
+            if aggregate is None:
+                aggregate = self.endpoints[key] = EndpointAggregate()
+            aggregate.add(info)
+
+    def install(self, client) -> "RequestCollector":
+        """Подписывает сборщик на post-хуки клиента"""
+        client.add_post_request_hook(self)
+        return self
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Агрегаты по эндпоинтам: перцентили, средние фазы, статусы и объем"""
+        result = {}
+        with self._lock:
+            items = list(self.endpoints.items())
+        for (method, endpoint), aggregate in sorted(items):
+            row: Dict[str, Any] = aggregate.latency.summary()
+            for phase, total in aggregate.phase_totals.items():
+                row[f"{phase}_avg_ms"] = total / aggregate.count * 1000 if aggregate.count else 0.0
+            row["statuses"] = dict(aggregate.statuses)
+            row["errors"] = aggregate.errors
+            row["request_bytes"] = aggregate.request_bytes
+            row["response_bytes"] = aggregate.response_bytes
+            result[f"{method} {endpoint}"] = row
+        return result
+
+    def report(self) -> str:
+        lines = [f"{'endpoint':<34}{'count':>7}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+                 f"{'ttfb':>8}{'dl':>7}{'decode':>8}{'bytes in':>10}"]
+        for name, row in self.summary().items():
+            lines.append(f"{name:<34}{row['count']:>7}{row['p50_ms']:>9.2f}{row['p99_ms']:>9.2f}"
+                         f"{row['max_ms']:>9.2f}{row['ttfb_avg_ms']:>8.2f}{row['download_avg_ms']:>7.2f}"
+                         f"{row['decode_avg_ms']:>8.2f}{row['response_bytes']:>10}")
+        return "\n".join(lines)
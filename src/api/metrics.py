@@ -0,0 +1,106 @@
+import threading
+from typing import Any, Dict, Optional
+
+
+class LatencyHistogram:
+    """
+    Гистограмма задержек в духе HdrHistogram.
+
+    Значения хранятся в микросекундах в лог-линейных корзинах: на каждую
+    степень двойки приходится 2 ** sub_bucket_bits корзин, поэтому
+    относительная погрешность не превышает 2 ** -(sub_bucket_bits - 1),
+    а память ограничена числом непустых корзин (не более нескольких тысяч)
+    независимо от количества записанных значений.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7):
+        self.sub_bucket_bits = sub_bucket_bits
+        self._counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    def _index(self, value: int) -> int:
+        shift = max(value.bit_length() - self.sub_bucket_bits, 0)
+        return (shift << self.sub_bucket_bits) + (value >> shift)
+
+    def _highest_equivalent(self, index: int) -> int:
+        shift = index >> self.sub_bucket_bits
+        mantissa = index & ((1 << self.sub_bucket_bits) - 1)
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """Записывает одно значение в секундах"""
+        value = max(int(seconds * 1_000_000), 0)
+        index = self._index(value)
+        with self._lock:
+            self._counts[index] = self._counts.get(index, 0) + 1
+            self.count += 1
+            self.total_us += value
+            if self.min_us is None or value < self.min_us:
+                self.min_us = value
+            if value > self.max_us:
+                self.max_us = value
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Добавляет значения другой гистограммы с тем же sub_bucket_bits"""
+        if other.sub_bucket_bits != self.sub_bucket_bits:
+            raise ValueError("cannot merge histograms with different precision")
+        with self._lock:
+            for index, count in other._counts.items():
+                self._counts[index] = self._counts.get(index, 0) + count
+            self.count += other.count
+            self.total_us += other.total_us
+            if other.min_us is not None and (self.min_us is None or other.min_us < self.min_us):
+                self.min_us = other.min_us
+            self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, p: float) -> float:
+        """Значение перцентиля p (0-100) в секундах"""
+        if not self.count:
+            return 0.0
+        target = max(int(round(p / 100 * self.count)), 1)
+        seen = 0
+        with self._lock:
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= target:
+                    value = min(self._highest_equivalent(index), self.max_us)
+                    return max(value, self.min_us or 0) / 1_000_000
+        return self.max_us / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        return self.total_us / self.count / 1_000_000 if self.count else 0.0
+
+    @property
+    def max(self) -> float:
+        return self.max_us / 1_000_000
+
+    def summary(self) -> Dict[str, float]:
+        """Основные перцентили в миллисекундах"""
+        return {
+            "count": self.count,
+            "p50_ms": self.percentile(50) * 1000,
+            "p90_ms": self.percentile(90) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Компактное представление для сохранения"""
+        with self._lock:
+            return {"bits": self.sub_bucket_bits, "counts": dict(self._counts),
+                    "total_us": self.total_us, "min_us": self.min_us, "max_us": self.max_us}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls(data["bits"])
+        histogram._counts = {int(index): count for index, count in data["counts"].items()}
+        histogram.count = sum(histogram._counts.values())
+        histogram.total_us = data["total_us"]
+        histogram.min_us = data["min_us"]
+        histogram.max_us = data["max_us"]
+        return histogram
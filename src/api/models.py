@@ -0,0 +1,174 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class SchemaError(ValueError):
+    """Данные не соответствуют схеме модели; path указывает на поле"""
+
+    def __init__(self, path: str, message: str):
+        super().__init__(f"{path}: {message}")
+        self.path = path
+
+
+def _int(value: Any, path: str) -> int:
+    if type(value) is not int:
+        raise SchemaError(path, f"expected integer, got {type(value).__name__}")
+    return value
+
+
+def _str(value: Any, path: str) -> str:
+    if type(value) is not str:
+        raise SchemaError(path, f"expected string, got {type(value).__name__}")
+    return value
+
+
+def _bool(value: Any, path: str) -> bool:
+    if type(value) is not bool:
+        raise SchemaError(path, f"expected boolean, got {type(value).__name__}")
+    return value
+
+
+def _enum(*allowed: str) -> Callable[[Any, str], str]:
+    def check(value: Any, path: str) -> str:
+        if value not in allowed:
+            raise SchemaError(path, f"expected one of {allowed}, got {value!r}")
+        return value
+    return check
+
+
+def _list_of(item: Callable[[Any, str], Any]) -> Callable[[Any, str], list]:
+    def check(value: Any, path: str) -> list:
+        if type(value) is not list:
+            raise SchemaError(path, f"expected array, got {type(value).__name__}")
+        return [item(element, f"{path}[{i}]") for i, element in enumerate(value)]
+    return check
+
+
+def _model(cls: type) -> Callable[[Any, str], "Model"]:
+    return lambda value, path: cls.from_dict(value, path)
+
+
+# (атрибут, ключ JSON, проверка/декодер, обязательное поле)
+FieldSpec = Tuple[str, str, Callable[[Any, str], Any], bool]
+
+
+class Model:
+    """
+    Базовый класс компактных моделей PetStore.
+    Поля хранятся в __slots__, без __dict__ на каждый объект. Схема задается
+    в FIELDS; from_dict проверяет типы и обязательные поля, to_dict опускает None.
+    """
+
+    __slots__ = ()
+    FIELDS: Tuple[FieldSpec, ...] = ()
+
+    def __init__(self, **kwargs):
+        for attr, _, _, _ in self.FIELDS:
+            setattr(self, attr, kwargs.pop(attr, None))
+        if kwargs:
+            raise TypeError(f"{type(self).__name__} got unexpected fields {sorted(kwargs)}")
+
+    @classmethod
+    def from_dict(cls, data: Any, path: Optional[str] = None) -> "Model":
+        """Декодирует dict из JSON, выбрасывая SchemaError при несоответствии схеме"""
+        path = path or cls.__name__
+        if type(data) is not dict:
+            raise SchemaError(path, f"expected object, got {type(data).__name__}")
+        obj = cls.__new__(cls)
+        for attr, key, decode, required in cls.FIELDS:
+            value = data.get(key)
+            if value is None:
+                if required:
+                    raise SchemaError(f"{path}.{key}", "required field is missing")
+            else:
+                value = decode(value, f"{path}.{key}")
+            setattr(obj, attr, value)
+        return obj
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Кодирует модель в dict для JSON"""
+        result = {}
+        for attr, key, _, _ in self.FIELDS:
+            value = getattr(self, attr)
+            if value is None:
+                continue
+            if isinstance(value, Model):
+                value = value.to_dict()
+            elif type(value) is list:
+                value = [item.to_dict() if isinstance(item, Model) else item for item in value]
+            result[key] = value
+        return result
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, attr) == getattr(other, attr) for attr, _, _, _ in self.FIELDS)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{attr}={getattr(self, attr)!r}" for attr, _, _, _ in self.FIELDS
+                           if getattr(self, attr) is not None)
+        return f"{type(self).__name__}({fields})"
+
+
+class Category(Model):
+    __slots__ = ("id", "name")
+    FIELDS = (
+        ("id", "id", _int, False),
+        ("name", "name", _str, False),
+    )
+
+
+class Tag(Model):
+    __slots__ = ("id", "name")
+    FIELDS = (
+        ("id", "id", _int, False),
+        ("name", "name", _str, False),
+    )
+
+
+PET_STATUSES = ("available", "pending", "sold")
+ORDER_STATUSES = ("placed", "approved", "delivered")
+
+
+class Pet(Model):
+    __slots__ = ("id", "category", "name", "photo_urls", "tags", "status")
+    FIELDS = (
+        ("id", "id", _int, False),
+        ("category", "category", _model(Category), False),
+        ("name", "name", _str, True),
+        ("photo_urls", "photoUrls", _list_of(_str), True),
+        ("tags", "tags", _list_of(_model(Tag)), False),
+        ("status", "status", _enum(*PET_STATUSES), False),
+    )
+
+
+class Order(Model):
+    __slots__ = ("id", "pet_id", "quantity", "ship_date", "status", "complete")
+    FIELDS = (
+        ("id", "id", _int, False),
+        ("pet_id", "petId", _int, False),
+        ("quantity", "quantity", _int, False),
+        ("ship_date", "shipDate", _str, False),
+        ("status", "status", _enum(*ORDER_STATUSES), False),
+        ("complete", "complete", _bool, False),
+    )
+
+
+class User(Model):
+    __slots__ = ("id", "username", "first_name", "last_name", "email", "password", "phone", "user_status")
+    FIELDS = (
+        ("id", "id", _int, False),
+        ("username", "username", _str, False),
+        ("first_name", "firstName", _str, False),
+        ("last_name", "lastName", _str, False),
+        ("email", "email", _str, False),
+        ("password", "password", _str, False),
+        ("phone", "phone", _str, False),
+        ("user_status", "userStatus", _int, False),
+    )
+
+
+def decode_list(cls: type, data: Any) -> List[Model]:
+    """Декодирует JSON-массив объектов в список моделей"""
+    if type(data) is not list:
+        raise SchemaError(cls.__name__, f"expected array, got {type(data).__name__}")
+    return [cls.from_dict(item, f"{cls.__name__}[{i}]") for i, item in enumerate(data)]
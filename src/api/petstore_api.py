@@ -1,44 +1,413 @@
 import requests
 import json
-from typing import Optional, Dict, Any
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Callable, Iterable, Iterator, List
+
+from src.api.bulk import ChunkResult, dispatch_chunks, iter_chunks
+from src.api.cache import ResponseCache, invalidation_targets
+from src.api.contract import ContractValidator
+from src.api.instrumentation import RequestInfo
+from src.api.models import Model, Order, Pet, User, decode_list
+from src.api.rate_limiter import RateLimiter
+from src.api.resources import ResourceTracker
+from src.api.retry import CircuitBreaker, DeadlineExceeded, RetryPolicy
+from src.api.session import DEFAULT_HEADERS, build_session, shared_session
+from src.api.streaming import iter_json_array
+from src.api.http2 import HTTP2Transport, shared_http2_client
+from src.api.transport import SessionTransport, Transport
+
+
+LOGGER_NAME = "petstore_api"
+
+# Режимы логирования запросов
+LOG_OFF = "off"  # ничего не логируем
+LOG_COMPACT = "compact"  # одна строка INFO на запрос
+LOG_DEBUG = "debug"  # плюс тела запроса и ответа на уровне DEBUG
+LOG_MODES = (LOG_OFF, LOG_COMPACT, LOG_DEBUG)
+
+# Предохранитель без политики повторов: каждая попытка одна
+_SINGLE_ATTEMPT = RetryPolicy(max_attempts=1, deadline=None)
+
+
+class _LazyJson:
+    """Откладывает сериализацию тела до момента, когда запись реально попадет в лог"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __str__(self) -> str:
+        return json.dumps(self.value, indent=2, ensure_ascii=False)
+
+
+class _LazyResponseBody:
+    """Тело ответа для лога: JSON через кэш response.json(), иначе текст"""
+
+    __slots__ = ("response",)
+
+    def __init__(self, response: requests.Response):
+        self.response = response
+
+    def __str__(self) -> str:
+        try:
+            return str(_LazyJson(self.response.json()))
+        except ValueError:
+            return self.response.text
+
+
+def _cache_json(response: requests.Response) -> requests.Response:
+    """
+    Подменяет response.json() версией, которая разбирает тело только один раз.
+    Повторные вызовы без аргументов возвращают тот же объект.
+    """
+    parse = response.json
+    cache = []
+
+    def json_cached(**kwargs):
+        if kwargs:
+            return parse(**kwargs)
+        if not cache:
+            cache.append(parse())
+        return cache[0]
+
+    response.json = json_cached
+    return response
 
 
 class PetStoreAPI:
     """
     Клиент для работы с PetStore API.
     Инкапсулирует всю логику взаимодействия с API.
+
+    log_mode управляет логированием запросов: "off" (по умолчанию), "compact" -
+    одна строка на запрос, "debug" - дополнительно полные тела. Записи пишутся
+    в logger (по умолчанию "petstore_api"), поэтому вывод настраивается
+    стандартными средствами logging, например pytest --log-cli-level=DEBUG.
+
+    rate_limiter - общий RateLimiter: запросы ждут токен, а ответы 429
+    повторяются до max_throttle_retries раз после паузы по Retry-After.
+
+    add_pre_request_hook/add_post_request_hook подписывают функции на RequestInfo
+    каждого запроса (метод, шаблон пути, статус, байты, фазы). Пока подписчиков
+    нет, RequestInfo не создается и замеры не выполняются.
+
+    cache - опциональный ResponseCache для GET: свежие ответы отдаются из памяти,
+    устаревшие перепроверяются по ETag, а записи (create/update/delete) сбрасывают
+    связанные ключи: /pet/{id}, списки findByStatus, инвентарь, /user/{username}.
+
+    transport - через что уходят запросы (src.api.transport), по умолчанию
+    SessionTransport поверх self.session; RecordingTransport/ReplayTransport
+    записывают и воспроизводят кассеты.
+
+    retry_policy (src.api.retry.RetryPolicy) повторяет идемпотентные запросы при
+    сетевых ошибках и 5xx с экспоненциальной паузой и общим дедлайном;
+    circuit_breaker - общий CircuitBreaker, который при недоступном backend
+    сразу отклоняет запросы с CircuitOpenError. По умолчанию повторов нет.
+
+    connect_timeout/read_timeout ограничивают установку соединения и ожидание
+    данных из сокета, total_timeout - весь вызов вместе с повторами (каждое
+    ожидание урезается до оставшегося времени). pool_connections/pool_maxsize/
+    pool_block, keep_alive и tcp_keepalive настраивают пул (src.api.session).
+    share_session=True берет общую на процесс сессию с такими же настройками
+    пула, поэтому новые клиенты получают уже открытые соединения; session
+    позволяет передать готовую сессию.
+
+    resource_tracker - опциональный ResourceTracker: клиент сообщает ему о созданных
+    и удаленных питомцах, заказах и пользователях, чтобы их можно было убрать разом.
+
+    contract - опциональный ContractValidator (src.api.contract): тела запросов и
+    ответы проверяются по swagger-спецификации, нарушение - ContractError.
+
+    http2=True отправляет запросы через HTTP2Transport (src.api.http2, нужен
+    httpx[http2]): параллельные вызовы идут потоками одного соединения.
+    Для http:// адресов используется h2c без согласования; pool_maxsize
+    ограничивает число соединений, share_session - общий HTTP/2 клиент.
     """
     
-    def __init__(self, base_url: str = "https://petstore.swagger.io/v2"):
+    def __init__(self, base_url: str = "https://petstore.swagger.io/v2",
+                 log_mode: str = LOG_OFF, logger: Optional[logging.Logger] = None,
+                 rate_limiter: Optional[RateLimiter] = None, max_throttle_retries: int = 3,
+                 cache: Optional[ResponseCache] = None, transport: Optional[Transport] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 connect_timeout: Optional[float] = 5.0, read_timeout: Optional[float] = 30.0,
+                 total_timeout: Optional[float] = None,
+                 pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                 keep_alive: bool = True, tcp_keepalive: Optional[float] = None,
+                 session: Optional[requests.Session] = None, share_session: bool = False,
+                 resource_tracker: Optional[ResourceTracker] = None,
+                 contract: Optional[ContractValidator] = None, http2: bool = False):
+        if log_mode not in LOG_MODES:
+            raise ValueError(f"Unknown log_mode {log_mode!r}, expected one of {LOG_MODES}")
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            "Content-Type": "application/json",
-            "Accept": "application/json"
-        })
+        self.log_mode = log_mode
+        self.logger = logger or logging.getLogger(LOGGER_NAME)
+        self.rate_limiter = rate_limiter
+        self.max_throttle_retries = max_throttle_retries
+        self.cache = cache
+        self.retry_policy = retry_policy
+        self.circuit_breaker = circuit_breaker
+        self.resource_tracker = resource_tracker
+        self.contract = contract
+        self._pre_request_hooks: List[Callable[[RequestInfo], None]] = []
+        self._post_request_hooks: List[Callable[[RequestInfo], None]] = []
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.total_timeout = total_timeout
+        
+        pool = dict(pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                    pool_block=pool_block, keep_alive=keep_alive, tcp_keepalive=tcp_keepalive)
+        self._owns_session = session is None and not share_session
+        if session is not None:
+            self.session = session
+            self.session.headers.update(DEFAULT_HEADERS)
+        elif share_session:
+            self.session = shared_session(**pool)
+        else:
+            self.session = build_session(**pool)
+        self._owns_transport = transport is None and http2
+        if self._owns_transport:
+            prior_knowledge = base_url.startswith("http://")
+            client = (shared_http2_client(pool_maxsize, prior_knowledge, self.session.verify)
+                      if share_session else None)
+            transport = HTTP2Transport(self.session, client, pool_maxsize, prior_knowledge)
+        self.transport = transport or SessionTransport(self.session)
     
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+    def add_pre_request_hook(self, hook: Callable[[RequestInfo], None]) -> None:
+        """Подписывает hook, вызываемый перед отправкой запроса"""
+        self._pre_request_hooks.append(hook)
+    
+    def add_post_request_hook(self, hook: Callable[[RequestInfo], None]) -> None:
+        """Подписывает hook, вызываемый после ответа или ошибки"""
+        self._post_request_hooks.append(hook)
+    
+    def remove_request_hook(self, hook: Callable[[RequestInfo], None]) -> None:
+        """Отписывает hook от pre- и post-событий"""
+        for hooks in (self._pre_request_hooks, self._post_request_hooks):
+            while hook in hooks:
+                hooks.remove(hook)
+    
+    def close(self) -> None:
+        """Закрывает собственную сессию; общая и переданная снаружи остаются открытыми"""
+        if self._owns_transport:
+            self.transport.close()
+        if self._owns_session:
+            self.session.close()
+    
+    def warm_up(self, connections: int = 1) -> int:
+        """
+        Заранее открывает до connections соединений параллельными GET /store/inventory
+        (в обход хуков, кэша и повторов). Возвращает число успешных запросов.
+        """
+        url = f"{self.base_url}/store/inventory"
+        
+        def ping(_) -> bool:
+            try:
+                self.transport.send("GET", url, timeout=(self.connect_timeout, self.read_timeout)).close()
+                return True
+            except requests.exceptions.RequestException:
+                return False
+        
+        with ThreadPoolExecutor(max_workers=max(connections, 1), thread_name_prefix="warm-up") as executor:
+            return sum(executor.map(ping, range(connections)))
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Состояние клиента (атрибуты, заголовки сессии, хуки) для последующего restore"""
+        state = dict(vars(self))
+        state["_pre_request_hooks"] = list(self._pre_request_hooks)
+        state["_post_request_hooks"] = list(self._post_request_hooks)
+        return {"attrs": state, "headers": self.session.headers.copy()}
+    
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        """Возвращает клиент к состоянию snapshot: сбрасывает измененные заголовки, хуки и настройки"""
+        vars(self).clear()
+        vars(self).update(snapshot["attrs"])
+        self._pre_request_hooks = list(self._pre_request_hooks)
+        self._post_request_hooks = list(self._post_request_hooks)
+        self.session.headers.clear()
+        self.session.headers.update(snapshot["headers"])
+    
+    def _timeout(self, deadline: Optional[float]):
+        """Таймаут (connect, read) для requests с учетом остатка total_timeout"""
+        if deadline is None:
+            return self.connect_timeout, self.read_timeout
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"total timeout of {self.total_timeout} s exceeded")
+        return (min(self.connect_timeout or remaining, remaining),
+                min(self.read_timeout or remaining, remaining))
+    
+    def _make_request(self, method: str, endpoint: str, template: Optional[str] = None,
+                      **kwargs) -> requests.Response:
         """
         Базовый метод для выполнения HTTP запросов.
         Централизованная обработка ошибок и логирование.
+        template - шаблон пути для хуков (например /pet/{petId}), по умолчанию путь без query.
         """
-        url = f"{self.base_url}{endpoint}"
-        print(f"🚀 Making {method.upper()} request to: {url}")
-        if kwargs.get('json'):
-            print(f"📦 Request body: {json.dumps(kwargs['json'], indent=2)}")
+        contract = self.contract
+        if contract is None:
+            return self._route(method, endpoint, template, **kwargs)
+        
+        template = template or endpoint.split("?", 1)[0]
+        contract.validate_request(method, template, kwargs.get("json"))
+        response = self._route(method, endpoint, template, **kwargs)
+        if not kwargs.get("stream"):
+            contract.validate_response(method, template, response)
+        return response
+    
+    def _route(self, method: str, endpoint: str, template: Optional[str] = None,
+               **kwargs) -> requests.Response:
+        """Записи сбрасывают кэш и учитываются трекером, GET проходит через кэш"""
+        if method.upper() != "GET":
+            if self.cache is None and self.resource_tracker is None:
+                return self._dispatch(method, endpoint, template, **kwargs)
+            return self._write(method, endpoint, template, **kwargs)
+        cache = self.cache
+        if cache is None or kwargs.get("stream"):
+            return self._dispatch(method, endpoint, template, **kwargs)
         
+        entry, fresh = cache.lookup(endpoint)
+        if fresh:
+            return entry.response
+        if entry is not None:
+            kwargs["headers"] = dict(kwargs.get("headers") or {}, **{"If-None-Match": entry.etag})
+        response = self._dispatch(method, endpoint, template, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            cache.revalidated(endpoint, entry)
+            return entry.response
+        if response.status_code == 200:
+            cache.store(endpoint, response)
+        return response
+    
+    def _write(self, method: str, endpoint: str, template: Optional[str] = None,
+               **kwargs) -> requests.Response:
+        """Записывающий запрос: сброс связанных ключей кэша и учет созданных сущностей"""
+        response = None
         try:
-            response = self.session.request(method, url, **kwargs)
-            print(f"📡 Response status: {response.status_code}")
-            if response.content:
-                try:
-                    print(f"📥 Response body: {json.dumps(response.json(), indent=2)}")
-                except:
-                    print(f"📥 Response body: {response.text}")
+            response = self._dispatch(method, endpoint, template, **kwargs)
             return response
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate(*invalidation_targets(method, endpoint, kwargs.get("json")))
+            if self.resource_tracker is not None and response is not None:
+                self.resource_tracker.observe(method, endpoint, kwargs.get("json"), response)
+    
+    def _dispatch(self, method: str, endpoint: str, template: Optional[str] = None,
+                  **kwargs) -> requests.Response:
+        """Отправка запроса с вызовом pre/post хуков"""
+        url = f"{self.base_url}{endpoint}"
+        template = template or endpoint.split("?", 1)[0]
+        if not (self._pre_request_hooks or self._post_request_hooks):
+            return self._execute(method, url, template, None, **kwargs)
+        
+        info = RequestInfo(method.upper(), template, url)
+        for hook in self._pre_request_hooks:
+            hook(info)
+        started = time.perf_counter()
+        try:
+            response = self._execute(method, url, template, info, **kwargs)
+        except requests.exceptions.RequestException as e:
+            info.error = e
+            raise
+        finally:
+            info.timings["total"] = time.perf_counter() - started
+            for hook in self._post_request_hooks:
+                hook(info)
+        return response
+    
+    def _execute(self, method: str, url: str, template: str, info: Optional[RequestInfo],
+                 **kwargs) -> requests.Response:
+        """Отправка по политике повторов и предохранителю, если они заданы"""
+        deadline = time.perf_counter() + self.total_timeout if self.total_timeout else None
+        policy = self.retry_policy
+        if policy is None:
+            if self.circuit_breaker is not None:
+                policy = _SINGLE_ATTEMPT
+            else:
+                return self._throttled(method, url, info, deadline, **kwargs)
+        return policy.call(method.upper(), template,
+                           lambda: self._throttled(method, url, info, deadline, **kwargs),
+                           self.circuit_breaker)
+    
+    def _throttled(self, method: str, url: str, info: Optional[RequestInfo],
+                   deadline: Optional[float], **kwargs) -> requests.Response:
+        """Отправка с учетом rate limiter и повторов после 429"""
+        limiter = self.rate_limiter
+        if limiter is None:
+            return self._send(method, url, info, deadline, **kwargs)
+        
+        for attempt in range(self.max_throttle_retries + 1):
+            waited = limiter.acquire()
+            if info is not None:
+                info.timings["rate_limit"] = info.timings.get("rate_limit", 0.0) + waited
+            response = self._send(method, url, info, deadline, **kwargs)
+            if response.status_code != 429:
+                limiter.on_success()
+                return response
+            delay = limiter.on_throttle(response.headers.get("Retry-After"))
+            if attempt < self.max_throttle_retries and self.log_mode != LOG_OFF:
+                self.logger.warning("%s %s throttled, retry #%d in %.2f s",
+                                    method.upper(), url, attempt + 1, delay)
+        return response
+    
+    def _send(self, method: str, url: str, info: Optional[RequestInfo] = None,
+              deadline: Optional[float] = None, **kwargs) -> requests.Response:
+        """Одна попытка запроса с логированием и замером фаз"""
+        if "timeout" not in kwargs:
+            kwargs["timeout"] = self._timeout(deadline)
+        log = self.logger
+        log_enabled = self.log_mode != LOG_OFF
+        debug_enabled = self.log_mode == LOG_DEBUG and log.isEnabledFor(logging.DEBUG)
+        if debug_enabled and kwargs.get('json') is not None:
+            log.debug("Request body for %s %s: %s", method.upper(), url, _LazyJson(kwargs['json']))
+        
+        started = time.perf_counter()
+        try:
+            response = _cache_json(self.transport.send(method, url, **kwargs))
         except requests.exceptions.RequestException as e:
-            print(f"❌ Request failed: {e}")
+            if log_enabled:
+                log.warning("%s %s failed: %s", method.upper(), url, e)
             raise
+        elapsed = time.perf_counter() - started
+        # При stream=True тело еще не прочитано, его нельзя трогать до вызывающего кода
+        streamed = kwargs.get("stream", False)
+        
+        if info is not None:
+            self._measure(info, response, elapsed, streamed)
+        if log_enabled:
+            size = "stream" if streamed else f"{len(response.content)} B"
+            log.info("%s %s -> %s (%.1f ms, %s)", method.upper(), url, response.status_code,
+                     elapsed * 1000, size)
+        if debug_enabled and not streamed and response.content:
+            log.debug("Response body for %s %s: %s", method.upper(), url, _LazyResponseBody(response))
+        return response
+    
+    @staticmethod
+    def _measure(info: RequestInfo, response: requests.Response, elapsed: float,
+                 streamed: bool = False) -> None:
+        """Заполняет RequestInfo по результатам попытки"""
+        ttfb = min(response.elapsed.total_seconds(), elapsed)
+        info.attempts += 1
+        info.status = response.status_code
+        info.timings["ttfb"] = ttfb
+        info.timings["download"] = elapsed - ttfb
+        prepared = response.request
+        body = prepared.body if prepared is not None else None
+        info.request_bytes = len(body) if body else 0
+        if streamed:
+            return
+        info.response_bytes = len(response.content)
+        if response.content:
+            # Тело разбирается заранее и кэшируется, так что вызывающий код не платит за него повторно
+            started = time.perf_counter()
+            try:
+                response.json()
+            except ValueError:
+                pass
+            info.timings["decode"] = time.perf_counter() - started
     
     # === PET ENDPOINTS ===
     
@@ -48,7 +417,7 @@ class PetStoreAPI:
     
     def get_pet_by_id(self, pet_id: int) -> requests.Response:
         """GET /pet/{petId} - Получение питомца по ID"""
-        return self._make_request("GET", f"/pet/{pet_id}")
+        return self._make_request("GET", f"/pet/{pet_id}", template="/pet/{petId}")
     
     def update_pet(self, pet_data: Dict[str, Any]) -> requests.Response:
         """PUT /pet - Обновление существующего питомца"""
@@ -67,12 +436,25 @@ class PetStoreAPI:
     def delete_pet(self, pet_id: int, api_key: str = "special-key") -> requests.Response:
         """DELETE /pet/{petId} - Удаление питомца"""
         headers = {"api_key": api_key}
-        return self._make_request("DELETE", f"/pet/{pet_id}", headers=headers)
+        return self._make_request("DELETE", f"/pet/{pet_id}", template="/pet/{petId}", headers=headers)
     
     def find_pets_by_status(self, status: str) -> requests.Response:
         """GET /pet/findByStatus - Поиск питомцев по статусу"""
         return self._make_request("GET", f"/pet/findByStatus?status={status}")
     
+    def iter_pets_by_status(self, status: str, chunk_size: int = 64 * 1024) -> Iterator[Dict[str, Any]]:
+        """
+        GET /pet/findByStatus - Потоковый поиск питомцев по статусу.
+        Тело читается чанками и разбирается инкрементально, питомцы отдаются
+        по одному, поэтому память не зависит от размера ответа.
+        При ответе не 2xx выбрасывается requests.HTTPError.
+        """
+        response = self._make_request("GET", f"/pet/findByStatus?status={status}", stream=True)
+        with response:
+            response.raise_for_status()
+            yield from iter_json_array(response.iter_content(chunk_size),
+                                       response.encoding or "utf-8")
+    
     # === STORE ENDPOINTS ===
     
     def get_inventory(self) -> requests.Response:
@@ -85,11 +467,11 @@ class PetStoreAPI:
     
     def get_order_by_id(self, order_id: int) -> requests.Response:
         """GET /store/order/{orderId} - Получение заказа по ID"""
-        return self._make_request("GET", f"/store/order/{order_id}")
+        return self._make_request("GET", f"/store/order/{order_id}", template="/store/order/{orderId}")
     
     def delete_order(self, order_id: int) -> requests.Response:
         """DELETE /store/order/{orderId} - Удаление заказа"""
-        return self._make_request("DELETE", f"/store/order/{order_id}")
+        return self._make_request("DELETE", f"/store/order/{order_id}", template="/store/order/{orderId}")
     
     # === USER ENDPOINTS ===
     
@@ -99,7 +481,7 @@ class PetStoreAPI:
     
     def get_user_by_username(self, username: str) -> requests.Response:
         """GET /user/{username} - Получение пользователя по имени"""
-        return self._make_request("GET", f"/user/{username}")
+        return self._make_request("GET", f"/user/{username}", template="/user/{username}")
     
     def get_user_by_userdata(self, username: str) -> requests.Response:
         """GET /user/{username} - Получение пользователя по имени (alias для consistency)"""
@@ -107,13 +489,74 @@ class PetStoreAPI:
     
     def update_user(self, username: str, user_data: Dict[str, Any]) -> requests.Response:
         """PUT /user/{username} - Обновление пользователя"""
-        return self._make_request("PUT", f"/user/{username}", json=user_data)
+        return self._make_request("PUT", f"/user/{username}", template="/user/{username}", json=user_data)
     
     def delete_user(self, username: str) -> requests.Response:
         """DELETE /user/{username} - Удаление пользователя"""
-        return self._make_request("DELETE", f"/user/{username}")
+        return self._make_request("DELETE", f"/user/{username}", template="/user/{username}")
     
     def create_users_with_list(self, users_list: list) -> requests.Response:
         """POST /user/createWithList - Создание пользователей из списка"""
         return self._make_request("POST", "/user/createWithList", json=users_list)
-    
\ No newline at end of file
+    
+    def create_users_with_array(self, users_list: list) -> requests.Response:
+        """POST /user/createWithArray - Создание пользователей из массива"""
+        return self._make_request("POST", "/user/createWithArray", json=users_list)
+    
+    def bulk_create_users(self, users: Iterable[Dict[str, Any]], chunk_size: int = 100,
+                          max_chunk_bytes: Optional[int] = 512 * 1024, concurrency: int = 4,
+                          retries: int = 2, use_array: bool = False) -> List[ChunkResult]:
+        """
+        Массовое создание пользователей через createWithList (или createWithArray).
+        users может быть генератором: он режется на пакеты по chunk_size штук и
+        max_chunk_bytes байт, которые отправляются параллельно (concurrency потоков
+        через пул соединений сессии), так что весь набор в памяти не хранится.
+        Возвращает ChunkResult по каждому пакету, неудачные пакеты повторяются retries раз.
+        """
+        send = self.create_users_with_array if use_array else self.create_users_with_list
+        return dispatch_chunks(send, iter_chunks(users, chunk_size, max_chunk_bytes),
+                               concurrency=concurrency, retries=retries)
+    
+    # === TYPED ENDPOINTS ===
+    # Возвращают модели из src.api.models вместо requests.Response.
+    # Ответ не 2xx - requests.HTTPError, несоответствие схеме - SchemaError.
+    
+    @staticmethod
+    def _decode(response: requests.Response, model: type) -> Model:
+        response.raise_for_status()
+        return model.from_dict(response.json())
+    
+    def create_pet_model(self, pet: Pet) -> Pet:
+        """POST /pet - Добавление нового питомца"""
+        return self._decode(self.create_pet(pet.to_dict()), Pet)
+    
+    def get_pet_model(self, pet_id: int) -> Pet:
+        """GET /pet/{petId} - Получение питомца по ID"""
+        return self._decode(self.get_pet_by_id(pet_id), Pet)
+    
+    def update_pet_model(self, pet: Pet) -> Pet:
+        """PUT /pet - Обновление существующего питомца"""
+        return self._decode(self.update_pet(pet.to_dict()), Pet)
+    
+    def find_pet_models_by_status(self, status: str) -> List[Pet]:
+        """GET /pet/findByStatus - Поиск питомцев по статусу"""
+        response = self.find_pets_by_status(status)
+        response.raise_for_status()
+        return decode_list(Pet, response.json())
+    
+    def iter_pet_models_by_status(self, status: str) -> Iterator[Pet]:
+        """GET /pet/findByStatus - Потоковый поиск, питомцы декодируются по одному"""
+        for i, pet in enumerate(self.iter_pets_by_status(status)):
+            yield Pet.from_dict(pet, f"Pet[{i}]")
+    
+    def create_order_model(self, order: Order) -> Order:
+        """POST /store/order - Размещение заказа"""
+        return self._decode(self.create_order(order.to_dict()), Order)
+    
+    def get_order_model(self, order_id: int) -> Order:
+        """GET /store/order/{orderId} - Получение заказа по ID"""
+        return self._decode(self.get_order_by_id(order_id), Order)
+    
+    def get_user_model(self, username: str) -> User:
+        """GET /user/{username} - Получение пользователя по имени"""
+        return self._decode(self.get_user_by_username(username), User)
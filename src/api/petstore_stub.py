@@ -0,0 +1,622 @@
+import argparse
+import hashlib
+import itertools
+import json
+import re
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+
+BASE_PATH = "/v2"
+INT64_RANGE = (-2 ** 63, 2 ** 63 - 1)
+
+
+class StubError(Exception):
+    """Ошибка обработки запроса, которую заглушка превращает в ответ"""
+
+    def __init__(self, status: int, body: Optional[Dict[str, Any]] = None):
+        super().__init__(status, body)
+        self.status = status
+        self.body = body
+
+
+def _api_message(code: int, message: str, type_: str = "unknown") -> Dict[str, Any]:
+    """Тело ответа в формате ApiResponse из спецификации PetStore"""
+    return {"code": code, "type": type_, "message": message}
+
+
+class PetStoreState:
+    """
+    Хранилище заглушки PetStore в памяти.
+    Питомцы индексируются по id и статусу, заказы - по id,
+    пользователи - по username и id. Все операции потокобезопасны.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._ids = itertools.count(9_000_000_000)
+        self.pets: Dict[int, Dict[str, Any]] = {}
+        self.pets_by_status: Dict[str, Dict[int, None]] = {}
+        self.orders: Dict[int, Dict[str, Any]] = {}
+        self.users: Dict[str, Dict[str, Any]] = {}
+        self.users_by_id: Dict[int, str] = {}
+
+    def reset(self) -> None:
+        """Очищает все данные"""
+        with self._lock:
+            self.pets.clear()
+            self.pets_by_status.clear()
+            self.orders.clear()
+            self.users.clear()
+            self.users_by_id.clear()
+
+    # === PETS ===
+
+    def _index_pet(self, pet: Dict[str, Any]) -> None:
+        old = self.pets.get(pet["id"])
+        if old is not None:
+            self.pets_by_status.get(old.get("status"), {}).pop(pet["id"], None)
+        self.pets[pet["id"]] = pet
+        self.pets_by_status.setdefault(pet.get("status"), {})[pet["id"]] = None
+
+    def save_pet(self, pet: Dict[str, Any]) -> Dict[str, Any]:
+        """POST/PUT /pet - создает или заменяет питомца"""
+        pet = dict(pet)
+        pet.setdefault("photoUrls", [])
+        pet.setdefault("tags", [])
+        with self._lock:
+            if not pet.get("id"):
+                pet["id"] = next(self._ids)
+            self._index_pet(pet)
+        return pet
+
+    def get_pet(self, pet_id: int) -> Optional[Dict[str, Any]]:
+        return self.pets.get(pet_id)
+
+    def delete_pet(self, pet_id: int) -> bool:
+        with self._lock:
+            pet = self.pets.pop(pet_id, None)
+            if pet is None:
+                return False
+            self.pets_by_status.get(pet.get("status"), {}).pop(pet_id, None)
+            return True
+
+    def find_pets_by_status(self, statuses: List[str]) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [self.pets[pet_id]
+                    for status in statuses
+                    for pet_id in self.pets_by_status.get(status, ())]
+
+    def inventory(self) -> Dict[str, int]:
+        with self._lock:
+            counts = {"available": 0, "pending": 0, "sold": 0}
+            for status, pet_ids in self.pets_by_status.items():
+                if status is not None and pet_ids:
+                    counts[status] = len(pet_ids)
+            return counts
+
+    # === ORDERS ===
+
+    def save_order(self, order: Dict[str, Any]) -> Dict[str, Any]:
+        order = dict(order)
+        order.setdefault("quantity", 0)
+        order.setdefault("complete", False)
+        with self._lock:
+            if not order.get("id"):
+                order["id"] = next(self._ids)
+            self.orders[order["id"]] = order
+        return order
+
+    def get_order(self, order_id: int) -> Optional[Dict[str, Any]]:
+        return self.orders.get(order_id)
+
+    def delete_order(self, order_id: int) -> bool:
+        with self._lock:
+            return self.orders.pop(order_id, None) is not None
+
+    # === USERS ===
+
+    def save_user(self, user: Dict[str, Any], username: Optional[str] = None) -> Dict[str, Any]:
+        user = dict(user)
+        with self._lock:
+            if not user.get("id"):
+                user["id"] = next(self._ids)
+            if username is not None and username != user.get("username"):
+                old = self.users.pop(username, None)
+                if old is not None:
+                    self.users_by_id.pop(old.get("id"), None)
+            self.users[user.get("username")] = user
+            self.users_by_id[user["id"]] = user.get("username")
+        return user
+
+    def get_user(self, username: str) -> Optional[Dict[str, Any]]:
+        return self.users.get(username)
+
+    def delete_user(self, username: str) -> bool:
+        with self._lock:
+            user = self.users.pop(username, None)
+            if user is None:
+                return False
+            self.users_by_id.pop(user.get("id"), None)
+            return True
+
+
+Handler = Callable[..., Tuple[int, Any]]
+
+
+class PetStoreStubApp:
+    """Маршрутизация запросов PetStore API поверх PetStoreState"""
+
+    def __init__(self, state: Optional[PetStoreState] = None):
+        self.state = state or PetStoreState()
+        self.routes: List[Tuple[str, "re.Pattern[str]", Handler]] = []
+        route = self._route
+        route("POST", r"/pet", self.create_pet)
+        route("PUT", r"/pet", self.update_pet)
+        route("GET", r"/pet/findByStatus", self.find_pets_by_status)
+        route("GET", r"/pet/(?P<pet_id>[^/]+)", self.get_pet)
+        route("DELETE", r"/pet/(?P<pet_id>[^/]+)", self.delete_pet)
+        route("GET", r"/store/inventory", self.get_inventory)
+        route("POST", r"/store/order", self.create_order)
+        route("GET", r"/store/order/(?P<order_id>[^/]+)", self.get_order)
+        route("DELETE", r"/store/order/(?P<order_id>[^/]+)", self.delete_order)
+        route("POST", r"/user", self.create_user)
+        route("POST", r"/user/createWithList", self.create_users)
+        route("POST", r"/user/createWithArray", self.create_users)
+        route("GET", r"/user/(?P<username>[^/]+)", self.get_user)
+        route("PUT", r"/user/(?P<username>[^/]+)", self.update_user)
+        route("DELETE", r"/user/(?P<username>[^/]+)", self.delete_user)
+
+    def _route(self, method: str, pattern: str, handler: Handler) -> None:
+        self.routes.append((method, re.compile(f"{BASE_PATH}{pattern}"), handler))
+
+    def handle(self, method: str, target: str, body: bytes) -> Tuple[int, Any]:
+        """Обрабатывает запрос и возвращает (статус, тело для JSON или None)"""
+        parts = urlsplit(target)
+        query = parse_qs(parts.query)
+        path_matched = False
+        for route_method, pattern, handler in self.routes:
+            match = pattern.fullmatch(parts.path)
+            if match is None:
+                continue
+            path_matched = True
+            if route_method != method:
+                continue
+            try:
+                return handler(body=body, query=query, **match.groupdict())
+            except StubError as e:
+                return e.status, e.body
+            except Exception:
+                # Настоящий сервис отвечает 500 с ApiResponse, а не рвет соединение
+                return 500, _api_message(500, "something bad happened")
+        if path_matched:
+            return 405, None
+        return 404, None
+
+    @staticmethod
+    def _json(body: bytes) -> Any:
+        try:
+            return json.loads(body)
+        except ValueError:
+            raise StubError(400, _api_message(400, "bad input"))
+
+    @staticmethod
+    def _object(body: bytes, key: str = "id") -> Dict[str, Any]:
+        """
+        Тело-объект. Поля, по которым заглушка индексирует данные (id, status, username),
+        проверяются сразу: как и Jackson у настоящего сервиса, неверный тип - это 500
+        """
+        data = PetStoreStubApp._json(body)
+        if not isinstance(data, dict):
+            raise StubError(400, _api_message(400, "bad input"))
+        entity_id = data.get("id")
+        if entity_id is not None and (type(entity_id) is not int
+                                      or not INT64_RANGE[0] <= entity_id <= INT64_RANGE[1]):
+            raise StubError(500, _api_message(500, "something bad happened"))
+        for field in ("status", key):
+            if field != "id" and data.get(field) is not None and type(data[field]) is not str:
+                raise StubError(500, _api_message(500, "something bad happened"))
+        return data
+
+    @staticmethod
+    def _int(value: str) -> int:
+        try:
+            return int(value)
+        except ValueError:
+            raise StubError(404, _api_message(404, f'java.lang.NumberFormatException: For input string: "{value}"'))
+
+    # === PET ENDPOINTS ===
+
+    def create_pet(self, body, **_):
+        return 200, self.state.save_pet(self._object(body))
+
+    def update_pet(self, body, **_):
+        return 200, self.state.save_pet(self._object(body))
+
+    def get_pet(self, pet_id, **_):
+        pet = self.state.get_pet(self._int(pet_id))
+        if pet is None:
+            return 404, _api_message(1, "Pet not found", "error")
+        return 200, pet
+
+    def delete_pet(self, pet_id, **_):
+        if not self.state.delete_pet(self._int(pet_id)):
+            return 404, None
+        return 200, _api_message(200, pet_id)
+
+    def find_pets_by_status(self, query, **_):
+        statuses = [s for value in query.get("status", []) for s in value.split(",") if s]
+        return 200, self.state.find_pets_by_status(statuses)
+
+    # === STORE ENDPOINTS ===
+
+    def get_inventory(self, **_):
+        return 200, self.state.inventory()
+
+    def create_order(self, body, **_):
+        return 200, self.state.save_order(self._object(body))
+
+    def get_order(self, order_id, **_):
+        order = self.state.get_order(self._int(order_id))
+        if order is None:
+            return 404, _api_message(1, "Order not found", "error")
+        return 200, order
+
+    def delete_order(self, order_id, **_):
+        if not self.state.delete_order(self._int(order_id)):
+            return 404, _api_message(404, "Order Not Found")
+        return 200, _api_message(200, order_id)
+
+    # === USER ENDPOINTS ===
+
+    def create_user(self, body, **_):
+        user = self.state.save_user(self._object(body, "username"))
+        return 200, _api_message(200, str(user["id"]))
+
+    def create_users(self, body, **_):
+        users = self._json(body)
+        if not isinstance(users, list) or not all(isinstance(user, dict) for user in users):
+            raise StubError(400, _api_message(400, "bad input"))
+        for user in users:
+            self.state.save_user(user)
+        return 200, _api_message(200, "ok")
+
+    def get_user(self, username, **_):
+        user = self.state.get_user(username)
+        if user is None:
+            return 404, _api_message(1, "User not found", "error")
+        return 200, user
+
+    def update_user(self, username, body, **_):
+        user = self.state.save_user(self._object(body, "username"), username=username)
+        return 200, _api_message(200, str(user["id"]))
+
+    def delete_user(self, username, **_):
+        if not self.state.delete_user(username):
+            return 404, None
+        return 200, _api_message(200, username)
+
+
+def _respond(app: PetStoreStubApp, method: str, target: str, body: bytes,
+             if_none_match: Optional[str]) -> Tuple[int, bytes, Optional[str]]:
+    """Ответ заглушки в байтах: (статус, тело, ETag); для GET с совпавшим ETag - 304"""
+    status, payload = app.handle(method, target, body)
+    content = b"" if payload is None else json.dumps(payload).encode()
+    etag = None
+    if method == "GET" and status == 200:
+        etag = f'"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+        if if_none_match == etag:
+            status, content = 304, b""
+    return status, content, etag
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, как у настоящего сервиса
+    disable_nagle_algorithm = True  # иначе заголовки и тело ответа ждут delayed ACK (~40 мс)
+
+    def _dispatch(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, content, etag = _respond(self.server.app, self.command, self.path, body,
+                                         self.headers.get("If-None-Match"))
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        if etag:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+    def log_message(self, format, *args):
+        pass
+
+
+class PetStoreStub:
+    """
+    Локальная заглушка PetStore API в отдельном потоке.
+    По умолчанию слушает случайный свободный порт на 127.0.0.1.
+
+        with PetStoreStub() as stub:
+            api = PetStoreAPI(stub.base_url)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, state: Optional[PetStoreState] = None):
+        self.app = PetStoreStubApp(state)
+        self.state = self.app.state
+        self._server = ThreadingHTTPServer((host, port), _StubRequestHandler)
+        self._server.daemon_threads = True
+        self._server.app = self.app
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    @property
+    def base_url(self) -> str:
+        host = self._server.server_address[0]
+        return f"http://{host}:{self.port}{BASE_PATH}"
+
+    def start(self) -> "PetStoreStub":
+        self._thread = threading.Thread(target=self._server.serve_forever,
+                                        name="petstore-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Обслуживает запросы в текущем потоке до KeyboardInterrupt"""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "PetStoreStub":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class _H2Connection:
+    """
+    Одно HTTP/2 соединение заглушки. Кадры читаются в потоке соединения,
+    запросы выполняются в пуле, поэтому потоки одного соединения обслуживаются
+    параллельно. Состояние h2 и запись в сокет защищены одной блокировкой.
+    """
+
+    def __init__(self, stub: "PetStoreH2Stub", sock: socket.socket):
+        import h2.config
+        import h2.connection
+
+        self.stub = stub
+        self.sock = sock
+        self.conn = h2.connection.H2Connection(
+            h2.config.H2Configuration(client_side=False, header_encoding="utf-8"))
+        self.lock = threading.Lock()
+        self.requests: Dict[int, Tuple[Dict[str, str], List[bytes]]] = {}
+        self.outbound: Dict[int, bytes] = {}  # неотправленные тела, ждут окна flow control
+
+    def serve(self) -> None:
+        import h2.errors
+        import h2.events
+        import h2.exceptions
+
+        with self.lock:
+            self.conn.initiate_connection()
+            self._write()
+        try:
+            while True:
+                data = self.sock.recv(65536)
+                if not data:
+                    break
+                with self.lock:
+                    for event in self.conn.receive_data(data):
+                        if isinstance(event, h2.events.RequestReceived):
+                            self.requests[event.stream_id] = dict(event.headers), []
+                        elif isinstance(event, h2.events.DataReceived):
+                            self.requests[event.stream_id][1].append(event.data)
+                            self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                        elif isinstance(event, h2.events.StreamEnded):
+                            headers, chunks = self.requests.pop(event.stream_id)
+                            self.stub.executor.submit(self._handle, event.stream_id, headers, b"".join(chunks))
+                        elif isinstance(event, h2.events.StreamReset):
+                            self.requests.pop(event.stream_id, None)
+                            self.outbound.pop(event.stream_id, None)
+                        elif isinstance(event, h2.events.ConnectionTerminated):
+                            return
+                    self._flush()
+                    self._write()
+        except h2.exceptions.ProtocolError:
+            with self.lock:
+                self.conn.close_connection(h2.errors.ErrorCodes.PROTOCOL_ERROR)
+                self._write()
+        except OSError:
+            pass
+        finally:
+            self.sock.close()
+
+    def _handle(self, stream_id: int, headers: Dict[str, str], body: bytes) -> None:
+        status, content, etag = _respond(self.stub.app, headers[":method"], headers[":path"], body,
+                                         headers.get("if-none-match"))
+        response_headers = [(":status", str(status)), ("content-type", "application/json"),
+                            ("content-length", str(len(content)))]
+        if etag:
+            response_headers.append(("etag", etag))
+        with self.stub.stats_lock:
+            self.stub.streams += 1
+        with self.lock:
+            try:
+                self.conn.send_headers(stream_id, response_headers, end_stream=not content)
+                if content:
+                    self.outbound[stream_id] = content
+                    self._flush()
+                self._write()
+            except Exception:
+                pass  # клиент сбросил поток или закрыл соединение
+
+    def _flush(self) -> None:
+        """Отправляет тела ответов, сколько позволяют окна flow control"""
+        import h2.exceptions
+
+        for stream_id, data in list(self.outbound.items()):
+            try:
+                while data:
+                    size = min(self.conn.local_flow_control_window(stream_id), self.conn.max_outbound_frame_size)
+                    if size <= 0:
+                        break
+                    self.conn.send_data(stream_id, data[:size])
+                    data = data[size:]
+            except h2.exceptions.StreamClosedError:
+                del self.outbound[stream_id]
+                continue
+            if data:
+                self.outbound[stream_id] = data
+            else:
+                del self.outbound[stream_id]
+                self.conn.end_stream(stream_id)
+
+    def _write(self) -> None:
+        data = self.conn.data_to_send()
+        if data:
+            self.sock.sendall(data)
+
+
+_H2_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+
+def _is_h2(sock: socket.socket) -> bool:
+    """Смотрит (не вычитывая) начало потока: клиент h2c начинает с префейса HTTP/2"""
+    peeked = b""
+    while len(peeked) < len(_H2_PREFACE) and _H2_PREFACE.startswith(peeked):
+        data = sock.recv(len(_H2_PREFACE), socket.MSG_PEEK)
+        if len(data) == len(peeked):
+            return False  # соединение закрыто раньше префейса
+        peeked = data
+    return peeked == _H2_PREFACE
+
+
+class PetStoreH2Stub:
+    """
+    Заглушка PetStore по HTTP/2 без TLS (h2c, prior knowledge) для проверки
+    HTTP2Transport. Требует пакет h2. Соединения без префейса HTTP/2
+    обслуживаются как HTTP/1.1, поэтому обычные клиенты тоже работают.
+    connections и streams - сколько открыто HTTP/2 соединений и обслужено в них запросов.
+
+        with PetStoreH2Stub() as stub:
+            api = PetStoreAPI(stub.base_url, http2=True)
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, state: Optional[PetStoreState] = None,
+                 workers: int = 16):
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            raise ImportError('HTTP/2 stub requires the h2 package: pip install "httpx[http2]"') from None
+        self.app = PetStoreStubApp(state)
+        self.state = self.app.state
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="petstore-h2")
+        self.connections = 0
+        self.streams = 0
+        self.stats_lock = threading.Lock()
+        self._listener = socket.create_server((host, port))
+        self._sockets: List[socket.socket] = []
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self._listener.getsockname()[1]
+
+    @property
+    def base_url(self) -> str:
+        host = self._listener.getsockname()[0]
+        return f"http://{host}:{self.port}{BASE_PATH}"
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                sock, address = self._listener.accept()
+            except OSError:
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._sockets.append(sock)
+            threading.Thread(target=self._serve, args=(sock, address), name="petstore-h2-conn",
+                             daemon=True).start()
+
+    def _serve(self, sock: socket.socket, address) -> None:
+        try:
+            h2 = _is_h2(sock)
+        except OSError:
+            sock.close()
+            return
+        if h2:
+            with self.stats_lock:
+                self.connections += 1
+            _H2Connection(self, sock).serve()
+            return
+        try:
+            _StubRequestHandler(sock, address, self)
+        except OSError:
+            pass
+        finally:
+            sock.close()
+
+    def start(self) -> "PetStoreH2Stub":
+        self._thread = threading.Thread(target=self._accept, name="petstore-h2-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Обслуживает соединения в текущем потоке до KeyboardInterrupt"""
+        try:
+            self._accept()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self) -> None:
+        for sock in [self._listener] + self._sockets:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)  # будит поток в accept/recv
+            except OSError:
+                pass
+            sock.close()
+        if self._thread is not None:
+            self._thread.join()
+        self.executor.shutdown(wait=False)
+
+    def __enter__(self) -> "PetStoreH2Stub":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Локальная заглушка PetStore API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--http2", action="store_true", help="HTTP/2 без TLS (h2c) вместо HTTP/1.1")
+    args = parser.parse_args(argv)
+
+    stub = PetStoreH2Stub(args.host, args.port) if args.http2 else PetStoreStub(args.host, args.port)
+    print(f"PetStore stub listening on {stub.base_url}")
+    stub.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
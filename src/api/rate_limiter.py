@@ -0,0 +1,106 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Разбирает заголовок Retry-After: число секунд или HTTP-дата.
+    Возвращает задержку в секундах или None, если заголовок отсутствует или некорректен.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max((moment - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RateLimiter:
+    """
+    Адаптивный token bucket для клиентских запросов.
+    Один экземпляр можно разделять между клиентами и потоками.
+
+    rate - запросов в секунду (None - без ограничения, ждем только когда сервер
+    отвечает 429), burst - размер корзины. После 429 лимитер делает паузу на
+    Retry-After (или экспоненциально растущую паузу, если заголовка нет) и вдвое
+    снижает текущую скорость, а успешные ответы постепенно возвращают ее к rate.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst: int = 1,
+                 min_rate: float = 0.5, backoff: float = 0.5, max_backoff: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive or None")
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._current_rate = rate
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._paused_until = 0.0
+        self._consecutive_throttles = 0
+        self.throttled = 0
+        self.waited = 0.0
+
+    @property
+    def current_rate(self) -> Optional[float]:
+        """Скорость с учетом адаптивного снижения после 429"""
+        return self._current_rate
+
+    def acquire(self) -> float:
+        """Ждет разрешения на запрос и возвращает время ожидания в секундах"""
+        with self._lock:
+            now = self._clock()
+            wait = max(self._paused_until - now, 0.0)
+            if self._current_rate is not None:
+                elapsed = now - self._updated
+                self._tokens = min(float(self.burst), self._tokens + elapsed * self._current_rate)
+                # Токен резервируется сразу, поэтому параллельные вызовы встают в очередь
+                self._tokens -= 1
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens / self._current_rate)
+            self._updated = now
+            self.waited += wait
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def on_throttle(self, retry_after: Optional[str] = None) -> float:
+        """Учитывает ответ 429 и возвращает назначенную паузу в секундах"""
+        with self._lock:
+            self.throttled += 1
+            self._consecutive_throttles += 1
+            delay = parse_retry_after(retry_after)
+            if delay is None:
+                delay = min(self.backoff * 2 ** (self._consecutive_throttles - 1), self.max_backoff)
+            self._paused_until = max(self._paused_until, self._clock() + delay)
+            if self._current_rate is not None:
+                self._current_rate = max(self._current_rate / 2, self.min_rate)
+                self._tokens = min(self._tokens, 0.0)
+            return delay
+
+    def on_success(self) -> None:
+        """Учитывает успешный ответ: аддитивно возвращает скорость к настроенной"""
+        with self._lock:
+            self._consecutive_throttles = 0
+            if self._current_rate is not None and self._current_rate < self.rate:
+                self._current_rate = min(self._current_rate + self.rate / 10, self.rate)
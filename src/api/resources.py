@@ -0,0 +1,116 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import requests
+
+
+PETS = "pet"
+ORDERS = "order"
+USERS = "user"
+
+# Заказы ссылаются на питомцев, поэтому удаляются первыми
+TEARDOWN_ORDER = (ORDERS, PETS, USERS)
+
+_DELETE_PREFIXES = {"/pet/": PETS, "/store/order/": ORDERS, "/user/": USERS}
+_DELETERS = {
+    PETS: lambda client, key: client.delete_pet(key),
+    ORDERS: lambda client, key: client.delete_order(key),
+    USERS: lambda client, key: client.delete_user(key),
+}
+
+
+def _entity_id(body: Any, response: requests.Response) -> Optional[str]:
+    """id из тела запроса, а если его нет (сервер назначает сам) - из ответа"""
+    entity_id = body.get("id") if isinstance(body, dict) else None
+    if not entity_id:
+        try:
+            data = response.json()
+        except ValueError:
+            return None
+        entity_id = data.get("id") if isinstance(data, dict) else None
+    return str(entity_id) if entity_id else None
+
+
+class ResourceTracker:
+    """
+    Учет сущностей, созданных через PetStoreAPI.
+
+    Клиент передает в observe каждый успешный POST/PUT /pet, POST /store/order,
+    POST /user и createWithList/createWithArray; DELETE снимает сущность с учета.
+    cleanup удаляет все, что осталось, параллельно и с ограничением числа потоков.
+    Ключи хранятся строками в том виде, в котором попадают в путь запроса.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._created: Dict[str, Dict[str, None]] = {kind: {} for kind in TEARDOWN_ORDER}
+
+    def __len__(self) -> int:
+        return sum(len(keys) for keys in self._created.values())
+
+    def track(self, kind: str, key: Union[int, str]) -> None:
+        with self._lock:
+            self._created[kind][str(key)] = None
+
+    def forget(self, kind: str, key: Union[int, str]) -> None:
+        with self._lock:
+            self._created[kind].pop(str(key), None)
+
+    def pending(self) -> Dict[str, List[str]]:
+        """Сущности на учете по типам, в порядке создания"""
+        with self._lock:
+            return {kind: list(keys) for kind, keys in self._created.items()}
+
+    def observe(self, method: str, endpoint: str, body: Any, response: requests.Response) -> None:
+        """Учитывает результат записывающего запроса клиента"""
+        method = method.upper()
+        path = endpoint.split("?", 1)[0]
+        if method == "DELETE":
+            if response.status_code < 400 or response.status_code == 404:
+                for prefix, kind in _DELETE_PREFIXES.items():
+                    if path.startswith(prefix):
+                        self.forget(kind, path[len(prefix):])
+                        break
+            return
+        if response.status_code >= 400:
+            return
+        if path == "/pet" and method in ("POST", "PUT"):
+            pet_id = _entity_id(body, response)
+            if pet_id is not None:
+                self.track(PETS, pet_id)
+        elif path == "/store/order" and method == "POST":
+            order_id = _entity_id(body, response)
+            if order_id is not None:
+                self.track(ORDERS, order_id)
+        elif method == "POST" and path in ("/user", "/user/createWithList", "/user/createWithArray"):
+            users = body if isinstance(body, list) else [body]
+            for user in users:
+                if isinstance(user, dict) and user.get("username"):
+                    self.track(USERS, user["username"])
+
+    def cleanup(self, client, concurrency: int = 8) -> List[Tuple[str, str, Union[int, BaseException]]]:
+        """
+        Удаляет все сущности на учете: сначала заказы, затем питомцев и пользователей,
+        внутри каждого типа - до concurrency запросов одновременно. 404 считается успехом.
+        Возвращает неудачи в виде (тип, ключ, статус или исключение); они остаются на учете.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        failures = []
+
+        def delete(kind: str, key: str) -> Optional[Tuple[str, str, Union[int, BaseException]]]:
+            try:
+                status = _DELETERS[kind](client, key).status_code
+            except requests.exceptions.RequestException as e:
+                return kind, key, e
+            if status < 400 or status == 404:
+                self.forget(kind, key)
+                return None
+            return kind, key, status
+
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cleanup") as executor:
+            for kind, keys in self.pending().items():
+                results = executor.map(lambda key: delete(kind, key), keys)
+                failures.extend(result for result in results if result is not None)
+        return failures
@@ -0,0 +1,162 @@
+import random
+import threading
+import time
+from typing import Callable, Collection, Optional, Tuple
+
+import requests
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Предохранитель разомкнут: backend недоступен, запрос не отправлялся"""
+
+
+class DeadlineExceeded(requests.exceptions.Timeout):
+    """Исчерпан общий лимит времени на вызов, повторять бессмысленно"""
+
+
+class CircuitBreaker:
+    """
+    Предохранитель для всех запросов клиента (или нескольких клиентов).
+
+    После failure_threshold подряд неудачных запросов (сетевая ошибка или 5xx)
+    размыкается и reset_timeout секунд сразу отклоняет вызовы с CircuitOpenError.
+    Затем пропускает один пробный запрос: успех замыкает цепь, неудача снова размыкает.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.state = self.CLOSED
+        self.rejected = 0
+
+    def before_call(self) -> None:
+        """Пропускает вызов или выбрасывает CircuitOpenError"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            if self.state == self.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            self.rejected += 1
+            raise CircuitOpenError(f"circuit open after {self._failures} consecutive failures")
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._trial_in_flight = False
+            self.state = self.CLOSED
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = self._clock()
+
+
+class RetryPolicy:
+    """
+    Политика повторов с ограниченной экспоненциальной паузой, full jitter и общим дедлайном.
+
+    Повторяются только идемпотентные вызовы: GET/HEAD/OPTIONS, а также PUT и DELETE
+    (в т.ч. /pet/{petId}, /user/{username}, /store/order/{orderId}). POST не
+    повторяется (POST /store/order создал бы заказ дважды), кроме эндпоинтов из
+    idempotent_endpoints; non_idempotent_endpoints запрещает повторы явно.
+    Ошибку установления соединения (ConnectTimeout) можно повторять для любого метода:
+    запрос до сервера не дошел.
+    """
+
+    def __init__(self, max_attempts: int = 3, backoff: float = 0.1, max_backoff: float = 2.0,
+                 deadline: Optional[float] = 15.0,
+                 retry_statuses: Collection[int] = (500, 502, 503, 504),
+                 idempotent_methods: Collection[str] = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE"),
+                 idempotent_endpoints: Collection[Tuple[str, str]] = (),
+                 non_idempotent_endpoints: Collection[Tuple[str, str]] = (),
+                 rng: Optional[random.Random] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_methods = frozenset(m.upper() for m in idempotent_methods)
+        self.idempotent_endpoints = frozenset((m.upper(), t) for m, t in idempotent_endpoints)
+        self.non_idempotent_endpoints = frozenset((m.upper(), t) for m, t in non_idempotent_endpoints)
+        self._rng = rng or random.Random()
+        self._clock = clock
+        self._sleep = sleep
+
+    def is_idempotent(self, method: str, template: str) -> bool:
+        key = (method.upper(), template)
+        if key in self.non_idempotent_endpoints:
+            return False
+        return key in self.idempotent_endpoints or key[0] in self.idempotent_methods
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Пауза перед попыткой attempt + 1: случайная в [0, min(max_backoff, backoff * 2^(attempt-1))]"""
+        return self._rng.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+    def _retryable_error(self, method: str, template: str, error: Exception) -> bool:
+        if isinstance(error, (CircuitOpenError, DeadlineExceeded)):
+            return False
+        if isinstance(error, requests.exceptions.ConnectTimeout):
+            return True
+        return (self.is_idempotent(method, template) and
+                isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)))
+
+    def call(self, method: str, template: str, send: Callable[[], requests.Response],
+             breaker: Optional[CircuitBreaker] = None) -> requests.Response:
+        """Выполняет send с повторами по политике и учетом предохранителя"""
+        deadline = self._clock() + self.deadline if self.deadline is not None else None
+        attempt = 0
+        while True:
+            attempt += 1
+            if breaker is not None:
+                breaker.before_call()
+            try:
+                response = send()
+            except requests.exceptions.RequestException as e:
+                if breaker is not None:
+                    breaker.record_failure()
+                if not self._retryable_error(method, template, e) or not self._wait(attempt, deadline):
+                    raise
+                continue
+            if breaker is not None:
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+            if (response.status_code not in self.retry_statuses
+                    or not self.is_idempotent(method, template)
+                    or not self._wait(attempt, deadline)):
+                return response
+            if response.raw is not None:
+                response.close()  # освобождаем соединение перед повтором
+
+    def _wait(self, attempt: int, deadline: Optional[float]) -> bool:
+        """Ждет перед следующей попыткой; False, если попытки или время исчерпаны"""
+        if attempt >= self.max_attempts:
+            return False
+        delay = self.backoff_delay(attempt)
+        if deadline is not None and self._clock() + delay >= deadline:
+            return False
+        self._sleep(delay)
+        return True
@@ -0,0 +1,93 @@
+import socket
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+
+DEFAULT_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+}
+
+
+def tcp_keepalive_options(idle: float, interval: float = 10, count: int = 3) -> List[Tuple[int, int, int]]:
+    """
+    Опции сокета urllib3 с TCP keep-alive: простаивающее соединение проверяется
+    через idle секунд, чтобы разорванные NAT/балансировщиком сокеты не зависали в пуле.
+    """
+    options = list(HTTPConnection.default_socket_options)  # TCP_NODELAY
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # TCP_KEEPIDLE и т.п. есть не на всех платформах
+    for name, value in (("TCP_KEEPIDLE", idle), ("TCP_KEEPINTVL", interval), ("TCP_KEEPCNT", count)):
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), max(int(value), 1)))
+    return options
+
+
+class PooledAdapter(HTTPAdapter):
+    """HTTPAdapter с настраиваемыми опциями сокета для пула соединений"""
+
+    def __init__(self, socket_options: Optional[List[Tuple[int, int, int]]] = None, **kwargs):
+        self.socket_options = socket_options
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.socket_options is not None:
+            pool_kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+
+def mount_pool(session: requests.Session, pool_connections: int = 10, pool_maxsize: int = 10,
+               pool_block: bool = False, tcp_keepalive: Optional[float] = None) -> None:
+    """
+    Подключает к сессии пул: pool_connections - сколько хостов держать в кэше,
+    pool_maxsize - сколько соединений на хост, pool_block - ждать свободное
+    соединение вместо открытия лишнего сокета сверх лимита.
+    """
+    if pool_connections < 1 or pool_maxsize < 1:
+        raise ValueError("pool_connections and pool_maxsize must be >= 1")
+    adapter = PooledAdapter(
+        socket_options=tcp_keepalive_options(tcp_keepalive) if tcp_keepalive else None,
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+
+def build_session(pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                  keep_alive: bool = True, tcp_keepalive: Optional[float] = None) -> requests.Session:
+    """Сессия с JSON-заголовками и настроенным пулом; keep_alive=False закрывает соединение после ответа"""
+    session = requests.Session()
+    session.headers.update(DEFAULT_HEADERS)
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+    mount_pool(session, pool_connections, pool_maxsize, pool_block, tcp_keepalive)
+    return session
+
+
+_shared_sessions: Dict[tuple, requests.Session] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_session(pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                   keep_alive: bool = True, tcp_keepalive: Optional[float] = None) -> requests.Session:
+    """
+    Общая на процесс сессия для набора настроек пула: клиенты с одинаковыми
+    настройками переиспользуют уже открытые (прогретые) соединения.
+    """
+    key = (pool_connections, pool_maxsize, pool_block, keep_alive, tcp_keepalive)
+    with _shared_lock:
+        session = _shared_sessions.get(key)
+        if session is None:
+            session = _shared_sessions[key] = build_session(*key)
+        return session
+
+
+def close_shared_sessions() -> None:
+    """Закрывает все общие сессии (например, в конце тестовой сессии)"""
+    with _shared_lock:
+        for session in _shared_sessions.values():
+            session.close()
+        _shared_sessions.clear()
@@ -0,0 +1,82 @@
+import codecs
+import json
+from typing import Any, Iterable, Iterator
+
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+_decoder = json.JSONDecoder()
+
+
+class StreamingJSONError(ValueError):
+    """Поток не является корректным JSON-массивом"""
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: str = "utf-8") -> Iterator[Any]:
+    """
+    Инкрементально разбирает JSON-массив верхнего уровня из потока байтов
+    и отдает элементы по одному, не держа в памяти весь документ.
+    В буфере хранится только еще не разобранный хвост.
+    """
+    text_decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ""
+    pos = 0
+    started = False
+    finished = False
+    expect_value = True  # ожидаем элемент (после "[" или ",")
+    items = 0
+    chunks = iter(chunks)
+    eof = False
+
+    while not finished:
+        # Пропускаем пробелы и разделители, пока в буфере есть данные
+        while pos < len(buffer):
+            char = buffer[pos]
+            if char in _WHITESPACE:
+                pos += 1
+            elif not started:
+                if char != "[":
+                    raise StreamingJSONError(f"expected '[' at start of stream, got {char!r}")
+                started = True
+                pos += 1
+            elif char == "]" and (not expect_value or items == 0):
+                finished = True
+                pos += 1
+                break
+            elif char == "," and not expect_value:
+                expect_value = True
+                pos += 1
+            elif expect_value:
+                try:
+                    value, end = _decoder.raw_decode(buffer, pos)
+                except ValueError as e:
+                    if eof:
+                        raise StreamingJSONError(str(e)) from None
+                    break  # элемент еще не докачан
+                if isinstance(value, (int, float)) and not eof and (
+                        end == len(buffer) or buffer[end] not in _DELIMITERS):
+                    break  # число могло оборваться на границе чанка ("12" из "123", "1." из "1.5")
+                pos = end
+                expect_value = False
+                items += 1
+                yield value
+            else:
+                raise StreamingJSONError(f"unexpected {char!r} in array")
+        if finished:
+            break
+        if eof:
+            raise StreamingJSONError("unexpected end of stream")
+
+        buffer = buffer[pos:]
+        pos = 0
+        try:
+            buffer += text_decoder.decode(next(chunks))
+        except StopIteration:
+            buffer += text_decoder.decode(b"", final=True)
+            eof = True
+
+    trailing = buffer[pos:].strip()
+    for chunk in chunks:
+        trailing += text_decoder.decode(chunk).strip()
+    if trailing:
+        raise StreamingJSONError("unexpected data after array")
@@ -0,0 +1,164 @@
+import hashlib
+import json
+import mmap
+import os
+import threading
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class Transport:
+    """
+    Транспорт PetStoreAPI: отправляет запрос и возвращает requests.Response.
+    Параметры send совпадают с requests.Session.request.
+    """
+
+    def send(self, method: str, url: str, **kwargs) -> requests.Response:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class SessionTransport(Transport):
+    """Транспорт по умолчанию поверх requests.Session"""
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+
+    def send(self, method: str, url: str, **kwargs) -> requests.Response:
+        return self.session.request(method, url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class CassetteMiss(requests.exceptions.RequestException):
+    """В кассете нет записи для запроса"""
+
+
+def request_key(method: str, url: str, json_body: Any = None, data: Any = None) -> str:
+    """
+    Ключ запроса в кассете: метод, путь с query (без хоста и порта) и хэш
+    нормализованного тела (JSON с отсортированными ключами).
+    """
+    parts = urlsplit(url)
+    target = parts.path + (f"?{parts.query}" if parts.query else "")
+    if json_body is not None:
+        body = json.dumps(json_body, sort_keys=True, separators=(",", ":")).encode()
+    elif isinstance(data, str):
+        body = data.encode()
+    elif isinstance(data, bytes):
+        body = data
+    else:
+        body = b""
+    digest = hashlib.blake2b(body, digest_size=8).hexdigest() if body else "-"
+    return f"{method.upper()} {target} {digest}"
+
+
+# Формат кассеты: строка MAGIC, затем записи вида
+#   <key>\t<status>\t<длина заголовков>\t<длина тела>\n<заголовки JSON><тело>
+MAGIC = b"PETSTORE-CASSETTE 1\n"
+
+
+class CassetteWriter:
+    """Кассета для записи; один экземпляр можно разделять между клиентами и потоками"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+
+    def write(self, key: str, response: requests.Response) -> None:
+        headers = json.dumps(dict(response.headers), separators=(",", ":")).encode()
+        body = response.content  # при stream=True тело читается целиком, иначе его не записать
+        record = f"{key}\t{response.status_code}\t{len(headers)}\t{len(body)}\n".encode()
+        with self._lock:
+            self._file.write(record + headers + body)
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class RecordingTransport(Transport):
+    """Пропускает запросы через inner и дописывает пары запрос/ответ в кассету"""
+
+    def __init__(self, inner: Transport, cassette: CassetteWriter):
+        self.inner = inner
+        self.cassette = cassette
+
+    def send(self, method: str, url: str, **kwargs) -> requests.Response:
+        response = self.inner.send(method, url, **kwargs)
+        self.cassette.write(request_key(method, url, kwargs.get("json"), kwargs.get("data")), response)
+        return response
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class ReplayTransport(Transport):
+    """
+    Отдает ответы из кассеты без сети.
+    Файл отображается в память (mmap), при открытии строится только индекс
+    ключ -> смещения записей; тела читаются из отображения при выдаче.
+    Повторяющиеся запросы получают записанные ответы по порядку,
+    после исчерпания - последний из них.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._index: Dict[str, List[Tuple[int, int, int, int]]] = {}
+        self._served: Dict[str, int] = {}
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a PetStore cassette")
+        self._build_index()
+
+    def _build_index(self) -> None:
+        data = self._map
+        pos = len(MAGIC)
+        while pos < len(data):
+            end = data.find(b"\n", pos)
+            key, status, headers_len, body_len = data[pos:end].decode().split("\t")
+            start = end + 1
+            self._index.setdefault(key, []).append((int(status), start, int(headers_len), int(body_len)))
+            pos = start + int(headers_len) + int(body_len)
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self._index.values())
+
+    def send(self, method: str, url: str, **kwargs) -> requests.Response:
+        key = request_key(method, url, kwargs.get("json"), kwargs.get("data"))
+        with self._lock:
+            records = self._index.get(key)
+            if not records:
+                raise CassetteMiss(f"no cassette record for {key}")
+            served = self._served.get(key, 0)
+            self._served[key] = served + 1
+        status, start, headers_len, body_len = records[min(served, len(records) - 1)]
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(json.loads(self._map[start:start + headers_len]))
+        response._content = bytes(self._map[start + headers_len:start + headers_len + body_len])
+        response._content_consumed = True
+        response.encoding = "utf-8"
+        response.url = url
+        response.elapsed = timedelta(0)
+        response.request = requests.Request(method.upper(), url, headers=kwargs.get("headers"),
+                                            json=kwargs.get("json"), data=kwargs.get("data")).prepare()
+        return response
+
+    def close(self) -> None:
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
@@ -0,0 +1,260 @@
+import argparse
+import gc
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from src.api.petstore_api import LOG_MODES, LOG_OFF, PetStoreAPI
+from src.api.petstore_stub import PetStoreStubApp
+
+
+BASE_URL = "http://bench.invalid/v2"
+DEFAULT_BASELINE = "benchmarks/baseline.json"
+
+
+class CannedAdapter(BaseAdapter):
+    """
+    Адаптер requests без сети: на каждый запрос отдает заранее сериализованный ответ.
+    Подготовка запроса (URL, заголовки, JSON тела) проходит через requests как обычно,
+    поэтому замер включает все расходы клиента, кроме сокета и сервера.
+    """
+
+    def __init__(self, status: int = 200, body: bytes = b""):
+        super().__init__()
+        self.status = status
+        self.body = body
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        response = requests.Response()
+        response.status_code = self.status
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json",
+                                                "Content-Length": str(len(self.body))})
+        response.raw = io.BytesIO(self.body)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+class Case:
+    """Один замер: вызов метода клиента и запрос, по которому заглушка готовит ответ"""
+
+    def __init__(self, name: str, call: Callable[[PetStoreAPI], Any], method: str, target: str,
+                 body: Any = None):
+        self.name = name
+        self.call = call
+        self.method = method
+        self.target = target
+        self.body = body
+
+
+def _pet(pet_id: int, status: str = "available") -> Dict[str, Any]:
+    return {"id": pet_id, "category": {"id": 1, "name": "dogs"}, "name": f"BenchPet{pet_id}",
+            "photoUrls": ["https://example.com/photo.jpg"], "tags": [{"id": 1, "name": "bench"}],
+            "status": status}
+
+
+def _user(user_id: int) -> Dict[str, Any]:
+    return {"id": user_id, "username": f"bench{user_id}", "firstName": "Bench", "lastName": "User",
+            "email": f"bench{user_id}@example.com", "password": "password123",
+            "phone": "123-456-7890", "userStatus": 1}
+
+
+PET = _pet(1)
+ORDER = {"id": 1, "petId": 1, "quantity": 1, "shipDate": "2023-12-01T10:00:00.000Z",
+         "status": "placed", "complete": True}
+USER = _user(1)
+USERS_100 = [_user(i) for i in range(100, 200)]
+LARGE_STATUS_COUNT = 10_000
+
+
+def default_cases() -> List[Case]:
+    """Все методы эндпоинтов; findByStatus - на 10 и на 10 000 питомцев"""
+    return [
+        Case("create_pet", lambda c: c.create_pet(PET), "POST", "/pet", PET),
+        Case("get_pet_by_id", lambda c: c.get_pet_by_id(1).json(), "GET", "/pet/1"),
+        Case("update_pet", lambda c: c.update_pet(PET), "PUT", "/pet", PET),
+        Case("find_pets_by_status_10", lambda c: c.find_pets_by_status("pending").json(),
+             "GET", "/pet/findByStatus?status=pending"),
+        Case("find_pets_by_status_10k", lambda c: c.find_pets_by_status("available").json(),
+             "GET", "/pet/findByStatus?status=available"),
+        Case("iter_pets_by_status_10k", lambda c: sum(1 for _ in c.iter_pets_by_status("available")),
+             "GET", "/pet/findByStatus?status=available"),
+        Case("find_pet_models_by_status_10k", lambda c: c.find_pet_models_by_status("available"),
+             "GET", "/pet/findByStatus?status=available"),
+        Case("get_inventory", lambda c: c.get_inventory().json(), "GET", "/store/inventory"),
+        Case("create_order", lambda c: c.create_order(ORDER), "POST", "/store/order", ORDER),
+        Case("get_order_by_id", lambda c: c.get_order_by_id(1).json(), "GET", "/store/order/1"),
+        Case("create_user", lambda c: c.create_user(USER), "POST", "/user", USER),
+        Case("get_user_by_username", lambda c: c.get_user_by_username("bench1").json(),
+             "GET", "/user/bench1"),
+        Case("update_user", lambda c: c.update_user("bench1", USER), "PUT", "/user/bench1", USER),
+        Case("create_users_with_list_100", lambda c: c.create_users_with_list(USERS_100),
+             "POST", "/user/createWithList", USERS_100),
+        Case("delete_order", lambda c: c.delete_order(1), "DELETE", "/store/order/1"),
+        Case("delete_pet", lambda c: c.delete_pet(1), "DELETE", "/pet/1"),
+        Case("delete_user", lambda c: c.delete_user("bench1"), "DELETE", "/user/bench1"),
+    ]
+
+
+def render_responses(cases: List[Case]) -> Dict[str, Tuple[int, bytes]]:
+    """
+    Прогоняет запросы через PetStoreStubApp один раз и запоминает сериализованные ответы.
+    Порядок кейсов важен: удаления идут последними, пока сущности еще существуют.
+    """
+    app = PetStoreStubApp()
+    app.state.save_pet(PET)
+    for i in range(LARGE_STATUS_COUNT):
+        app.state.save_pet(_pet(1000 + i))
+    for i in range(10):
+        app.state.save_pet(_pet(100 + i, "pending"))
+    app.state.save_order(ORDER)
+    app.state.save_user(USER)
+
+    rendered = {}
+    for case in cases:
+        body = json.dumps(case.body).encode() if case.body is not None else b""
+        status, payload = app.handle(case.method, f"/v2{case.target}", body)
+        rendered[case.name] = status, json.dumps(payload).encode() if payload is not None else b""
+    return rendered
+
+
+def _timed(func: Callable[[], Any], number: int) -> float:
+    started = time.perf_counter()
+    for _ in range(number):
+        func()
+    return time.perf_counter() - started
+
+
+def measure(func: Callable[[], Any], min_time: float = 0.2, repeat: int = 3,
+            alloc_samples: int = 5) -> Dict[str, float]:
+    """
+    ops/sec - лучший из repeat прогонов по number вызовов, где number подобран так,
+    чтобы прогон длился не меньше min_time. alloc_kib - средний пик памяти Python
+    (tracemalloc) за один вызов сверх уже занятой.
+    """
+    func()  # прогрев: ленивые импорты, кэши requests
+    number = 1
+    while True:
+        elapsed = _timed(func, number)
+        if elapsed >= min_time / 4 or number >= 1_000_000:
+            break
+        number *= 2 if elapsed * 2 >= min_time / 4 else 4
+    number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+
+    gc.collect()
+    best = min(_timed(func, number) for _ in range(repeat))
+
+    tracemalloc.start()
+    try:
+        peaks = []
+        for _ in range(alloc_samples):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+    finally:
+        tracemalloc.stop()
+    return {"ops_per_sec": number / best, "us_per_op": best / number * 1e6,
+            "alloc_kib": sum(peaks) / len(peaks) / 1024}
+
+
+def run(cases: Optional[List[Case]] = None, min_time: float = 0.2, repeat: int = 3,
+        log_mode: str = LOG_OFF, only: Optional[List[str]] = None) -> Dict[str, Dict[str, float]]:
+    """Замеряет кейсы и возвращает {имя: {ops_per_sec, us_per_op, alloc_kib}}"""
+    cases = cases or default_cases()
+    rendered = render_responses(cases)
+    adapter = CannedAdapter()
+    client = PetStoreAPI(BASE_URL, log_mode=log_mode)
+    client.session.mount("http://", adapter)
+
+    results = {}
+    for case in cases:
+        if only and case.name not in only:
+            continue
+        adapter.status, adapter.body = rendered[case.name]
+        results[case.name] = measure(lambda: case.call(client), min_time, repeat)
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            tolerance: float = 0.3) -> List[str]:
+    """Регрессии относительно baseline: ops/sec ниже или память выше больше чем на tolerance"""
+    regressions = []
+    for name, row in sorted(results.items()):
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if row["ops_per_sec"] < base["ops_per_sec"] * (1 - tolerance):
+            regressions.append(f"{name}: {row['ops_per_sec']:.0f} ops/s vs baseline {base['ops_per_sec']:.0f}")
+        if row["alloc_kib"] > base["alloc_kib"] * (1 + tolerance) + 1:
+            regressions.append(f"{name}: {row['alloc_kib']:.1f} KiB/op vs baseline {base['alloc_kib']:.1f}")
+    return regressions
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, float]]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(path: str, results: Dict[str, Dict[str, float]]) -> None:
+    data = {"python": sys.version.split()[0], "platform": platform.platform(),
+            "requests": requests.__version__, "results": results}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def report(results: Dict[str, Dict[str, float]],
+           baseline: Optional[Dict[str, Dict[str, float]]] = None) -> str:
+    lines = [f"{'case':<32}{'ops/s':>11}{'us/op':>11}{'KiB/op':>10}{'vs base':>10}"]
+    for name, row in results.items():
+        delta = ""
+        if baseline and name in baseline:
+            delta = f"{(row['ops_per_sec'] / baseline[name]['ops_per_sec'] - 1) * 100:+.1f}%"
+        lines.append(f"{name:<32}{row['ops_per_sec']:>11.0f}{row['us_per_op']:>11.1f}"
+                     f"{row['alloc_kib']:>10.1f}{delta:>10}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Накладные расходы PetStoreAPI без сети и сервера")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="файл с базовыми результатами")
+    parser.add_argument("--save", action="store_true", help="записать результаты как новый baseline")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="допустимое ухудшение, доля")
+    parser.add_argument("--min-time", type=float, default=0.2, help="секунд на один прогон кейса")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--log-mode", choices=LOG_MODES, default=LOG_OFF)
+    parser.add_argument("--case", action="append", help="замерить только этот кейс (можно несколько)")
+    args = parser.parse_args(argv)
+
+    results = run(min_time=args.min_time, repeat=args.repeat, log_mode=args.log_mode, only=args.case)
+    if args.save:
+        save_baseline(args.baseline, results)
+        print(report(results))
+        return 0
+    try:
+        baseline = load_baseline(args.baseline)
+    except FileNotFoundError:
+        baseline = None
+    print(report(results, baseline))
+    regressions = compare(results, baseline, args.tolerance) if baseline else []
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
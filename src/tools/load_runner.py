@@ -0,0 +1,239 @@
+import argparse
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+from src.api.id_allocator import IdAllocator
+from src.api.metrics import LatencyHistogram
+from src.api.petstore_api import PetStoreAPI
+from src.api.petstore_stub import PetStoreStub
+
+
+STATUSES = ("available", "pending", "sold")
+
+DEFAULT_MIX = {
+    "get_pet_by_id": 60,
+    "find_pets_by_status": 20,
+    "create_order": 10,
+    "create_user": 10,
+}
+
+
+class LoadContext:
+    """Общее состояние сценария: клиент, генератор id и заранее созданные питомцы"""
+
+    def __init__(self, client: PetStoreAPI, allocator: IdAllocator, seed: Optional[int] = None):
+        self.client = client
+        self.allocator = allocator
+        self.pet_ids: List[int] = []
+        self._seed = seed
+        self._local = threading.local()
+
+    @property
+    def rng(self) -> random.Random:
+        """Собственный генератор случайных чисел у каждого потока"""
+        rng = getattr(self._local, "rng", None)
+        if rng is None:
+            seed = None if self._seed is None else f"{self._seed}-{threading.current_thread().name}"
+            rng = self._local.rng = random.Random(seed)
+        return rng
+
+    def seed_pets(self, count: int) -> None:
+        """Создает питомцев, которых затем читает get_pet_by_id"""
+        for i in range(count):
+            pet_id = self.allocator.next_id()
+            self.client.create_pet({"id": pet_id, "name": f"LoadPet{i}", "photoUrls": [],
+                                    "status": STATUSES[i % len(STATUSES)]})
+            self.pet_ids.append(pet_id)
+
+    def random_pet_id(self) -> int:
+        return self.rng.choice(self.pet_ids) if self.pet_ids else self.allocator.next_id()
+
+
+def _create_order(ctx: LoadContext) -> requests.Response:
+    return ctx.client.create_order({"id": ctx.allocator.next_id(), "petId": ctx.random_pet_id(),
+                                    "quantity": 1, "status": "placed", "complete": False})
+
+
+def _create_user(ctx: LoadContext) -> requests.Response:
+    user_id = ctx.allocator.next_id()
+    return ctx.client.create_user({"id": user_id, "username": f"loaduser{user_id}",
+                                   "firstName": "Load", "lastName": "User",
+                                   "email": f"load{user_id}@example.com",
+                                   "password": "password123", "userStatus": 1})
+
+
+OPERATIONS: Dict[str, Callable[[LoadContext], requests.Response]] = {
+    "get_pet_by_id": lambda ctx: ctx.client.get_pet_by_id(ctx.random_pet_id()),
+    "find_pets_by_status": lambda ctx: ctx.client.find_pets_by_status(ctx.rng.choice(STATUSES)),
+    "get_inventory": lambda ctx: ctx.client.get_inventory(),
+    "create_pet": lambda ctx: ctx.client.create_pet({"id": ctx.allocator.next_id(), "name": "LoadPet",
+                                                     "photoUrls": [], "status": "available"}),
+    "create_order": _create_order,
+    "create_user": _create_user,
+}
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """Разбирает смесь вида "get_pet_by_id=60,create_user=40" """
+    mix = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation {name!r}, expected one of {sorted(OPERATIONS)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+class EndpointStats:
+    """Статистика по одной операции"""
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, ok: bool) -> None:
+        self.histogram.record(latency)
+        if not ok:
+            with self._lock:
+                self.errors += 1
+
+
+class LoadResult:
+    """Итоги прогона: статистика по операциям и фактическая длительность"""
+
+    def __init__(self, stats: Dict[str, EndpointStats], duration: float):
+        self.stats = stats
+        self.duration = duration
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        result = {}
+        for name, stats in self.stats.items():
+            row = stats.histogram.summary()
+            row["rps"] = row["count"] / self.duration if self.duration else 0.0
+            row["error_rate"] = stats.errors / row["count"] if row["count"] else 0.0
+            result[name] = row
+        return result
+
+    def report(self) -> str:
+        lines = [f"{'operation':<22}{'count':>8}{'rps':>9}{'err%':>7}"
+                 f"{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}"]
+        for name, row in sorted(self.summary().items()):
+            lines.append(f"{name:<22}{row['count']:>8}{row['rps']:>9.1f}{row['error_rate'] * 100:>7.2f}"
+                         f"{row['p50_ms']:>9.2f}{row['p90_ms']:>9.2f}{row['p99_ms']:>9.2f}{row['max_ms']:>9.2f}")
+        return "\n".join(lines)
+
+
+class LoadRunner:
+    """
+    Генератор нагрузки на PetStoreAPI со взвешенной смесью операций.
+
+    Открытая модель (run_open_loop) отправляет запросы с фиксированной частотой
+    независимо от ответов; задержка считается от запланированного момента
+    отправки, поэтому очередь перед насыщенным сервером попадает в перцентили.
+    Закрытая модель (run_closed_loop) - N виртуальных пользователей,
+    каждый отправляет следующий запрос после ответа на предыдущий.
+    """
+
+    def __init__(self, client: PetStoreAPI, mix: Optional[Dict[str, float]] = None,
+                 seed: Optional[int] = None, allocator: Optional[IdAllocator] = None):
+        self.mix = dict(mix or DEFAULT_MIX)
+        self.ctx = LoadContext(client, allocator or IdAllocator(), seed)
+        self._names = list(self.mix)
+        self._weights = [self.mix[name] for name in self._names]
+        self.stats = {name: EndpointStats() for name in self._names}
+
+    def _pick(self, rng: random.Random) -> str:
+        return rng.choices(self._names, weights=self._weights)[0]
+
+    def _execute(self, name: str, started: float) -> None:
+        try:
+            response = OPERATIONS[name](self.ctx)
+            ok = response.status_code < 400
+        except requests.exceptions.RequestException:
+            ok = False
+        self.stats[name].record(time.perf_counter() - started, ok)
+
+    def run_open_loop(self, rps: float, duration: float, max_in_flight: int = 256) -> LoadResult:
+        """Нагрузка с фиксированной частотой rps в течение duration секунд"""
+        rng = self.ctx.rng
+        interval = 1.0 / rps
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="load") as executor:
+            i = 0
+            while True:
+                scheduled = start + i * interval
+                if scheduled - start >= duration:
+                    break
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                executor.submit(self._execute, self._pick(rng), scheduled)
+                i += 1
+        return LoadResult(self.stats, time.perf_counter() - start)
+
+    def run_closed_loop(self, users: int, duration: float, think_time: float = 0.0) -> LoadResult:
+        """Нагрузка от users виртуальных пользователей в течение duration секунд"""
+        start = time.perf_counter()
+        deadline = start + duration
+
+        def user_loop() -> None:
+            rng = self.ctx.rng
+            while time.perf_counter() < deadline:
+                self._execute(self._pick(rng), time.perf_counter())
+                if think_time:
+                    time.sleep(think_time)
+
+        threads = [threading.Thread(target=user_loop, name=f"load-user-{i}") for i in range(users)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return LoadResult(self.stats, time.perf_counter() - start)
+
+
+def make_client(base_url: str, pool_size: int) -> PetStoreAPI:
+    """Клиент с пулом соединений на pool_size параллельных запросов"""
+    return PetStoreAPI(base_url, pool_connections=1, pool_maxsize=pool_size)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон PetStore API")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base-url", default="https://petstore.swagger.io/v2")
+    target.add_argument("--stub", action="store_true", help="запустить локальную заглушку")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--rps", type=float, help="открытая модель: запросов в секунду")
+    mode.add_argument("--users", type=int, help="закрытая модель: число виртуальных пользователей")
+    parser.add_argument("--duration", type=float, default=10.0, help="секунд")
+    parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                        help="веса операций, например get_pet_by_id=60,find_pets_by_status=20")
+    parser.add_argument("--seed-pets", type=int, default=100)
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    stub = PetStoreStub().start() if args.stub else None
+    try:
+        base_url = stub.base_url if stub else args.base_url
+        client = make_client(base_url, args.users or args.max_in_flight)
+        runner = LoadRunner(client, args.mix, seed=args.seed)
+        runner.ctx.seed_pets(args.seed_pets)
+        if args.rps:
+            result = runner.run_open_loop(args.rps, args.duration, args.max_in_flight)
+        else:
+            result = runner.run_closed_loop(args.users, args.duration)
+        print(result.report())
+    finally:
+        if stub:
+            stub.stop()
+
+
+if __name__ == "__main__":
+    main()
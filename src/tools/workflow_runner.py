@@ -0,0 +1,313 @@
+import argparse
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import requests
+
+from src.api.id_allocator import IdAllocator
+from src.api.metrics import LatencyHistogram
+from src.api.petstore_api import PetStoreAPI
+from src.api.petstore_stub import PetStoreStub
+from src.api.resources import ResourceTracker
+from src.tools.load_runner import EndpointStats
+
+
+# Значение из ответа: путь по JSON через точку ("category.id") или функция от ответа
+Extractor = Union[str, Callable[[requests.Response], Any]]
+# Дополнительная проверка ответа: описание ошибки или None
+Check = Callable[[requests.Response, Dict[str, Any]], Optional[str]]
+
+
+def _extract(response: requests.Response, extractor: Extractor) -> Any:
+    if callable(extractor):
+        return extractor(response)
+    value = response.json()
+    for key in extractor.split("."):
+        value = value[int(key)] if isinstance(value, list) else value[key]
+    return value
+
+
+class Step:
+    """
+    Шаг сценария: вызов клиента с переменными экземпляра сценария.
+
+    call получает клиент и переменные (параметры экземпляра и значения,
+    извлеченные шагами из needs). Шаг успешен, если статус в expect и check
+    не вернул ошибку; тогда значения из extract добавляются в переменные.
+    """
+
+    def __init__(self, name: str, call: Callable[[PetStoreAPI, Dict[str, Any]], requests.Response],
+                 needs: Iterable[str] = (), extract: Optional[Dict[str, Extractor]] = None,
+                 expect: Iterable[int] = (200,), check: Optional[Check] = None):
+        self.name = name
+        self.call = call
+        self.needs = tuple(needs)
+        self.extract = dict(extract or {})
+        self.expect = frozenset(expect)
+        self.check = check
+
+    def execute(self, client: PetStoreAPI, variables: Dict[str, Any]) -> Tuple[Optional[str], Dict[str, Any]]:
+        """Выполняет шаг и возвращает (ошибка или None, извлеченные значения)"""
+        try:
+            response = self.call(client, variables)
+            if response.status_code not in self.expect:
+                return f"status {response.status_code}", {}
+            if self.check is not None:
+                error = self.check(response, variables)
+                if error:
+                    return error, {}
+            return None, {name: _extract(response, extractor) for name, extractor in self.extract.items()}
+        except requests.exceptions.RequestException as e:
+            return f"{type(e).__name__}: {e}", {}
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            return f"cannot extract values: {type(e).__name__}: {e}", {}
+
+    def __repr__(self) -> str:
+        return f"<Step {self.name} needs={list(self.needs)}>"
+
+
+class Workflow:
+    """
+    Сценарий как граф зависимостей шагов. Граф проверяется при создании:
+    неизвестные зависимости, циклы и одинаковые имена извлекаемых значений - ValueError.
+    """
+
+    def __init__(self, name: str, steps: List[Step]):
+        self.name = name
+        self.steps = {step.name: step for step in steps}
+        if len(self.steps) != len(steps):
+            raise ValueError(f"Workflow {name!r} has duplicate step names")
+        produced: Dict[str, str] = {}
+        for step in steps:
+            for need in step.needs:
+                if need not in self.steps:
+                    raise ValueError(f"Step {step.name!r} needs unknown step {need!r}")
+            for value in step.extract:
+                if value in produced:
+                    raise ValueError(f"Value {value!r} is extracted by both {produced[value]!r} and {step.name!r}")
+                produced[value] = step.name
+        self.dependents: Dict[str, List[str]] = {name: [] for name in self.steps}
+        for step in steps:
+            for need in step.needs:
+                self.dependents[need].append(step.name)
+        self.roots = [step.name for step in steps if not step.needs]
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        waiting = {name: len(step.needs) for name, step in self.steps.items()}
+        order, ready = [], list(self.roots)
+        while ready:
+            name = ready.pop()
+            order.append(name)
+            for dependent in self.dependents[name]:
+                waiting[dependent] -= 1
+                if not waiting[dependent]:
+                    ready.append(dependent)
+        if len(order) != len(self.steps):
+            cycle = sorted(name for name, count in waiting.items() if count)
+            raise ValueError(f"Workflow {self.name!r} has a dependency cycle through {cycle}")
+        return order
+
+
+class _Instance:
+    """Состояние одного экземпляра сценария; меняется только в потоке планировщика"""
+
+    __slots__ = ("index", "variables", "waiting", "left", "running", "failed", "started")
+
+    def __init__(self, index: int, workflow: Workflow, variables: Dict[str, Any]):
+        self.index = index
+        self.variables = variables
+        self.waiting = {name: len(step.needs) for name, step in workflow.steps.items()}
+        self.left = len(workflow.steps)
+        self.running = 0
+        self.failed = False
+        self.started = time.perf_counter()
+
+
+class WorkflowFailure:
+    __slots__ = ("instance", "step", "error")
+
+    def __init__(self, instance: int, step: str, error: str):
+        self.instance = instance
+        self.step = step
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f"<WorkflowFailure #{self.instance} {self.step}: {self.error}>"
+
+
+class WorkflowResult:
+    """Итоги прогона: задержка сценария целиком, статистика шагов и ошибки"""
+
+    def __init__(self, workflow: Workflow, steps: Dict[str, EndpointStats], journey: LatencyHistogram,
+                 instances: int, failed: int, failures: List[WorkflowFailure], duration: float):
+        self.workflow = workflow
+        self.steps = steps
+        self.journey = journey
+        self.instances = instances
+        self.failed = failed
+        self.failures = failures
+        self.duration = duration
+
+    @property
+    def throughput(self) -> float:
+        """Завершенных экземпляров в секунду"""
+        return self.instances / self.duration if self.duration else 0.0
+
+    def report(self) -> str:
+        lines = [f"{self.workflow.name}: {self.instances} instances in {self.duration:.2f} s "
+                 f"({self.throughput:.1f}/s), {self.failed} failed",
+                 f"{'step':<22}{'count':>8}{'err':>6}{'p50 ms':>9}{'p90 ms':>9}{'p99 ms':>9}{'max ms':>9}"]
+        rows = [(name, self.steps[name].histogram.summary(), self.steps[name].errors)
+                for name in self.workflow.order]
+        rows.append(("end-to-end", self.journey.summary(), self.failed))
+        for name, row, errors in rows:
+            lines.append(f"{name:<22}{row['count']:>8}{errors:>6}{row['p50_ms']:>9.2f}"
+                         f"{row['p90_ms']:>9.2f}{row['p99_ms']:>9.2f}{row['max_ms']:>9.2f}")
+        lines.extend(f"  {failure!r}" for failure in self.failures)
+        return "\n".join(lines)
+
+
+class WorkflowRunner:
+    """
+    Выполняет много экземпляров сценария поверх одного PetStoreAPI.
+
+    Шаг запускается, как только выполнены его зависимости, поэтому независимые
+    шаги одного экземпляра идут параллельно, а шаги разных экземпляров -
+    конвейером. Одновременно активно не больше max_active экземпляров.
+    После ошибки шага зависимые шаги экземпляра не запускаются; сквозная
+    задержка считается только по успешным экземплярам.
+    """
+
+    def __init__(self, client: PetStoreAPI, concurrency: int = 32, max_active: Optional[int] = None,
+                 max_failures: int = 20):
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self.client = client
+        self.concurrency = concurrency
+        self.max_active = max_active or concurrency * 4
+        self.max_failures = max_failures
+
+    def _run_step(self, step: Step, variables: Dict[str, Any]) -> Tuple[float, Optional[str], Dict[str, Any]]:
+        started = time.perf_counter()
+        error, values = step.execute(self.client, variables)
+        return time.perf_counter() - started, error, values
+
+    def run(self, workflow: Workflow, instances: int = 1,
+            params: Optional[Callable[[int], Dict[str, Any]]] = None) -> WorkflowResult:
+        """Выполняет instances экземпляров; params(i) задает начальные переменные экземпляра"""
+        stats = {name: EndpointStats() for name in workflow.steps}
+        journey = LatencyHistogram()
+        failures: List[WorkflowFailure] = []
+        failed = 0
+        futures: Dict[Future, Tuple[_Instance, Step]] = {}
+        started = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="workflow") as executor:
+            def submit(instance: _Instance, name: str) -> None:
+                step = workflow.steps[name]
+                instance.running += 1
+                # Копия: планировщик дополняет переменные, пока шаг выполняется
+                future = executor.submit(self._run_step, step, dict(instance.variables))
+                futures[future] = instance, step
+
+            next_index = active = 0
+            while True:
+                while active < self.max_active and next_index < instances:
+                    instance = _Instance(next_index, workflow, params(next_index) if params else {})
+                    for name in workflow.roots:
+                        submit(instance, name)
+                    next_index += 1
+                    active += 1
+                if not futures:
+                    break
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    instance, step = futures.pop(future)
+                    latency, error, values = future.result()
+                    stats[step.name].record(latency, error is None)
+                    instance.running -= 1
+                    instance.left -= 1
+                    if error is not None:
+                        if not instance.failed:
+                            failed += 1
+                            if len(failures) < self.max_failures:
+                                failures.append(WorkflowFailure(instance.index, step.name, error))
+                        instance.failed = True
+                    elif not instance.failed:
+                        instance.variables.update(values)
+                        for dependent in workflow.dependents[step.name]:
+                            instance.waiting[dependent] -= 1
+                            if not instance.waiting[dependent]:
+                                submit(instance, dependent)
+                    if instance.running == 0 and (instance.failed or instance.left == 0):
+                        active -= 1
+                        if not instance.failed:
+                            journey.record(time.perf_counter() - instance.started)
+
+        return WorkflowResult(workflow, stats, journey, instances, failed, failures,
+                              time.perf_counter() - started)
+
+
+def _available_grew(response: requests.Response, variables: Dict[str, Any]) -> Optional[str]:
+    available = response.json().get("available", 0)
+    if available <= variables["available_before"]:
+        return f"available count did not grow: {variables['available_before']} -> {available}"
+    return None
+
+
+def pet_order_workflow(allocator: IdAllocator) -> Workflow:
+    """
+    Питомец -> заказ -> инвентарь: инвентарь до, создание питомца, затем параллельно
+    заказ и чтение питомца, инвентарь после (число available должно вырасти).
+    Шаги ничего не удаляют: удаление чужих питомцев параллельными экземплярами
+    ломало бы проверку инвентаря. Созданное убирает ResourceTracker клиента.
+    """
+    return Workflow("pet_order", [
+        Step("inventory_before", lambda c, v: c.get_inventory(),
+             extract={"available_before": lambda r: r.json().get("available", 0)}),
+        Step("create_pet", lambda c, v: c.create_pet({
+            "id": allocator.next_id(), "name": f"WorkflowPet{v.get('index', 0)}",
+            "photoUrls": [], "status": "available"}),
+            needs=["inventory_before"], extract={"pet_id": "id"}),
+        Step("place_order", lambda c, v: c.create_order({
+            "id": allocator.next_id(), "petId": v["pet_id"], "quantity": 1,
+            "status": "placed", "complete": False}),
+            needs=["create_pet"], extract={"order_id": "id"}),
+        Step("get_pet", lambda c, v: c.get_pet_by_id(v["pet_id"]), needs=["create_pet"],
+             check=lambda r, v: None if r.json()["id"] == v["pet_id"] else "another pet returned"),
+        Step("inventory_after", lambda c, v: c.get_inventory(), needs=["place_order", "get_pet"],
+             check=_available_grew),
+    ])
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Сквозные сценарии PetStore API: питомец -> заказ -> инвентарь")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--base-url", default="https://petstore.swagger.io/v2")
+    target.add_argument("--stub", action="store_true", help="запустить локальную заглушку")
+    parser.add_argument("--instances", type=int, default=1000, help="число экземпляров сценария")
+    parser.add_argument("--concurrency", type=int, default=32, help="параллельных запросов")
+    parser.add_argument("--max-active", type=int, help="одновременно активных экземпляров")
+    args = parser.parse_args(argv)
+
+    stub = PetStoreStub().start() if args.stub else None
+    tracker = ResourceTracker()
+    client = PetStoreAPI(stub.base_url if stub else args.base_url, pool_connections=1,
+                         pool_maxsize=args.concurrency, resource_tracker=tracker)
+    try:
+        runner = WorkflowRunner(client, args.concurrency, args.max_active)
+        result = runner.run(pet_order_workflow(IdAllocator()), args.instances, params=lambda i: {"index": i})
+        print(result.report())
+    finally:
+        if stub:
+            stub.stop()
+        else:
+            for kind, key, error in tracker.cleanup(client, args.concurrency):
+                print(f"cleanup failed: {kind} {key}: {error}")
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
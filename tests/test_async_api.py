@@ -0,0 +1,63 @@
+import asyncio
+import inspect
+
+import pytest
+
+from src.api.async_petstore_api import AsyncPetStoreAPI
+
+
+class TestAsyncPetStoreAPI:
+    """Тесты для асинхронного клиента"""
+
+    def test_endpoint_methods_are_coroutines(self):
+        """Тест что все эндпоинты доступны в виде корутин"""
+        methods = [
+            "create_pet", "get_pet_by_id", "update_pet", "delete_pet", "find_pets_by_status",
+            "get_inventory", "create_order", "get_order_by_id", "delete_order",
+            "create_user", "get_user_by_username", "update_user", "delete_user",
+            "create_users_with_list", "create_users_with_array",
+        ]
+        for name in methods:
+            assert inspect.iscoroutinefunction(getattr(AsyncPetStoreAPI, name)), name
+
+    def test_gather_respects_limit(self):
+        """Тест что gather не запускает больше корутин, чем разрешено"""
+        active = 0
+        peak = 0
+
+        async def job(i):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            return i
+
+        async def scenario():
+            async with AsyncPetStoreAPI(limit_per_host=4) as api:
+                return await api.gather((job(i) for i in range(50)), limit=3)
+
+        results = asyncio.run(scenario())
+
+        assert results == list(range(50))
+        assert peak == 3
+
+    def test_invalid_limit_rejected(self):
+        """Тест что нулевой лимит соединений запрещен"""
+        with pytest.raises(ValueError):
+            AsyncPetStoreAPI(limit_per_host=0)
+
+    def test_concurrent_requests_against_stub(self, make_api_client, id_allocator):
+        """Тест конкурентного создания и чтения питомцев"""
+        pets = [{"id": id_allocator.next_id(), "name": f"AsyncPet{i}", "status": "available"} for i in range(40)]
+
+        async def scenario():
+            async with AsyncPetStoreAPI(client=make_api_client(), limit_per_host=8) as api:
+                created = await api.gather(api.create_pet(pet) for pet in pets)
+                fetched = await api.gather(api.get_pet_by_id(pet["id"]) for pet in pets)
+                return created, fetched
+
+        created, fetched = asyncio.run(scenario())
+
+        assert all(response.status_code == 200 for response in created)
+        assert [response.json()["id"] for response in fetched] == [pet["id"] for pet in pets]
@@ -0,0 +1,48 @@
+import json
+
+from src.api.petstore_api import PetStoreAPI
+from src.tools.benchmark import (BASE_URL, CannedAdapter, Case, compare, default_cases, load_baseline,
+                                 render_responses, run, save_baseline)
+
+
+class TestBenchmark:
+    """Тесты замера накладных расходов клиента"""
+
+    def test_canned_adapter_serves_full_client_path(self):
+        """Тест что адаптер без сети отдает ответ через обычный путь requests, включая stream"""
+        client = PetStoreAPI(BASE_URL)
+        client.session.mount("http://", CannedAdapter(200, b'[{"id": 1, "name": "a", "photoUrls": []}]'))
+
+        assert client.find_pets_by_status("available").json()[0]["id"] == 1
+        assert [pet["id"] for pet in client.iter_pets_by_status("available")] == [1]
+
+    def test_rendered_responses_follow_case_order(self):
+        """Тест что ответы заглушки готовятся заранее, а удаление видит созданную сущность"""
+        rendered = render_responses(default_cases())
+        assert rendered["get_pet_by_id"][0] == 200
+        assert rendered["delete_pet"][0] == 200
+        assert len(json.loads(rendered["find_pets_by_status_10k"][1])) >= 10_000
+
+    def test_run_reports_ops_and_allocations(self):
+        """Тест что прогон возвращает ops/sec и память на вызов для выбранных кейсов"""
+        cases = [Case("get_inventory", lambda c: c.get_inventory().json(), "GET", "/store/inventory")]
+        results = run(cases, min_time=0.01, repeat=1)
+
+        assert list(results) == ["get_inventory"]
+        row = results["get_inventory"]
+        assert row["ops_per_sec"] > 0 and row["us_per_op"] > 0 and row["alloc_kib"] > 0
+
+    def test_compare_flags_regressions(self, tmp_path):
+        """Тест что падение ops/sec или рост памяти сверх допуска считается регрессией"""
+        path = str(tmp_path / "baseline.json")
+        save_baseline(path, {"a": {"ops_per_sec": 1000, "us_per_op": 1000, "alloc_kib": 10},
+                             "b": {"ops_per_sec": 1000, "us_per_op": 1000, "alloc_kib": 10}})
+        baseline = load_baseline(path)
+
+        results = {"a": {"ops_per_sec": 900, "us_per_op": 1111, "alloc_kib": 11},
+                   "b": {"ops_per_sec": 500, "us_per_op": 2000, "alloc_kib": 40},
+                   "new": {"ops_per_sec": 1, "us_per_op": 1e6, "alloc_kib": 1}}
+        regressions = compare(results, baseline, tolerance=0.3)
+
+        assert len(regressions) == 2
+        assert all(line.startswith("b:") for line in regressions)
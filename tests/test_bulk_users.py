@@ -0,0 +1,92 @@
+import pytest
+import requests
+
+from src.api.bulk import iter_chunks
+from src.api.id_allocator import IdAllocator
+
+
+def make_users(id_allocator, count, produced=None):
+    """Генератор пользователей; produced считает уже выданных"""
+    for i in range(count):
+        if produced is not None:
+            produced.append(i)
+        user_id = id_allocator.next_id()
+        yield {"id": user_id, "username": f"bulkuser{user_id}", "firstName": "Bulk",
+               "lastName": "User", "email": f"bulk{user_id}@example.com",
+               "password": "password123", "userStatus": 1}
+
+
+class TestIterChunks:
+    """Тесты нарезки потока пользователей на пакеты"""
+
+    def test_chunks_bounded_by_count(self):
+        """Тест ограничения пакета по числу элементов"""
+        sizes = [len(chunk) for chunk in iter_chunks(({"id": i} for i in range(25)), 10)]
+        assert sizes == [10, 10, 5]
+
+    def test_chunks_bounded_by_bytes(self):
+        """Тест ограничения пакета по размеру JSON"""
+        items = [{"name": "x" * 100} for _ in range(10)]
+        chunks = list(iter_chunks(items, 100, max_chunk_bytes=400))
+        assert all(len(chunk) == 3 for chunk in chunks[:-1])
+        assert sum(len(chunk) for chunk in chunks) == 10
+
+
+class TestBulkCreateUsers:
+    """Тесты массового создания пользователей"""
+
+    def test_all_chunks_created(self, api_client, id_allocator):
+        """Тест что все пакеты отправлены и пользователи появились"""
+        users = list(make_users(id_allocator, 250))
+
+        results = api_client.bulk_create_users(iter(users), chunk_size=50, concurrency=4)
+
+        assert [result.size for result in results] == [50] * 5
+        assert all(result.ok and result.users is None for result in results)
+        for user in users[::50]:
+            assert api_client.get_user_by_username(user["username"]).status_code == 200
+
+    def test_generator_is_consumed_lazily(self, api_client, id_allocator):
+        """Тест что источник читается по мере отправки, а не целиком"""
+        produced = []
+        first_request_seen_at = []
+        api_client.add_pre_request_hook(lambda info: first_request_seen_at.append(len(produced)))
+
+        api_client.bulk_create_users(make_users(id_allocator, 2000, produced),
+                                     chunk_size=10, concurrency=2, use_array=True)
+
+        assert len(produced) == 2000
+        # к первому запросу прочитано не больше окна из 2 * concurrency пакетов
+        assert first_request_seen_at[0] <= 5 * 10
+
+    @pytest.mark.live
+    def test_failed_chunk_is_retried(self, api_client, monkeypatch):
+        """Тест что пакет повторяется после сетевой ошибки"""
+        original = api_client.transport.send
+        calls = []
+
+        def flaky(method, url, **kwargs):
+            calls.append(url)
+            if len(calls) == 1:
+                raise requests.exceptions.ConnectionError("reset by peer")
+            return original(method, url, **kwargs)
+
+        monkeypatch.setattr(api_client.transport, "send", flaky)
+
+        results = api_client.bulk_create_users(make_users(IdAllocator(), 5), chunk_size=5, retries=1)
+
+        assert results[0].ok
+        assert results[0].attempts == 2
+
+    @pytest.mark.live
+    def test_exhausted_retries_keep_users(self, api_client, monkeypatch):
+        """Тест что у неудачного пакета сохраняются пользователи для повторной отправки"""
+        def broken(method, url, **kwargs):
+            raise requests.exceptions.ConnectionError("down")
+
+        monkeypatch.setattr(api_client.transport, "send", broken)
+
+        results = api_client.bulk_create_users(make_users(IdAllocator(), 3), chunk_size=5, retries=0)
+
+        assert not results[0].ok
+        assert len(results[0].users) == 3
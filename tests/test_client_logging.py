@@ -0,0 +1,83 @@
+import json
+import logging
+
+import pytest
+import requests
+
+from src.api.petstore_api import PetStoreAPI, LOGGER_NAME
+
+
+def make_response(body, status_code=200):
+    """Собирает requests.Response без обращения к сети"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode()
+    response.encoding = "utf-8"
+    return response
+
+
+@pytest.fixture
+def offline_client(monkeypatch):
+    """Клиент, сессия которого отвечает заранее подготовленным телом"""
+    def factory(body, log_mode="off"):
+        client = PetStoreAPI(base_url="http://petstore.local/v2", log_mode=log_mode)
+        response = make_response(body)
+        monkeypatch.setattr(client.session, "request", lambda method, url, **kwargs: response)
+        return client
+    return factory
+
+
+class TestClientLogging:
+    """Тесты логирования и кэширования тела ответа в _make_request"""
+
+    def test_logging_is_off_by_default(self, offline_client, caplog):
+        """Тест что по умолчанию клиент ничего не пишет в лог"""
+        caplog.set_level(logging.DEBUG, logger=LOGGER_NAME)
+        offline_client({"id": 1}).get_pet_by_id(1)
+        assert caplog.records == []
+
+    def test_compact_mode_writes_one_line(self, offline_client, caplog):
+        """Тест что компактный режим пишет одну строку без тел"""
+        caplog.set_level(logging.DEBUG, logger=LOGGER_NAME)
+        offline_client({"id": 1}, log_mode="compact").create_pet({"id": 1})
+
+        assert len(caplog.records) == 1
+        assert caplog.records[0].levelno == logging.INFO
+        assert "POST http://petstore.local/v2/pet -> 200" in caplog.records[0].getMessage()
+
+    def test_debug_mode_logs_bodies(self, offline_client, caplog):
+        """Тест что режим debug добавляет тела запроса и ответа"""
+        caplog.set_level(logging.DEBUG, logger=LOGGER_NAME)
+        offline_client({"id": 7, "name": "Rex"}, log_mode="debug").create_pet({"id": 7})
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert len(messages) == 3
+        assert '"name": "Rex"' in messages[2]
+
+    def test_debug_mode_skips_serialization_when_level_disabled(self, offline_client, caplog, monkeypatch):
+        """Тест что тела не сериализуются, если уровень DEBUG выключен"""
+        caplog.set_level(logging.INFO, logger=LOGGER_NAME)
+        client = offline_client({"id": 1}, log_mode="debug")
+        monkeypatch.setattr(json, "dumps", lambda *args, **kwargs: pytest.fail("json.dumps called"))
+        client.create_pet({"id": 1})
+        assert len(caplog.records) == 1
+
+    def test_response_json_is_parsed_once(self, offline_client, monkeypatch):
+        """Тест что тело ответа разбирается один раз и кэшируется"""
+        calls = []
+        original = requests.Response.json
+
+        def counting_json(self, **kwargs):
+            calls.append(1)
+            return original(self, **kwargs)
+
+        monkeypatch.setattr(requests.Response, "json", counting_json)
+        response = offline_client([{"id": 1}], log_mode="debug").find_pets_by_status("available")
+
+        assert response.json() is response.json()
+        assert len(calls) == 1
+
+    def test_unknown_log_mode_rejected(self):
+        """Тест что неизвестный режим логирования запрещен"""
+        with pytest.raises(ValueError):
+            PetStoreAPI(log_mode="verbose")
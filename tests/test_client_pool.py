@@ -0,0 +1,175 @@
+import socket
+import threading
+import time
+
+import pytest
+import requests
+
+from src.api.petstore_api import PetStoreAPI
+from src.api.petstore_stub import PetStoreStub
+from src.api.retry import DeadlineExceeded, RetryPolicy
+from src.api.session import shared_session
+
+
+@pytest.fixture
+def silent_server():
+    """Сервер, который принимает соединение и ничего не отвечает"""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    accepted = []
+    stop = threading.Event()
+
+    def accept():
+        server.settimeout(0.05)
+        while not stop.is_set():
+            try:
+                accepted.append(server.accept()[0])
+            except socket.timeout:
+                continue
+
+    thread = threading.Thread(target=accept, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.getsockname()[1]}/v2"
+    stop.set()
+    thread.join()
+    for conn in accepted:
+        conn.close()
+    server.close()
+
+
+def capturing_client(**kwargs):
+    """Клиент, запоминающий параметры, с которыми уходят запросы"""
+    calls = []
+
+    def fake_request(method, url, **request_kwargs):
+        calls.append(request_kwargs)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"{}"
+        return response
+
+    client = PetStoreAPI("http://petstore.local/v2", **kwargs)
+    client.session.request = fake_request
+    return client, calls
+
+
+class TestTimeouts:
+    """Тесты таймаутов клиента"""
+
+    def test_default_timeouts_are_sent(self):
+        """Тест что каждый запрос уходит с таймаутами connect/read"""
+        client, calls = capturing_client()
+        client.get_inventory()
+        assert calls[0]["timeout"] == (5.0, 30.0)
+
+    def test_total_timeout_caps_socket_waits(self):
+        """Тест что ожидания урезаются до остатка total_timeout"""
+        client, calls = capturing_client(connect_timeout=5, read_timeout=30, total_timeout=2)
+        client.get_inventory()
+        connect, read = calls[0]["timeout"]
+        assert 0 < connect <= 2 and 0 < read <= 2
+
+    def test_stalled_server_raises_read_timeout(self, silent_server):
+        """Тест что зависший сервер не вешает тест: срабатывает read timeout"""
+        client = PetStoreAPI(silent_server, read_timeout=0.2)
+        started = time.perf_counter()
+        with pytest.raises(requests.exceptions.ReadTimeout):
+            client.get_inventory()
+        assert time.perf_counter() - started < 2
+
+    def test_total_timeout_stops_retries(self, silent_server):
+        """Тест что total_timeout ограничивает вызов вместе с повторами"""
+        client = PetStoreAPI(silent_server, read_timeout=10, total_timeout=0.3,
+                             retry_policy=RetryPolicy(max_attempts=10, backoff=0.01, deadline=None))
+        started = time.perf_counter()
+        with pytest.raises(requests.exceptions.Timeout):
+            client.get_inventory()
+        assert time.perf_counter() - started < 2
+
+    def test_deadline_exceeded_before_send(self):
+        """Тест что при исчерпанном total_timeout запрос не отправляется"""
+        client, calls = capturing_client(total_timeout=1)
+        with pytest.raises(DeadlineExceeded):
+            client._send("GET", client.base_url + "/store/inventory", deadline=time.perf_counter() - 1)
+        assert calls == []
+
+
+class TestConnectionPool:
+    """Тесты настройки пула соединений"""
+
+    def test_pool_sizing(self):
+        """Тест что размеры пула попадают в адаптер"""
+        client = PetStoreAPI(pool_connections=2, pool_maxsize=32, pool_block=True)
+        adapter = client.session.get_adapter("https://petstore.swagger.io")
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+        assert adapter.poolmanager.connection_pool_kw["block"] is True
+
+    def test_tcp_keepalive_socket_options(self):
+        """Тест что tcp_keepalive включает SO_KEEPALIVE, сохраняя TCP_NODELAY"""
+        client = PetStoreAPI(tcp_keepalive=30)
+        options = client.session.get_adapter("http://x").poolmanager.connection_pool_kw["socket_options"]
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in options
+
+    def test_keep_alive_off_closes_connections(self):
+        """Тест что keep_alive=False просит сервер закрыть соединение"""
+        assert PetStoreAPI(keep_alive=False).session.headers["Connection"] == "close"
+
+    def test_shared_session_is_reused(self):
+        """Тест что клиенты с share_session и одинаковым пулом используют одну сессию"""
+        first = PetStoreAPI(share_session=True, pool_maxsize=7)
+        second = PetStoreAPI(share_session=True, pool_maxsize=7)
+        other = PetStoreAPI(share_session=True, pool_maxsize=8)
+
+        assert first.session is second.session is shared_session(pool_maxsize=7)
+        assert other.session is not first.session
+        assert PetStoreAPI().session is not first.session
+
+    def test_close_keeps_foreign_sessions_open(self, monkeypatch):
+        """Тест что close закрывает только собственную сессию клиента"""
+        session = requests.Session()
+        closed = []
+        monkeypatch.setattr(session, "close", lambda: closed.append(True))
+
+        PetStoreAPI(session=session).close()
+        assert closed == []
+
+        own = PetStoreAPI()
+        monkeypatch.setattr(own.session, "close", lambda: closed.append(True))
+        own.close()
+        assert closed == [True]
+
+
+class TestSessionClient:
+    """Тесты общего на сессию клиента"""
+
+    def test_api_client_is_session_wide(self, api_client, session_api_client):
+        """Тест что api_client - общий клиент сессии, а не новый экземпляр"""
+        assert api_client is session_api_client
+
+    def test_restore_resets_per_test_state(self):
+        """Тест что restore убирает заголовки, хуки и настройки, измененные тестом"""
+        client = PetStoreAPI()
+        snapshot = client.snapshot()
+
+        client.session.headers["X-Test"] = "1"
+        del client.session.headers["Accept"]
+        client.add_post_request_hook(print)
+        client.log_mode = "debug"
+        client.restore(snapshot)
+
+        assert "X-Test" not in client.session.headers
+        assert client.session.headers["Accept"] == "application/json"
+        assert client._post_request_hooks == []
+        assert client.log_mode == "off"
+
+    def test_warm_up_opens_connections(self):
+        """Тест что warm_up заранее обращается к серверу, а недоступный сервер не роняет его"""
+        with PetStoreStub() as stub:
+            client = PetStoreAPI(stub.base_url, pool_maxsize=3)
+            assert client.warm_up(3) == 3
+            pools = client.session.get_adapter(stub.base_url).poolmanager.pools
+            assert sum(pools[key].num_connections for key in pools.keys()) >= 1
+
+        assert PetStoreAPI("http://127.0.0.1:9/v2", connect_timeout=0.2).warm_up(2) == 0
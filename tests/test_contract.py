@@ -0,0 +1,139 @@
+import json
+import time
+
+import pytest
+import requests
+
+from src.api.contract import ContractError, ContractValidator, SPEC_PATH, default_contract
+from src.api.petstore_api import PetStoreAPI
+
+
+def make_pet(pet_id):
+    return {"id": pet_id, "category": {"id": 1, "name": "dogs"}, "name": f"Pet{pet_id}",
+            "photoUrls": ["https://example.com/photo.jpg"], "tags": [{"id": 1, "name": "friendly"}],
+            "status": "available"}
+
+
+def make_response(status_code, data=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(data).encode() if data is not None else b""
+    return response
+
+
+def scripted_client(response, contract):
+    calls = []
+
+    def fake_request(method, url, **kwargs):
+        calls.append((method, url))
+        return response
+
+    client = PetStoreAPI("http://petstore.local/v2", contract=contract)
+    client.session.request = fake_request
+    return client, calls
+
+
+@pytest.fixture
+def contract():
+    return default_contract()
+
+
+class TestContractValidator:
+    """Тесты проверки по swagger-спецификации"""
+
+    def test_spec_is_compiled_once(self, contract):
+        """Тест что валидатор по умолчанию собирается один раз и знает все операции клиента"""
+        assert default_contract() is contract
+        assert ("GET", "/pet/{petId}") in contract.operations
+        assert ("POST", "/store/order") in contract.operations
+        assert ("DELETE", "/user/{username}") in contract.operations
+
+    def test_valid_payloads_pass(self, contract):
+        """Тест что корректные ответы проходят проверку"""
+        contract.validate_response("GET", "/pet/{petId}", make_response(200, make_pet(1)))
+        contract.validate_response("GET", "/store/inventory",
+                                   make_response(200, {"available": 3, "sold": 1}))
+        contract.validate_response("GET", "/pet/{petId}",
+                                   make_response(404, {"code": 1, "type": "error", "message": "Pet not found"}))
+
+    def test_error_path_points_to_field(self, contract):
+        """Тест что ошибка указывает путь до неверного поля"""
+        pets = [make_pet(i) for i in range(5)]
+        pets[3]["category"]["id"] = "one"
+        with pytest.raises(ContractError) as error:
+            contract.validate_response("GET", "/pet/findByStatus", make_response(200, pets))
+        assert error.value.path == "GET /pet/findByStatus 200 response[3].category.id"
+
+    @pytest.mark.parametrize("field, value, message", [
+        ("status", "lost", "expected one of"),
+        ("id", 2 ** 63, "int64 range"),
+        ("id", True, "expected integer"),
+        ("photoUrls", None, "required field is missing"),
+        ("tags", {}, "expected array"),
+    ])
+    def test_violations(self, contract, field, value, message):
+        """Тест нарушений: enum, диапазон, bool вместо int, обязательное поле, тип массива"""
+        pet = dict(make_pet(1), **{field: value})
+        with pytest.raises(ContractError, match=message):
+            contract.validate_response("GET", "/pet/{petId}", make_response(200, pet))
+
+    def test_empty_body_where_schema_expected(self, contract):
+        """Тест что пустой ответ при описанной схеме - нарушение"""
+        with pytest.raises(ContractError, match="empty response"):
+            contract.validate_response("GET", "/pet/{petId}", make_response(200))
+
+    def test_undocumented_status_only_fails_in_strict_mode(self):
+        """Тест что незадокументированный статус проверяется только в strict"""
+        response = make_response(418, {"teapot": True})
+        ContractValidator.from_file(SPEC_PATH).validate_response("GET", "/pet/{petId}", response)
+        with pytest.raises(ContractError, match="undocumented status 418"):
+            default_contract(strict=True).validate_response("GET", "/pet/{petId}", response)
+
+    def test_large_payload_is_fast(self, contract):
+        """Тест что проверка findByStatus на 5000 питомцев занимает микросекунды на объект"""
+        response = make_response(200, [make_pet(i) for i in range(5000)])
+        response.json()
+        timings = []
+        for _ in range(3):  # лучший из трех: под xdist соседние воркеры отнимают CPU
+            started = time.perf_counter()
+            contract.validate_response("GET", "/pet/findByStatus", response)
+            timings.append(time.perf_counter() - started)
+        assert min(timings) / 5000 < 50e-6
+
+
+class TestClientContract:
+    """Тесты проверки контракта в PetStoreAPI"""
+
+    def test_invalid_response_raises(self, contract):
+        """Тест что клиент с contract отклоняет ответ, не соответствующий схеме"""
+        client, _ = scripted_client(make_response(200, {"id": 1, "status": "placed"}), contract)
+        with pytest.raises(ContractError):
+            client.get_pet_by_id(1)
+
+    def test_invalid_request_is_not_sent(self, contract):
+        """Тест что тело, нарушающее схему, не уходит на сервер"""
+        client, calls = scripted_client(make_response(200, make_pet(1)), contract)
+        with pytest.raises(ContractError, match="request.name"):
+            client.create_pet({"id": 1, "photoUrls": []})
+        assert calls == []
+
+    def test_request_validation_can_be_disabled(self):
+        """Тест что validate_requests=False пропускает неполные тела и проверяет только ответ"""
+        contract = default_contract(validate_requests=False)
+        client, calls = scripted_client(make_response(200, make_pet(1)), contract)
+        assert client.create_pet({"id": 1}).status_code == 200
+        assert len(calls) == 1
+
+    def test_stub_satisfies_contract(self, make_api_client, random_pet_data, random_order_data,
+                                     random_user_data):
+        """Тест что ответы сервера соответствуют спецификации"""
+        client = make_api_client(contract=default_contract())
+        client.create_pet(random_pet_data)
+        client.get_pet_by_id(random_pet_data["id"])
+        client.find_pets_by_status("available")
+        client.get_inventory()
+        client.create_order(dict(random_order_data, petId=random_pet_data["id"]))
+        client.get_order_by_id(random_order_data["id"])
+        client.create_user(random_user_data)
+        client.get_user_by_username(random_user_data["username"])
+        client.delete_pet(random_pet_data["id"])
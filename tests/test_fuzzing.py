@@ -0,0 +1,86 @@
+import random
+
+import pytest
+
+from src.api.contract import default_contract
+from src.api.fuzzing import Fuzzer, PayloadGenerator, shrink
+from src.api.petstore_api import PetStoreAPI
+from src.api.petstore_stub import PetStoreStub
+
+
+@pytest.fixture(scope="module")
+def stub_client():
+    """Клиент локальной заглушки: тысячи случаев не отправляются в реальный сервис"""
+    with PetStoreStub() as stub:
+        client = PetStoreAPI(stub.base_url, pool_maxsize=16)
+        yield client
+        client.close()
+
+
+@pytest.fixture
+def generator(id_allocator):
+    return PayloadGenerator(id_allocator)
+
+
+class TestPayloadGenerator:
+    """Тесты генератора тел запросов"""
+
+    @pytest.mark.parametrize("model", ["Pet", "Order", "User"])
+    def test_valid_payloads_match_spec(self, generator, model):
+        """Тест что корректные объекты проходят проверку по спецификации"""
+        contract = default_contract()
+        for seed in range(200):
+            contract.validate_definition(model, generator.valid(model, random.Random(seed)))
+
+    def test_near_valid_payloads_are_reproducible(self, generator, id_allocator):
+        """Тест что мутация зависит только от seed, а id берутся из аллокатора"""
+        first, mutation = generator.near_valid("Pet", random.Random("seed"))
+        second, same_mutation = PayloadGenerator(id_allocator).near_valid("Pet", random.Random("seed"))
+
+        assert mutation == same_mutation and mutation in generator.mutations
+        assert first.keys() == second.keys()
+
+
+class TestShrink:
+    """Тесты сжатия неудачных случаев"""
+
+    def test_shrinks_to_minimal_reproducer(self):
+        """Тест что из большого объекта остается только поле, ломающее свойство"""
+        payload = {"id": 123456, "name": "long pet name", "tags": [{"id": 1}, {"id": 2}, {"id": 3}],
+                   "status": "available", "category": {"id": 7, "name": "dogs"}}
+
+        def fails(value):
+            return isinstance(value, dict) and any(tag.get("id", 0) >= 2 for tag in value.get("tags", ()))
+
+        assert shrink(payload, fails) == {"tags": [{"id": 2}]}
+
+    def test_respects_call_budget(self):
+        """Тест что число проверок ограничено max_calls"""
+        calls = []
+        payload = {f"field{i}": i for i in range(100)}
+        assert shrink(payload, lambda value: calls.append(value) or len(value) == 100, max_calls=10) == payload
+        assert len(calls) == 10
+
+
+class TestFuzzer:
+    """Прогон сгенерированных тел через клиент"""
+
+    @pytest.mark.parametrize("model", ["Pet", "Order", "User"])
+    def test_stub_survives_fuzzing(self, stub_client, generator, model):
+        """Тест что заглушка выдерживает корректные и испорченные тела без нарушений"""
+        report = Fuzzer(stub_client, generator, seed=19).run(model, 300)
+
+        assert report.failures == [], report.summary()
+        assert report.rate > 100
+
+    def test_failures_are_shrunk(self, stub_client, generator):
+        """Тест что нарушение свойства сообщается с минимальным payload"""
+        def prop(client, example):
+            return "has tags" if example.payload.get("tags") else None
+
+        fuzzer = Fuzzer(stub_client, generator, seed=1, prop=prop)
+        report = fuzzer.run("Pet", 50, invalid_ratio=0, max_shrink=2)
+
+        assert report.failures
+        assert [failure.shrunk for failure in report.failures[:2]] == [{"tags": [{}]}] * 2
+        assert all(failure.shrunk is None for failure in report.failures[2:])
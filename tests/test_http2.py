@@ -0,0 +1,112 @@
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from src.api import http2
+from src.api.cache import ResponseCache
+from src.api.petstore_api import PetStoreAPI
+from src.api.petstore_stub import PetStoreH2Stub
+
+pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+
+@pytest.fixture
+def h2_stub():
+    with PetStoreH2Stub() as stub:
+        yield stub
+
+
+@pytest.fixture
+def h2_client(h2_stub):
+    client = PetStoreAPI(h2_stub.base_url, http2=True)
+    yield client
+    client.close()
+
+
+class TestHTTP2Transport:
+    """Тесты HTTP/2 транспорта против локальной h2-заглушки"""
+
+    def test_parallel_requests_share_one_connection(self, h2_stub, h2_client):
+        """Тест что 50 параллельных запросов идут потоками одного соединения"""
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            statuses = list(executor.map(lambda _: h2_client.get_inventory().status_code, range(50)))
+
+        assert statuses == [200] * 50
+        assert h2_stub.connections == 1
+        assert h2_stub.streams == 50
+
+    def test_method_surface_is_unchanged(self, h2_client, random_pet_data, random_user_data):
+        """Тест что методы клиента работают как через requests: тела, статусы, ошибки"""
+        assert h2_client.create_pet(random_pet_data).json() == random_pet_data
+        assert h2_client.get_pet_by_id(random_pet_data["id"]).json()["name"] == random_pet_data["name"]
+        assert h2_client.create_user(random_user_data).status_code == 200
+        assert h2_client.get_user_by_username(random_user_data["username"]).json()["id"] == random_user_data["id"]
+        assert h2_client.delete_pet(random_pet_data["id"]).status_code == 200
+        assert h2_client.get_pet_by_id(random_pet_data["id"]).status_code == 404
+
+    def test_large_streamed_body_respects_flow_control(self, h2_stub, h2_client):
+        """Тест что тело больше окна flow control читается потоково целиком"""
+        for i in range(3000):
+            h2_stub.state.save_pet({"id": i + 1, "name": f"Pet{i}", "photoUrls": ["x" * 50], "status": "pending"})
+
+        ids = [pet["id"] for pet in h2_client.iter_pets_by_status("pending")]
+
+        assert len(ids) == 3000
+        assert len(h2_client.find_pets_by_status("pending").content) > 65535
+
+    def test_etag_revalidation(self, h2_client, random_pet_data):
+        """Тест что условный GET получает 304 и кэш отдает сохраненный ответ"""
+        h2_client.cache = ResponseCache(ttl=0)
+        h2_client.create_pet(random_pet_data)
+
+        first = h2_client.get_pet_by_id(random_pet_data["id"])
+        second = h2_client.get_pet_by_id(random_pet_data["id"])
+
+        assert second.json() == first.json()
+        assert h2_client.cache.stats()["revalidations"] == 1
+
+    def test_shared_client(self, h2_stub):
+        """Тест что клиенты с share_session используют одно HTTP/2 соединение"""
+        first = PetStoreAPI(h2_stub.base_url, http2=True, share_session=True)
+        second = PetStoreAPI(h2_stub.base_url, http2=True, share_session=True)
+        try:
+            assert first.transport.client is second.transport.client
+            first.get_inventory()
+            second.get_inventory()
+            assert h2_stub.connections == 1
+        finally:
+            http2.close_shared_http2_clients()
+
+
+class TestHTTP2Errors:
+    """Тесты перевода ошибок httpx в исключения requests"""
+
+    def test_stalled_server_raises_read_timeout(self):
+        """Тест что сервер без ответа дает requests ReadTimeout"""
+        with socket.create_server(("127.0.0.1", 0)) as server:  # соединения ждут в backlog
+            client = PetStoreAPI(f"http://127.0.0.1:{server.getsockname()[1]}/v2", http2=True,
+                                 read_timeout=0.2)
+            started = time.perf_counter()
+            with pytest.raises(requests.exceptions.ReadTimeout):
+                client.get_inventory()
+            assert time.perf_counter() - started < 2
+            client.close()
+
+    def test_refused_connection_raises_connection_error(self):
+        """Тест что отказ в соединении - requests ConnectionError, который понимает RetryPolicy"""
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            port = server.getsockname()[1]
+        client = PetStoreAPI(f"http://127.0.0.1:{port}/v2", http2=True)
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.get_inventory()
+        client.close()
+
+    def test_missing_httpx_is_reported(self, monkeypatch):
+        """Тест что без httpx понятная ошибка возникает при создании клиента"""
+        monkeypatch.setattr(http2, "httpx", None)
+        with pytest.raises(ImportError, match="httpx"):
+            PetStoreAPI("http://127.0.0.1/v2", http2=True)
@@ -0,0 +1,32 @@
+import pytest
+
+from src.api.id_allocator import BLOCK_SIZE, IdAllocator, current_worker
+
+
+class TestIdAllocator:
+    """Тесты выдачи id без пересечений между воркерами"""
+
+    def test_ids_are_unique_within_worker(self):
+        """Тест что один воркер не выдает повторяющихся id"""
+        allocator = IdAllocator(worker=0, run_slot=1)
+        ids = [allocator.next_id() for _ in range(1000)]
+        assert len(set(ids)) == len(ids)
+
+    def test_workers_get_disjoint_ranges(self):
+        """Тест что блоки разных воркеров одного запуска не пересекаются"""
+        workers = [IdAllocator(worker=w, run_slot=7) for w in range(4)]
+        ranges = [set(a.next_id() for _ in range(100)) for a in workers]
+        assert all(a.isdisjoint(b) for i, a in enumerate(ranges) for b in ranges[i + 1:])
+        assert all(a.base <= min(r) and max(r) < a.base + BLOCK_SIZE for a, r in zip(workers, ranges))
+
+    def test_usernames_are_namespaced(self):
+        """Тест что имена пользователей разных воркеров различаются"""
+        first = IdAllocator(worker=0, run_slot=3).username()
+        second = IdAllocator(worker=1, run_slot=3).username()
+        assert first != second
+
+    @pytest.mark.parametrize("value, expected", [("gw5", 5), ("master", 0), ("", 0)])
+    def test_current_worker_from_xdist(self, monkeypatch, value, expected):
+        """Тест определения номера воркера по PYTEST_XDIST_WORKER"""
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", value)
+        assert current_worker() == expected
@@ -0,0 +1,75 @@
+import pytest
+import requests
+
+from src.api import petstore_api
+from src.api.instrumentation import RequestCollector
+from src.api.petstore_api import PetStoreAPI
+
+
+class TestRequestHooks:
+    """Тесты pre/post хуков PetStoreAPI"""
+
+    def test_hooks_receive_template_status_and_timings(self, api_client, random_pet_data):
+        """Тест что хуки получают шаблон пути, статус, байты и фазы"""
+        seen = []
+        api_client.add_pre_request_hook(lambda info: seen.append(("pre", info.status)))
+        api_client.add_post_request_hook(lambda info: seen.append(("post", info)))
+
+        api_client.create_pet(random_pet_data)
+        api_client.get_pet_by_id(random_pet_data["id"])
+
+        assert seen[0] == ("pre", None)
+        info = seen[3][1]
+        assert (info.method, info.endpoint, info.status) == ("GET", "/pet/{petId}", 200)
+        assert seen[1][1].request_bytes > 0
+        assert info.response_bytes > 0
+        assert {"ttfb", "download", "decode", "total"} <= set(info.timings)
+        assert info.timings["total"] >= info.timings["ttfb"]
+
+    def test_query_is_stripped_from_endpoint(self, api_client):
+        """Тест что шаблон пути не содержит query-параметров"""
+        endpoints = []
+        api_client.add_post_request_hook(lambda info: endpoints.append(info.endpoint))
+        api_client.find_pets_by_status("sold")
+        assert endpoints == ["/pet/findByStatus"]
+
+    def test_post_hook_sees_errors(self):
+        """Тест что post-хук вызывается и при сетевой ошибке"""
+        infos = []
+        client = PetStoreAPI("http://127.0.0.1:9/v2")
+        client.add_post_request_hook(infos.append)
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.get_inventory()
+        assert isinstance(infos[0].error, requests.exceptions.ConnectionError)
+
+    def test_no_request_info_without_subscribers(self, api_client, monkeypatch):
+        """Тест что без подписчиков RequestInfo не создается"""
+        monkeypatch.setattr(petstore_api, "RequestInfo", lambda *args: pytest.fail("RequestInfo created"))
+        assert api_client.get_inventory().status_code == 200
+
+    def test_removed_hook_is_not_called(self, api_client):
+        """Тест отписки хука"""
+        calls = []
+        api_client.add_post_request_hook(calls.append)
+        api_client.remove_request_hook(calls.append)
+        api_client.get_inventory()
+        assert calls == []
+
+
+class TestRequestCollector:
+    """Тесты встроенного сборщика метрик"""
+
+    def test_collector_aggregates_per_endpoint(self, api_client):
+        """Тест агрегации по (метод, шаблон пути)"""
+        collector = RequestCollector().install(api_client)
+        for pet_id in (1, 2, 3):
+            api_client.get_pet_by_id(999000000 + pet_id)
+        api_client.get_inventory()
+
+        summary = collector.summary()
+
+        assert summary["GET /pet/{petId}"]["count"] == 3
+        assert summary["GET /pet/{petId}"]["statuses"] == {404: 3}
+        assert summary["GET /store/inventory"]["count"] == 1
+        assert "GET /pet/{petId}" in collector.report()
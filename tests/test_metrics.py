@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from src.api.metrics import LatencyHistogram
+
+
+class TestLatencyHistogram:
+    """Тесты гистограммы задержек"""
+
+    def test_percentiles_within_precision(self):
+        """Тест что перцентили совпадают с точными в пределах погрешности корзин"""
+        rng = random.Random(42)
+        values = sorted(rng.uniform(0.001, 2.0) for _ in range(20000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for p in (50, 90, 99):
+            exact = values[int(p / 100 * len(values)) - 1]
+            assert histogram.percentile(p) == pytest.approx(exact, rel=1 / 64)
+        assert histogram.max == pytest.approx(values[-1], abs=1e-6)
+
+    def test_memory_is_bounded(self):
+        """Тест что число корзин не растет вместе с числом значений"""
+        histogram = LatencyHistogram()
+        for i in range(100000):
+            histogram.record(i / 100000)
+        assert len(histogram._counts) < 2000
+
+    def test_merge_and_roundtrip(self):
+        """Тест объединения гистограмм и сериализации"""
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(0.010)
+        second.record(0.030)
+        first.merge(second)
+
+        restored = LatencyHistogram.from_dict(first.to_dict())
+
+        assert restored.count == 2
+        assert restored.percentile(100) == pytest.approx(0.030, rel=1 / 64)
+        assert restored.percentile(1) == pytest.approx(0.010, rel=1 / 64)
+
+    def test_empty_histogram(self):
+        """Тест пустой гистограммы"""
+        assert LatencyHistogram().summary()["p99_ms"] == 0.0
@@ -0,0 +1,76 @@
+import sys
+
+import pytest
+import requests
+
+from src.api.models import Category, Order, Pet, SchemaError, Tag, User
+
+
+class TestModels:
+    """Тесты компактных моделей Pet, Order и User"""
+
+    def test_pet_roundtrip(self, random_pet_data):
+        """Тест что decode/encode питомца не теряет данных"""
+        pet = Pet.from_dict(random_pet_data)
+
+        assert pet.category == Category(id=1, name="dogs")
+        assert pet.tags == [Tag(id=1, name="friendly")]
+        assert pet.photo_urls == random_pet_data["photoUrls"]
+        assert pet.to_dict() == random_pet_data
+
+    def test_order_and_user_roundtrip(self, random_order_data, random_user_data):
+        """Тест decode/encode заказа и пользователя"""
+        assert Order.from_dict(random_order_data).to_dict() == random_order_data
+        assert User.from_dict(random_user_data).to_dict() == random_user_data
+
+    @pytest.mark.parametrize("data, path", [
+        ({"photoUrls": []}, "Pet.name"),
+        ({"name": "Rex", "photoUrls": [], "status": "lost"}, "Pet.status"),
+        ({"name": "Rex", "photoUrls": [], "category": {"id": "1"}}, "Pet.category.id"),
+        ({"name": "Rex", "photoUrls": [], "tags": [{"id": 1}, {"name": 2}]}, "Pet.tags[1].name"),
+        ([], "Pet"),
+    ])
+    def test_schema_mismatch_is_reported_with_path(self, data, path):
+        """Тест что несоответствие схеме обнаруживается при декодировании"""
+        with pytest.raises(SchemaError) as error:
+            Pet.from_dict(data)
+        assert error.value.path == path
+
+    def test_models_have_no_instance_dict(self):
+        """Тест что модели компактнее dict с теми же полями"""
+        data = {"id": 1, "name": "Rex", "photoUrls": [], "status": "available"}
+        pet = Pet.from_dict(data)
+
+        assert not hasattr(pet, "__dict__")
+        assert sys.getsizeof(pet) < sys.getsizeof(data)
+
+    def test_unknown_field_rejected(self):
+        """Тест что конструктор не принимает неизвестные поля"""
+        with pytest.raises(TypeError):
+            Pet(name="Rex", colour="brown")
+
+
+class TestTypedClient:
+    """Тесты типизированных методов клиента"""
+
+    def test_create_and_get_pet_model(self, api_client, id_allocator):
+        """Тест создания и получения питомца в виде модели"""
+        pet = Pet(id=id_allocator.next_id(), name="TypedPet", photo_urls=[], tags=[], status="pending",
+                  category=Category(id=2, name="Cats"))
+
+        created = api_client.create_pet_model(pet)
+
+        assert created == pet
+        assert api_client.get_pet_model(pet.id) == pet
+        assert pet.id in [p.id for p in api_client.find_pet_models_by_status("pending")]
+        assert pet.id in [p.id for p in api_client.iter_pet_models_by_status("pending")]
+
+    def test_typed_method_raises_on_404(self, api_client):
+        """Тест что отсутствующий питомец дает HTTPError"""
+        with pytest.raises(requests.HTTPError):
+            api_client.get_pet_model(999999999)
+
+    def test_order_model(self, api_client, random_order_data):
+        """Тест заказа в виде модели"""
+        order = api_client.create_order_model(Order.from_dict(random_order_data))
+        assert api_client.get_order_model(order.id) == order
@@ -1,5 +1,4 @@
 import pytest
-import random
 
 
 class TestPetAPI:
@@ -75,7 +74,7 @@ class TestPetAPI:
             except ValueError:
                 pass
     
-    def test_pet_creation_with_different_categories(self, api_client):
+    def test_pet_creation_with_different_categories(self, api_client, id_allocator):
         """Тест создания питомцев с разными категориями"""
         # Различные категории питомцев
         categories = [
@@ -88,7 +87,7 @@ class TestPetAPI:
         for category in categories:
             # Создаем питомца с каждой категорией
             pet_data = {
-                "id": random.randint(1000000, 9999999),
+                "id": id_allocator.next_id(),
                 "category": category,
                 "name": f"TestPet{category['name']}",
                 "photoUrls": ["https://example.com/photo.jpg"],
@@ -104,10 +103,10 @@ class TestPetAPI:
             assert response_data["category"]["id"] == category["id"]
             assert response_data["category"]["name"] == category["name"]
     
-    def test_pet_creation_with_multiple_tags(self, api_client):
+    def test_pet_creation_with_multiple_tags(self, api_client, id_allocator):
         """Тест создания питомца с несколькими тегами"""
         pet_data = {
-            "id": random.randint(1000000, 9999999),
+            "id": id_allocator.next_id(),
             "name": "MultiTagPet",
             "photoUrls": ["https://example.com/photo1.jpg", "https://example.com/photo2.jpg"],
             "tags": [
@@ -142,10 +141,10 @@ class TestPetAPI:
         for pet in pets:
             assert pet["status"] == status
     
-    def test_create_pet_with_minimal_data(self, api_client):
+    def test_create_pet_with_minimal_data(self, api_client, id_allocator):
         """Тест создания питомца с минимальным набором данных"""
         minimal_data = {
-            "id": random.randint(1000000, 9999999),
+            "id": id_allocator.next_id(),
             "name": "MinimalPet",
             "status": "available"
         }
@@ -157,10 +156,10 @@ class TestPetAPI:
         assert response_data["name"] == "MinimalPet"
         assert response_data["status"] == "available"
     
-    def test_create_pet_with_full_data(self, api_client):
+    def test_create_pet_with_full_data(self, api_client, id_allocator):
         """Тест создания питомца с полным набором данных"""
         full_data = {
-            "id": random.randint(1000000, 9999999),
+            "id": id_allocator.next_id(),
             "category": {
                 "id": 1,
                 "name": "Cats"
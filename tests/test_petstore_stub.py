@@ -0,0 +1,67 @@
+import pytest
+
+from src.api.petstore_api import PetStoreAPI
+from src.api.petstore_stub import PetStoreStub, PetStoreState
+
+
+@pytest.fixture(scope="module")
+def stub_client():
+    """Клиент, всегда работающий с локальной заглушкой (даже при PETSTORE_BASE_URL)"""
+    with PetStoreStub() as stub:
+        yield PetStoreAPI(stub.base_url)
+
+
+class TestPetStoreStub:
+    """Тесты локальной заглушки PetStore"""
+
+    def test_pet_read_after_write(self, stub_client, random_pet_data):
+        """Тест что заглушка сохраняет питомца и отдает его по id"""
+        stub_client.create_pet(random_pet_data)
+
+        response = stub_client.get_pet_by_id(random_pet_data["id"])
+
+        assert response.status_code == 200
+        assert response.json() == random_pet_data
+
+    def test_status_index_follows_updates(self, stub_client, random_pet_data):
+        """Тест что индекс по статусу обновляется вместе с питомцем"""
+        stub_client.create_pet(random_pet_data)
+        stub_client.update_pet(dict(random_pet_data, status="sold"))
+
+        available_ids = [pet["id"] for pet in stub_client.find_pets_by_status("available").json()]
+        sold_ids = [pet["id"] for pet in stub_client.find_pets_by_status("sold").json()]
+
+        assert random_pet_data["id"] not in available_ids
+        assert random_pet_data["id"] in sold_ids
+
+    def test_user_lifecycle(self, stub_client, random_user_data):
+        """Тест полного цикла пользователя в заглушке"""
+        username = random_user_data["username"]
+        stub_client.create_user(random_user_data)
+        stub_client.update_user(username, dict(random_user_data, firstName="Updated"))
+
+        assert stub_client.get_user_by_username(username).json()["firstName"] == "Updated"
+        assert stub_client.delete_user(username).status_code == 200
+        assert stub_client.get_user_by_username(username).status_code == 404
+
+    def test_inventory_counts_pets_by_status(self):
+        """Тест подсчета инвентаря по индексу статусов"""
+        state = PetStoreState()
+        state.save_pet({"id": 1, "status": "available"})
+        state.save_pet({"id": 2, "status": "sold"})
+        state.save_pet({"id": 3, "status": "sold"})
+        state.delete_pet(1)
+
+        assert state.inventory() == {"available": 0, "pending": 0, "sold": 2}
+
+    def test_invalid_body_returns_400(self, stub_client):
+        """Тест что некорректный JSON отклоняется с 400"""
+        response = stub_client._make_request("POST", "/pet", data="not json")
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("body", [{"id": "abc"}, {"id": 2 ** 63}, {"id": 1, "status": ["sold"]}])
+    def test_wrong_field_type_returns_500(self, stub_client, body):
+        """Тест что неверный тип id или статуса дает 500 с ApiResponse, как у реального сервиса"""
+        response = stub_client.create_pet(body)
+        assert response.status_code == 500
+        assert response.json()["message"] == "something bad happened"
@@ -0,0 +1,104 @@
+import pytest
+import requests
+
+from src.api.petstore_api import PetStoreAPI
+from src.api.rate_limiter import RateLimiter, parse_retry_after
+
+
+class FakeClock:
+    """Управляемые часы: sleep лишь сдвигает время"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestRateLimiter:
+    """Тесты адаптивного token bucket"""
+
+    def test_burst_passes_without_waiting(self, clock):
+        """Тест что запросы в пределах burst не ждут"""
+        limiter = RateLimiter(rate=10, burst=3, clock=clock, sleep=clock.sleep)
+        waits = [limiter.acquire() for _ in range(3)]
+        assert waits == [0, 0, 0]
+
+    def test_rate_is_enforced_after_burst(self, clock):
+        """Тест что после исчерпания burst запросы идут со скоростью rate"""
+        limiter = RateLimiter(rate=10, burst=1, clock=clock, sleep=clock.sleep)
+        for _ in range(5):
+            limiter.acquire()
+        assert clock.now == pytest.approx(0.4)
+
+    def test_unlimited_limiter_never_waits(self, clock):
+        """Тест что без rate лимитер не ждет, пока сервер не ответит 429"""
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        for _ in range(100):
+            limiter.acquire()
+        assert clock.sleeps == []
+
+    def test_retry_after_pauses_and_halves_rate(self, clock):
+        """Тест что 429 с Retry-After ставит паузу и снижает скорость"""
+        limiter = RateLimiter(rate=8, burst=1, clock=clock, sleep=clock.sleep)
+        limiter.acquire()
+
+        assert limiter.on_throttle("2") == 2
+        assert limiter.current_rate == 4
+        limiter.acquire()
+        assert clock.now == pytest.approx(2.0)
+
+    def test_backoff_grows_without_retry_after(self, clock):
+        """Тест экспоненциальной паузы при 429 без Retry-After"""
+        limiter = RateLimiter(backoff=0.5, max_backoff=3, clock=clock, sleep=clock.sleep)
+        delays = [limiter.on_throttle() for _ in range(5)]
+        assert delays == [0.5, 1.0, 2.0, 3, 3]
+
+    def test_success_restores_rate(self, clock):
+        """Тест что успешные ответы возвращают скорость к настроенной"""
+        limiter = RateLimiter(rate=10, clock=clock, sleep=clock.sleep)
+        limiter.on_throttle("0")
+        for _ in range(10):
+            limiter.on_success()
+        assert limiter.current_rate == 10
+
+    @pytest.mark.parametrize("value, expected", [("3", 3.0), ("", None), ("soon", None),
+                                                 ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0)])
+    def test_parse_retry_after(self, value, expected):
+        """Тест разбора заголовка Retry-After"""
+        assert parse_retry_after(value) == expected
+
+
+class TestClientThrottling:
+    """Тесты обработки 429 в PetStoreAPI"""
+
+    def test_client_retries_throttled_request(self, clock, monkeypatch):
+        """Тест что клиент повторяет запрос после 429 с учетом Retry-After"""
+        statuses = iter([429, 429, 200])
+
+        def fake_request(method, url, **kwargs):
+            response = requests.Response()
+            response.status_code = next(statuses)
+            response.headers["Retry-After"] = "1"
+            response._content = b"{}"
+            return response
+
+        limiter = RateLimiter(clock=clock, sleep=clock.sleep)
+        client = PetStoreAPI("http://petstore.local/v2", rate_limiter=limiter)
+        monkeypatch.setattr(client.session, "request", fake_request)
+
+        response = client.get_inventory()
+
+        assert response.status_code == 200
+        assert limiter.throttled == 2
+        assert clock.sleeps == [1.0, 1.0]
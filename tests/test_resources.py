@@ -0,0 +1,138 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from src.api.petstore_api import PetStoreAPI
+from src.api.petstore_stub import PetStoreStub
+from src.api.resources import ORDERS, PETS, USERS, ResourceTracker
+
+
+def make_response(status_code, content=b"{}"):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    return response
+
+
+@pytest.fixture(scope="module")
+def stub():
+    with PetStoreStub() as stub:
+        yield stub
+
+
+class TestResourceTracker:
+    """Тесты учета созданных сущностей"""
+
+    def test_observe_creations_and_deletions(self):
+        """Тест что создание ставит сущность на учет, а удаление снимает"""
+        tracker = ResourceTracker()
+        tracker.observe("POST", "/pet", {"id": 1}, make_response(200))
+        tracker.observe("POST", "/store/order", {"id": 2}, make_response(200))
+        tracker.observe("POST", "/user/createWithList", [{"username": "a"}, {"username": "b"}],
+                        make_response(200))
+        assert tracker.pending() == {ORDERS: ["2"], PETS: ["1"], USERS: ["a", "b"]}
+
+        tracker.observe("DELETE", "/pet/1", None, make_response(200))
+        tracker.observe("DELETE", "/user/a", None, make_response(404))
+        assert tracker.pending() == {ORDERS: ["2"], PETS: [], USERS: ["b"]}
+
+    def test_failed_requests_are_ignored(self):
+        """Тест что неуспешное создание и неудачное удаление не меняют учет"""
+        tracker = ResourceTracker()
+        tracker.observe("POST", "/pet", {"id": 1}, make_response(500))
+        assert len(tracker) == 0
+
+        tracker.track(PETS, 1)
+        tracker.observe("DELETE", "/pet/1", None, make_response(500))
+        assert tracker.pending()[PETS] == ["1"]
+
+    def test_server_assigned_id_is_taken_from_response(self):
+        """Тест что id, назначенный сервером, берется из ответа"""
+        tracker = ResourceTracker()
+        tracker.observe("POST", "/pet", {"name": "NoId"}, make_response(200, b'{"id": 42}'))
+        assert tracker.pending()[PETS] == ["42"]
+
+    def test_client_reports_to_tracker(self, stub, id_allocator):
+        """Тест что клиент сообщает трекеру о созданных и удаленных сущностях"""
+        tracker = ResourceTracker()
+        client = PetStoreAPI(stub.base_url, resource_tracker=tracker)
+        pet_id, order_id = id_allocator.next_id(), id_allocator.next_id()
+        username = id_allocator.username()
+
+        client.create_pet({"id": pet_id, "name": "Tracked", "photoUrls": []})
+        client.create_order({"id": order_id, "petId": pet_id, "quantity": 1})
+        client.create_user({"id": id_allocator.next_id(), "username": username})
+        client.delete_pet(pet_id)
+
+        assert tracker.pending() == {ORDERS: [str(order_id)], PETS: [], USERS: [username]}
+
+
+class TestCleanup:
+    """Тесты удаления накопленных сущностей"""
+
+    def test_cleanup_deletes_everything(self, stub, id_allocator):
+        """Тест что cleanup удаляет все созданные сущности"""
+        tracker = ResourceTracker()
+        client = PetStoreAPI(stub.base_url, resource_tracker=tracker)
+        pet_ids = [id_allocator.next_id() for _ in range(10)]
+        for pet_id in pet_ids:
+            client.create_pet({"id": pet_id, "name": "Doomed", "photoUrls": []})
+        order_id = id_allocator.next_id()
+        client.create_order({"id": order_id, "petId": pet_ids[0], "quantity": 1})
+        usernames = [id_allocator.username() for _ in range(3)]
+        client.create_users_with_list([{"username": name} for name in usernames])
+
+        assert tracker.cleanup(client, concurrency=4) == []
+
+        assert len(tracker) == 0
+        assert all(client.get_pet_by_id(pet_id).status_code == 404 for pet_id in pet_ids)
+        assert client.get_order_by_id(order_id).status_code == 404
+        assert all(client.get_user_by_username(name).status_code == 404 for name in usernames)
+
+    def test_cleanup_is_bounded_and_ordered(self):
+        """Тест что удаление идет не больше чем в concurrency потоков и заказы удаляются первыми"""
+        tracker = ResourceTracker()
+        for i in range(20):
+            tracker.track(PETS, i)
+        tracker.track(ORDERS, 1)
+        lock = threading.Lock()
+        active, peak, calls = [0], [0], []
+
+        class FakeClient:
+            def _delete(self, kind, key):
+                with lock:
+                    calls.append(kind)
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.01)
+                with lock:
+                    active[0] -= 1
+                return make_response(200)
+
+            def delete_pet(self, key):
+                return self._delete(PETS, key)
+
+            def delete_order(self, key):
+                return self._delete(ORDERS, key)
+
+        assert tracker.cleanup(FakeClient(), concurrency=3) == []
+        assert peak[0] <= 3
+        assert calls[0] == ORDERS
+
+    def test_failures_stay_tracked(self):
+        """Тест что неудачные удаления возвращаются и остаются на учете"""
+        tracker = ResourceTracker()
+        tracker.track(USERS, "flaky")
+        tracker.track(USERS, "broken")
+
+        class FakeClient:
+            def delete_user(self, key):
+                if key == "broken":
+                    raise requests.exceptions.ConnectionError("down")
+                return make_response(500)
+
+        failures = tracker.cleanup(FakeClient())
+        assert sorted((kind, key) for kind, key, _ in failures) == [(USERS, "broken"), (USERS, "flaky")]
+        assert sorted(tracker.pending()[USERS]) == ["broken", "flaky"]
@@ -0,0 +1,96 @@
+import pytest
+import requests
+
+from src.api.cache import ResponseCache, invalidation_targets
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cached_client(make_api_client, clock):
+    """Клиент с кэшем и счетчиком реальных запросов"""
+    client = make_api_client(cache=ResponseCache(max_entries=8, ttl=10, clock=clock))
+    client.sent = []
+    client.add_post_request_hook(lambda info: client.sent.append((info.method, info.status)))
+    return client
+
+
+class TestResponseCache:
+    """Тесты кэша GET-ответов"""
+
+    def test_repeated_get_is_served_from_cache(self, cached_client):
+        """Тест что повторный GET не уходит на сервер"""
+        first = cached_client.get_inventory()
+        second = cached_client.get_inventory()
+
+        assert second is first
+        assert cached_client.sent == [("GET", 200)]
+        assert cached_client.cache.stats()["hits"] == 1
+
+    def test_stale_entry_revalidated_with_etag(self, cached_client, clock):
+        """Тест условного запроса If-None-Match после истечения TTL"""
+        first = cached_client.find_pets_by_status("sold")
+        clock.now += 11
+
+        second = cached_client.find_pets_by_status("sold")
+
+        assert second is first
+        assert cached_client.sent == [("GET", 200), ("GET", 304)]
+        assert cached_client.cache.revalidations == 1
+
+    def test_write_invalidates_related_keys(self, cached_client, random_pet_data):
+        """Тест что создание питомца сбрасывает /pet/{id}, findByStatus и инвентарь"""
+        pet_id = random_pet_data["id"]
+        assert cached_client.get_pet_by_id(pet_id).status_code == 404
+        before = cached_client.find_pets_by_status("available").json()
+        cached_client.get_inventory()
+
+        cached_client.create_pet(random_pet_data)
+
+        assert cached_client.get_pet_by_id(pet_id).status_code == 200
+        after = cached_client.find_pets_by_status("available").json()
+        assert len(after) == len(before) + 1
+        assert cached_client.cache.invalidations == 2
+
+    def test_update_user_invalidates_user(self, cached_client, random_user_data):
+        """Тест что update_user сбрасывает кэш /user/{username}"""
+        username = random_user_data["username"]
+        cached_client.create_user(random_user_data)
+        assert cached_client.get_user_by_username(username).json()["firstName"] == "Test"
+
+        cached_client.update_user(username, dict(random_user_data, firstName="New"))
+
+        assert cached_client.get_user_by_username(username).json()["firstName"] == "New"
+
+    def test_lru_eviction(self, clock):
+        """Тест вытеснения самой давно использованной записи"""
+        cache = ResponseCache(max_entries=2, clock=clock)
+        cache.store("/a", requests.Response())
+        cache.store("/b", requests.Response())
+        cache.lookup("/a")
+        cache.store("/c", requests.Response())
+
+        assert cache.lookup("/b") == (None, False)
+        assert cache.evictions == 1
+
+    @pytest.mark.parametrize("method, endpoint, body, keys, prefixes", [
+        ("PUT", "/pet", {"id": 5}, {"/pet/5", "/store/inventory"}, {"/pet/findByStatus"}),
+        ("DELETE", "/pet/5", None, {"/pet/5", "/store/inventory"}, {"/pet/findByStatus"}),
+        ("POST", "/store/order", {"id": 9}, {"/store/order/9", "/store/inventory"}, set()),
+        ("POST", "/user/createWithList", [{"username": "a"}, {"username": "b"}], {"/user/a", "/user/b"}, set()),
+        ("PUT", "/user/a", {"username": "b"}, {"/user/a", "/user/b"}, set()),
+    ])
+    def test_invalidation_targets(self, method, endpoint, body, keys, prefixes):
+        """Тест правил инвалидации для записей"""
+        assert invalidation_targets(method, endpoint, body) == (keys, prefixes)
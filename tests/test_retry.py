@@ -0,0 +1,193 @@
+import random
+
+import pytest
+import requests
+
+from src.api.petstore_api import PetStoreAPI
+from src.api.retry import CircuitBreaker, CircuitOpenError, RetryPolicy
+
+
+class FakeClock:
+    """Управляемые часы: sleep лишь сдвигает время"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_policy(clock, **kwargs):
+    return RetryPolicy(rng=random.Random(1), clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def make_response(status_code):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = b"{}"
+    return response
+
+
+def scripted_client(outcomes, **kwargs):
+    """Клиент, транспорт которого по очереди отдает статусы или выбрасывает исключения"""
+    outcomes = iter(outcomes)
+    calls = []
+
+    def fake_request(method, url, **request_kwargs):
+        calls.append((method, url))
+        outcome = next(outcomes)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return make_response(outcome)
+
+    client = PetStoreAPI("http://petstore.local/v2", **kwargs)
+    client.session.request = fake_request
+    return client, calls
+
+
+class TestRetryPolicy:
+    """Тесты политики повторов"""
+
+    def test_idempotency_table(self, clock):
+        """Тест что GET/PUT/DELETE идемпотентны, а POST /store/order нет"""
+        policy = make_policy(clock)
+        assert policy.is_idempotent("GET", "/pet/{petId}")
+        assert policy.is_idempotent("put", "/user/{username}")
+        assert policy.is_idempotent("DELETE", "/store/order/{orderId}")
+        assert not policy.is_idempotent("POST", "/store/order")
+
+    def test_endpoint_overrides(self, clock):
+        """Тест что таблицу можно переопределить для отдельных эндпоинтов"""
+        policy = make_policy(clock, idempotent_endpoints=[("POST", "/pet")],
+                             non_idempotent_endpoints=[("DELETE", "/user/{username}")])
+        assert policy.is_idempotent("POST", "/pet")
+        assert not policy.is_idempotent("DELETE", "/user/{username}")
+
+    def test_backoff_is_capped_full_jitter(self, clock):
+        """Тест что пауза случайна и не превышает min(max_backoff, backoff * 2^n)"""
+        policy = make_policy(clock, backoff=0.1, max_backoff=1.0)
+        for attempt in range(1, 10):
+            cap = min(1.0, 0.1 * 2 ** (attempt - 1))
+            delays = [policy.backoff_delay(attempt) for _ in range(50)]
+            assert all(0 <= delay <= cap for delay in delays)
+            assert len(set(delays)) > 1
+
+    def test_retries_5xx_until_success(self, clock):
+        """Тест что GET повторяется после 503"""
+        client, calls = scripted_client([503, 502, 200], retry_policy=make_policy(clock))
+        assert client.get_pet_by_id(1).status_code == 200
+        assert len(calls) == 3
+        assert len(clock.sleeps) == 2
+
+    def test_returns_last_response_when_attempts_exhausted(self, clock):
+        """Тест что после max_attempts возвращается последний 5xx"""
+        client, calls = scripted_client([500] * 5, retry_policy=make_policy(clock, max_attempts=3))
+        assert client.get_inventory().status_code == 500
+        assert len(calls) == 3
+
+    def test_post_order_is_not_retried(self, clock):
+        """Тест что POST /store/order не повторяется ни при 5xx, ни при разрыве соединения"""
+        client, calls = scripted_client([503], retry_policy=make_policy(clock))
+        assert client.create_order({"id": 1}).status_code == 503
+        assert len(calls) == 1
+
+        client, calls = scripted_client([requests.exceptions.ConnectionError("reset")],
+                                        retry_policy=make_policy(clock))
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.create_order({"id": 1})
+        assert len(calls) == 1
+
+    def test_connect_timeout_is_retried_for_post(self, clock):
+        """Тест что ConnectTimeout повторяется даже для POST: запрос не был отправлен"""
+        client, calls = scripted_client([requests.exceptions.ConnectTimeout("connect"), 200],
+                                        retry_policy=make_policy(clock))
+        assert client.create_order({"id": 1}).status_code == 200
+        assert len(calls) == 2
+
+    def test_connection_errors_are_retried_for_idempotent(self, clock):
+        """Тест что DELETE повторяется после сетевой ошибки"""
+        client, calls = scripted_client([requests.exceptions.ConnectionError("reset"), 200],
+                                        retry_policy=make_policy(clock))
+        assert client.delete_user("someone").status_code == 200
+        assert len(calls) == 2
+
+    def test_deadline_stops_retries(self, clock):
+        """Тест что повторы прекращаются, когда следующая пауза выходит за дедлайн"""
+        policy = make_policy(clock, max_attempts=100, backoff=1.0, max_backoff=1.0, deadline=3.0)
+        client, calls = scripted_client([500] * 100, retry_policy=policy)
+        assert client.get_inventory().status_code == 500
+        assert clock.now < 3.0
+        assert 1 < len(calls) < 100
+
+
+class TestCircuitBreaker:
+    """Тесты предохранителя"""
+
+    def test_opens_after_threshold_and_fails_fast(self, clock):
+        """Тест что после серии ошибок запросы отклоняются без обращения к серверу"""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+        client, calls = scripted_client([requests.exceptions.ConnectionError("down")] * 3,
+                                        circuit_breaker=breaker)
+        for _ in range(3):
+            with pytest.raises(requests.exceptions.ConnectionError):
+                client.get_inventory()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        with pytest.raises(CircuitOpenError):
+            client.get_inventory()
+        assert len(calls) == 3
+        assert breaker.rejected == 1
+
+    def test_half_open_trial_closes_on_success(self, clock):
+        """Тест что после reset_timeout пробный успешный запрос замыкает цепь"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        clock.now += 10
+        breaker.before_call()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()  # пока идет пробный запрос, остальные отклоняются
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_trial_failure_reopens(self, clock):
+        """Тест что неудачный пробный запрос снова размыкает цепь"""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+        breaker.record_failure()
+        breaker.record_failure()
+        clock.now += 10
+        breaker.before_call()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_4xx_counts_as_success(self, clock):
+        """Тест что 404 не считается отказом backend"""
+        breaker = CircuitBreaker(failure_threshold=2, clock=clock)
+        client, _ = scripted_client([500, 404, 500], circuit_breaker=breaker)
+        for _ in range(3):
+            client.get_pet_by_id(1)
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_open_circuit_is_not_retried(self, clock):
+        """Тест что политика не повторяет отклоненные предохранителем запросы"""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60, clock=clock)
+        policy = make_policy(clock, max_attempts=5)
+        client, calls = scripted_client([500], retry_policy=policy, circuit_breaker=breaker)
+        with pytest.raises(CircuitOpenError):
+            client.get_inventory()
+        assert len(calls) == 1
@@ -52,11 +52,11 @@ class TestStoreAPI:
         # PetStore возвращает 404 для несуществующих заказов
         assert response.status_code == 404
     
-    def test_create_order_with_minimal_data(self, api_client):
+    def test_create_order_with_minimal_data(self, api_client, id_allocator):
         """Тест создания заказа с минимальными данными"""
         minimal_order = {
-            "id": 1,
-            "petId": 1,
+            "id": id_allocator.next_id(),
+            "petId": id_allocator.next_id(),
             "quantity": 1,
             "status": "placed",
             "complete": True
@@ -0,0 +1,67 @@
+import json
+import tracemalloc
+
+import pytest
+
+from src.api.streaming import StreamingJSONError, iter_json_array
+
+
+def split(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+class TestIterJsonArray:
+    """Тесты инкрементального разбора JSON-массива"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 17, 4096])
+    def test_matches_json_loads_for_any_chunking(self, chunk_size):
+        """Тест что результат не зависит от разбиения на чанки"""
+        items = [{"id": i, "name": f"Пёс{i}", "tags": [{"id": 1, "name": "x"}]} for i in range(20)]
+        items += [12345, -1.5e3, "text", True, None, []]
+        data = json.dumps(items, ensure_ascii=False).encode()
+
+        assert list(iter_json_array(split(data, chunk_size))) == items
+
+    def test_empty_array(self):
+        """Тест пустого массива"""
+        assert list(iter_json_array([b" [", b" ] "])) == []
+
+    @pytest.mark.parametrize("data", [b"{}", b"[1 2]", b"[1", b"[1] x", b"[1x]"])
+    def test_malformed_input(self, data):
+        """Тест что некорректный поток приводит к StreamingJSONError"""
+        with pytest.raises(StreamingJSONError):
+            list(iter_json_array(split(data, 1)))
+
+    def test_memory_stays_flat(self):
+        """Тест что память не растет с размером массива"""
+        pet = json.dumps({"id": 1, "name": "Pet", "photoUrls": ["https://example.com/p.jpg"],
+                          "status": "available"}).encode()
+
+        def chunks(count):
+            yield b"["
+            for i in range(count):
+                yield (b"," if i else b"") + pet
+            yield b"]"
+
+        tracemalloc.start()
+        try:
+            consumed = sum(1 for _ in iter_json_array(chunks(50000)))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert consumed == 50000
+        assert peak < 256 * 1024
+
+
+class TestIterPetsByStatus:
+    """Тесты потокового поиска питомцев"""
+
+    def test_streams_same_pets_as_buffered_call(self, api_client, random_pet_data):
+        """Тест что потоковый вариант отдает тех же питомцев, что и обычный"""
+        api_client.create_pet(dict(random_pet_data, status="pending"))
+
+        streamed = list(api_client.iter_pets_by_status("pending", chunk_size=64))
+
+        assert streamed == api_client.find_pets_by_status("pending").json()
+        assert all(pet["status"] == "pending" for pet in streamed)
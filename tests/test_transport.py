@@ -0,0 +1,59 @@
+import pytest
+
+from src.api.petstore_api import PetStoreAPI
+from src.api.petstore_stub import PetStoreStub
+from src.api.transport import (CassetteMiss, CassetteWriter, RecordingTransport, ReplayTransport,
+                               request_key)
+
+
+@pytest.fixture
+def recorded(tmp_path):
+    """Записывает короткий сценарий против собственной заглушки и возвращает путь к кассете"""
+    path = str(tmp_path / "scenario.cassette")
+    writer = CassetteWriter(path)
+    with PetStoreStub() as stub:
+        client = PetStoreAPI(stub.base_url)
+        client.transport = RecordingTransport(client.transport, writer)
+        pet = {"id": 101, "name": "Rex", "photoUrls": [], "status": "sold"}
+        client.get_pet_by_id(101)
+        client.create_pet(pet)
+        client.get_pet_by_id(101)
+        list(client.iter_pets_by_status("sold"))
+    writer.close()
+    return path
+
+
+class TestCassettes:
+    """Тесты записи и воспроизведения кассет"""
+
+    def test_replay_reproduces_recorded_responses(self, recorded):
+        """Тест что воспроизведение дает те же ответы без сервера"""
+        replay = ReplayTransport(recorded)
+        client = PetStoreAPI("http://cassette.invalid/v2", transport=replay)
+
+        assert client.get_pet_by_id(101).status_code == 404
+        assert client.create_pet({"status": "sold", "photoUrls": [], "name": "Rex", "id": 101}).json()["id"] == 101
+        assert client.get_pet_by_id(101).json()["name"] == "Rex"
+        assert [pet["id"] for pet in client.iter_pets_by_status("sold")] == [101]
+        assert len(replay) == 4
+        replay.close()
+
+    def test_unknown_request_raises_cassette_miss(self, recorded):
+        """Тест что запрос вне кассеты не уходит в сеть, а падает с CassetteMiss"""
+        client = PetStoreAPI("http://cassette.invalid/v2", transport=ReplayTransport(recorded))
+        with pytest.raises(CassetteMiss):
+            client.get_inventory()
+
+    def test_key_ignores_host_and_json_key_order(self):
+        """Тест нормализации ключа запроса"""
+        first = request_key("post", "http://127.0.0.1:4321/v2/pet", {"id": 1, "name": "a"})
+        second = request_key("POST", "https://petstore.swagger.io/v2/pet", {"name": "a", "id": 1})
+        assert first == second
+        assert first != request_key("POST", "http://h/v2/pet", {"name": "b", "id": 1})
+
+    def test_rejects_foreign_file(self, tmp_path):
+        """Тест что чужой файл не принимается за кассету"""
+        path = tmp_path / "not.cassette"
+        path.write_bytes(b"hello")
+        with pytest.raises(ValueError):
+            ReplayTransport(str(path))
@@ -19,28 +19,29 @@ class TestUserAPI:
         response = api_client.get_user_by_username("nonexistentuser12345xyz")
         assert response.status_code == 404
     
-    def test_create_users_with_list_behavior(self, api_client):
+    def test_create_users_with_list_behavior(self, api_client, id_allocator):
         """Тест поведения создания нескольких пользователей через список"""
         # Используем уникальные ID чтобы избежать конфликтов
-        timestamp = int(time.time() * 1000)
+        first_id = id_allocator.next_id()
+        second_id = id_allocator.next_id()
         
         users_list = [
             {
-                "id": timestamp + 1,
-                "username": f"testuser{timestamp + 1}",
+                "id": first_id,
+                "username": f"testuser{first_id}",
                 "firstName": "John",
                 "lastName": "Doe",
-                "email": f"john{timestamp + 1}@example.com",
+                "email": f"john{first_id}@example.com",
                 "password": "password123",
                 "phone": "123-456-7890",
                 "userStatus": 1
             },
             {
-                "id": timestamp + 2,
-                "username": f"testuser{timestamp + 2}", 
+                "id": second_id,
+                "username": f"testuser{second_id}", 
                 "firstName": "Jane",
                 "lastName": "Smith",
-                "email": f"jane{timestamp + 2}@example.com",
+                "email": f"jane{second_id}@example.com",
                 "password": "password456",
                 "phone": "098-765-4321",
                 "userStatus": 1
@@ -51,13 +52,6 @@ class TestUserAPI:
         
         # Проверяем только что запрос выполнен успешно
         assert response.status_code == 200
-        
-        # Пробуем удалить, но не проверяем результат
-        for user in users_list:
-            try:
-                api_client.delete_user(user["username"])
-            except:
-                pass
     
     def test_update_user_behavior(self, api_client, random_user_data):
         """Тест поведения обновления пользователя - проверяем только ответ"""
@@ -83,11 +77,6 @@ class TestUserAPI:
         
         # Проверяем только что запрос на обновление вернул 200
         assert response.status_code == 200
-        
-        try:
-            api_client.delete_user(username)
-        except:
-            pass
     
     def test_delete_endpoint_availability(self, api_client):
         """Тест что DELETE endpoint доступен и возвращает ответ"""
@@ -99,18 +88,20 @@ class TestUserAPI:
         assert response.status_code in [200, 404]
         assert response.status_code < 500  # Убеждаемся что нет серверных ошибок
 
-    def test_user_creation_with_different_data(self, api_client):
+    def test_user_creation_with_different_data(self, api_client, id_allocator):
         """Тест создания пользователей с разными наборами данных"""
+        min_id = id_allocator.next_id()
+        full_id = id_allocator.next_id()
         # Различные вариации данных пользователя
         test_cases = [
             {
                 "name": "minimal_user",
                 "data": {
-                    "id": int(time.time() * 1000) + 1,
-                    "username": f"minuser{int(time.time() * 1000) + 1}",
+                    "id": min_id,
+                    "username": f"minuser{min_id}",
                     "firstName": "Min",
                     "lastName": "User",
-                    "email": f"min{int(time.time() * 1000) + 1}@example.com",
+                    "email": f"min{min_id}@example.com",
                     "password": "pass123",
                     "userStatus": 1
                 }
@@ -118,11 +109,11 @@ class TestUserAPI:
             {
                 "name": "full_user", 
                 "data": {
-                    "id": int(time.time() * 1000) + 2,
-                    "username": f"fulluser{int(time.time() * 1000) + 2}",
+                    "id": full_id,
+                    "username": f"fulluser{full_id}",
                     "firstName": "Full",
                     "lastName": "User",
-                    "email": f"full{int(time.time() * 1000) + 2}@example.com",
+                    "email": f"full{full_id}@example.com",
                     "password": "password123",
                     "phone": "123-456-7890",
                     "userStatus": 0
@@ -135,11 +126,6 @@ class TestUserAPI:
             response = api_client.create_user(test_case["data"])
             
             assert response.status_code == 200, f"Failed to create {test_case['name']}"
-            
-            try:
-                api_client.delete_user(test_case["data"]["username"])
-            except:
-                pass
 
     # def test_user_workflow_when_available(self, api_client):
     #     """Тест полного workflow когда пользователь доступен в системе"""
@@ -190,15 +176,16 @@ class TestUserAPI:
     #         # Пропускаем полный workflow без ошибки
     #         pytest.skip("User is not available in demo API - skipping full workflow test")
 
-    def test_user_creation_always_returns_200(self, api_client):
+    def test_user_creation_always_returns_200(self, api_client, id_allocator):
         """Тест что создание пользователя всегда возвращает 200"""
         # Этот тест всегда должен проходить
+        user_id = id_allocator.next_id()
         user_data = {
-            "id": int(time.time() * 1000000),
-            "username": f"always200user{int(time.time() * 1000000)}",
+            "id": user_id,
+            "username": f"always200user{user_id}",
             "firstName": "Always",
             "lastName": "Works",
-            "email": f"always{int(time.time() * 1000000)}@example.com",
+            "email": f"always{user_id}@example.com",
             "password": "password123",
             "phone": "123-456-7890",
             "userStatus": 1
@@ -0,0 +1,125 @@
+import json
+import threading
+import time
+
+import pytest
+import requests
+
+from src.tools.workflow_runner import Step, Workflow, WorkflowRunner, pet_order_workflow
+
+
+def make_response(status_code, data=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(data).encode() if data is not None else b""
+    return response
+
+
+def respond(status_code=200, data=None, delay=0.0, log=None, name=None):
+    """Шаг без сети: пишет в log (имя, момент начала, момент конца) и отдает готовый ответ"""
+    def call(client, variables):
+        started = time.perf_counter()
+        time.sleep(delay)
+        if log is not None:
+            log.append((name, started, time.perf_counter(), dict(variables)))
+        return make_response(status_code, data)
+    return call
+
+
+class TestWorkflow:
+    """Тесты описания сценария"""
+
+    @pytest.mark.parametrize("steps, message", [
+        ([Step("a", respond(), needs=["b"]), Step("b", respond(), needs=["a"])], "cycle"),
+        ([Step("a", respond(), needs=["missing"])], "unknown step"),
+        ([Step("a", respond()), Step("a", respond())], "duplicate step"),
+        ([Step("a", respond(), extract={"x": "id"}), Step("b", respond(), extract={"x": "id"})],
+         "extracted by both"),
+    ])
+    def test_invalid_graphs_are_rejected(self, steps, message):
+        """Тест что ошибки в графе обнаруживаются при создании сценария"""
+        with pytest.raises(ValueError, match=message):
+            Workflow("broken", steps)
+
+    def test_topological_order(self):
+        """Тест что шаги упорядочены по зависимостям"""
+        workflow = Workflow("w", [Step("c", respond(), needs=["a", "b"]), Step("b", respond(), needs=["a"]),
+                                  Step("a", respond())])
+        assert workflow.order == ["a", "b", "c"]
+
+
+class TestWorkflowRunner:
+    """Тесты выполнения сценариев"""
+
+    def test_independent_steps_run_concurrently_and_pass_values(self):
+        """Тест что шаги без взаимной зависимости идут параллельно и получают извлеченные значения"""
+        log = []
+        workflow = Workflow("w", [
+            Step("create", respond(data={"id": 7, "category": {"id": 3}}, log=log, name="create"),
+                 extract={"pet_id": "id", "category_id": "category.id"}),
+            Step("left", respond(delay=0.1, log=log, name="left"), needs=["create"]),
+            Step("right", respond(delay=0.1, log=log, name="right"), needs=["create"]),
+            Step("join", respond(log=log, name="join"), needs=["left", "right"]),
+        ])
+
+        result = WorkflowRunner(client=None, concurrency=4).run(workflow, params=lambda i: {"index": i})
+
+        assert result.failed == 0 and result.journey.count == 1
+        steps = {name: (started, ended, variables) for name, started, ended, variables in log}
+        assert steps["left"][0] < steps["right"][1] and steps["right"][0] < steps["left"][1]
+        assert steps["join"][0] >= max(steps["left"][1], steps["right"][1])
+        assert steps["join"][2] == {"index": 0, "pet_id": 7, "category_id": 3}
+
+    def test_failed_step_skips_dependents(self):
+        """Тест что после ошибки зависимые шаги не выполняются, а независимые завершаются"""
+        log = []
+        workflow = Workflow("w", [
+            Step("bad", respond(404, log=log, name="bad")),
+            Step("after_bad", respond(log=log, name="after_bad"), needs=["bad"]),
+            Step("good", respond(delay=0.05, log=log, name="good")),
+        ])
+
+        result = WorkflowRunner(client=None).run(workflow, instances=3)
+
+        assert result.failed == 3 and result.journey.count == 0
+        assert sorted(name for name, *_ in log) == ["bad"] * 3 + ["good"] * 3
+        assert result.failures[0].step == "bad" and result.failures[0].error == "status 404"
+        assert result.steps["good"].errors == 0
+
+    def test_instances_are_pipelined(self):
+        """Тест что экземпляры идут одновременно, но не больше max_active"""
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def call(client, variables):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return make_response(200)
+
+        workflow = Workflow("w", [Step("a", call), Step("b", call, needs=["a"])])
+        started = time.perf_counter()
+        result = WorkflowRunner(client=None, concurrency=8, max_active=5).run(workflow, instances=50)
+
+        assert result.journey.count == 50
+        assert peak[0] == 5
+        assert time.perf_counter() - started < 50 * 2 * 0.02 / 2
+
+    def test_pet_order_inventory_journey(self, api_client, id_allocator):
+        """Тест сценария питомец -> заказ -> инвентарь"""
+        result = WorkflowRunner(api_client).run(pet_order_workflow(id_allocator))
+
+        assert result.failed == 0, result.report()
+        assert result.steps["inventory_after"].histogram.count == 1
+
+    @pytest.mark.live
+    def test_many_journeys_in_parallel(self, make_api_client, id_allocator):
+        """Тест что сотни экземпляров сценария проходят параллельно без ошибок"""
+        client = make_api_client(pool_maxsize=16)
+        result = WorkflowRunner(client, concurrency=16).run(pet_order_workflow(id_allocator), instances=200)
+
+        assert result.failed == 0, result.report()
+        assert result.journey.count == 200
+        assert "end-to-end" in result.report()